@@ -1,5 +1,23 @@
 """분석 유틸리티 패키지."""
 
+from .adjust import adjust_close_panel
+from .backtest import parameter_grid, run_backtest, sweep
+from .indicators import compute_indicators, compute_panel_indicators, summarize_indicators
+from .streaming import IndicatorState, update_universe
 from .technical import compute_indicator_snapshot, prepare_price_frame
+from .universe import compute_universe_snapshot
 
-__all__ = ["compute_indicator_snapshot", "prepare_price_frame"]
+__all__ = [
+    "adjust_close_panel",
+    "compute_indicator_snapshot",
+    "prepare_price_frame",
+    "compute_universe_snapshot",
+    "IndicatorState",
+    "update_universe",
+    "compute_indicators",
+    "compute_panel_indicators",
+    "summarize_indicators",
+    "run_backtest",
+    "sweep",
+    "parameter_grid",
+]
@@ -0,0 +1,53 @@
+"""수정 전 종가 패널을 일간 등락률로 이어 붙여 액면분할·병합 등이 반영된 수정 종가로 바꾸는 유틸리티."""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def daily_returns(close: np.ndarray, changes: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    날짜×티커 종가 배열의 일간 수익률을 반환합니다. 거래하지 않은 칸과 첫 행은 0입니다.
+    changes(소수 단위 등락률)가 주어지면 그 값을 우선 쓰고, 없는 칸만 종가로 계산한 수익률로 채웁니다.
+    """
+    tradable = np.isfinite(close)
+    # 거래정지 뒤 첫날은 마지막 거래일 종가 대비 수익률로 계산합니다.
+    rows = np.where(tradable, np.arange(len(close))[:, None], 0)
+    last_traded = close[np.maximum.accumulate(rows, axis=0), np.arange(close.shape[1])]
+    derived = np.full(close.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derived[1:] = close[1:] / last_traded[:-1] - 1
+    if changes is not None:
+        derived = np.where(np.isfinite(changes), changes, derived)
+    return np.where(np.isfinite(derived) & tradable, derived, 0.0)
+
+
+def adjusted_close(close: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    """
+    일간 수익률을 누적해 수정 종가를 다시 만들고, 종목별 마지막 거래일 종가에 맞춰 눈금을 맞춥니다.
+    거래하지 않은 칸은 NaN입니다.
+    """
+    tradable = np.isfinite(close)
+    growth = np.cumprod(np.where(tradable, 1 + returns, 1.0), axis=0)
+    last = len(close) - 1 - np.argmax(tradable[::-1], axis=0)
+    columns = np.arange(close.shape[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = close[last, columns] / growth[last, columns]
+    return np.where(tradable, growth * scale, np.nan)
+
+
+def adjust_close_panel(close: pd.DataFrame, change_pct: pd.DataFrame) -> pd.DataFrame:
+    """
+    날짜×티커 종가 패널을 등락률(%) 패널로 이어 붙여 수정 종가 패널로 바꿉니다.
+    최근 종가는 그대로 두고 과거 가격만 비율로 맞추므로, 분할일에 가짜 급등락이 생기지 않습니다.
+    """
+    if close.empty or change_pct.empty:
+        return close
+    values = close.to_numpy(dtype=float)
+    changes = change_pct.reindex_like(close).to_numpy(dtype=float) / 100
+    adjusted = adjusted_close(values, daily_returns(values, changes))
+    return pd.DataFrame(adjusted, index=close.index, columns=close.columns)
+
+
+__all__ = ["adjust_close_panel", "adjusted_close", "daily_returns"]
@@ -0,0 +1,280 @@
+"""
+저장된 날짜×티커 패널 위에서 신호 기반 전략을 벡터화해 시뮬레이션하는 백테스트 엔진.
+
+- 신호(보유 여부)는 t일 종가로 정하고 t+1일 수익률부터 반영합니다. (미래 참조 없음)
+- 포트폴리오는 그날 가격이 있는 종목에 자금을 균등 배분해 매일 재조정한다고 가정하며,
+  보유하지 않은 몫은 현금(수익 0)입니다. 포지션 변화량 1단위마다 cost_bps만큼 비용을 뺍니다.
+- 모든 종목·날짜를 2차원 NumPy 배열 연산으로 한 번에 계산하고, 파라미터 조합은 프로세스 풀에 나눠 돌립니다.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .adjust import adjusted_close, daily_returns
+
+TRADING_DAYS = 252
+# 포지션 1단위 변경당 비용(bps). 매수·매도 수수료와 매도 거래세를 한 번 매매 기준으로 평균한 근사값입니다.
+DEFAULT_COST_BPS = 10.0
+
+
+class _Panel:
+    """종가 패널과 일간 수익률, 이동평균 계산용 누적합을 한 번만 만들어 두는 내부 컨테이너."""
+
+    def __init__(self, close: np.ndarray, returns: Optional[np.ndarray] = None):
+        self.tradable = np.isfinite(close)
+        # 등락률(액면분할 등 반영)을 우선 쓰고, 없는 칸만 종가로 계산한 수익률로 채웁니다.
+        self.returns = daily_returns(close, returns)
+        self.counts = self.tradable.sum(axis=1)
+        # 신호도 손익과 같은 수정 가격으로 계산해야 분할일에 가짜 신호가 나지 않습니다.
+        self.close = adjusted_close(close, self.returns) if returns is not None else close
+
+        zeros = np.zeros((1, close.shape[1]))
+        self._sums = np.vstack([zeros, np.cumsum(np.where(self.tradable, self.close, 0.0), axis=0)])
+        self._gaps = np.vstack([zeros, np.cumsum(~self.tradable, axis=0)])
+
+    def moving_average(self, window: int) -> np.ndarray:
+        # rolling(window).mean()과 같습니다. 구간에 결측이 있거나 이력이 짧으면 NaN.
+        out = np.full(self.close.shape, np.nan)
+        if 0 < window <= len(self.close):
+            tail = out[window - 1 :]
+            np.subtract(self._sums[window:], self._sums[:-window], out=tail)
+            tail /= window
+            tail[self._gaps[window:] != self._gaps[:-window]] = np.nan
+        return out
+
+    def lagged(self, periods: int) -> np.ndarray:
+        out = np.full(self.close.shape, np.nan)
+        if 0 < periods < len(self.close):
+            out[periods:] = self.close[:-periods]
+        return out
+
+
+def _ma_crossover(panel: _Panel, fast: int = 5, slow: int = 20) -> np.ndarray:
+    # prepare_price_frame의 MA{fast} > MA{slow}이면 보유합니다. (부동소수 오차 이내의 동률은 신호 없음)
+    fast, slow = int(fast), int(slow)
+    if not 0 < fast < slow:
+        raise ValueError("ma_crossover needs 0 < fast < slow")
+    fast_ma = panel.moving_average(fast)
+    slow_ma = panel.moving_average(slow)
+    with np.errstate(invalid="ignore"):
+        return fast_ma > slow_ma + np.abs(slow_ma) * 1e-12
+
+
+def _momentum(panel: _Panel, lookback: int = 60, threshold_pct: float = 0.0) -> np.ndarray:
+    # lookback일 수익률이 threshold_pct(%)를 넘으면 보유합니다.
+    lookback = int(lookback)
+    if lookback < 1:
+        raise ValueError("momentum needs lookback >= 1")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (panel.close / panel.lagged(lookback) - 1) * 100
+        return change > float(threshold_pct)
+
+
+# 전략 이름 → (패널, **파라미터) → 보유 여부 배열. 프로세스 풀 작업자는 이름으로 전략을 찾습니다.
+STRATEGIES: Dict[str, Callable[..., np.ndarray]] = {
+    "ma_crossover": _ma_crossover,
+    "momentum": _momentum,
+}
+
+
+def _strategy(name: str) -> Callable[..., np.ndarray]:
+    try:
+        return STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown strategy: {name}") from None
+
+
+def _simulate(panel: _Panel, positions: np.ndarray, cost_rate: float) -> Dict[str, np.ndarray]:
+    positions = (positions != 0) & panel.tradable
+    held = np.zeros_like(positions)
+    held[1:] = positions[:-1]
+    steps = np.diff(positions.view(np.int8), axis=0, prepend=np.int8(0))
+    changes = steps != 0
+    ticker_returns = np.where(held, panel.returns, 0.0)
+    ticker_returns -= changes * cost_rate
+
+    divisor = np.maximum(panel.counts, 1)
+    active = panel.counts > 0
+    return {
+        "daily": np.where(active, ticker_returns.sum(axis=1) / divisor, 0.0),
+        "ticker_returns": ticker_returns,
+        "exposure": np.where(active, held.sum(axis=1) / divisor, 0.0),
+        "turnover": changes.sum(axis=1) / divisor,
+        "entries": steps > 0,
+        "held": held,
+    }
+
+
+def _summarize(simulation: Mapping[str, np.ndarray]) -> Dict[str, float]:
+    daily = simulation["daily"]
+    if len(daily) == 0:
+        return {}
+    equity = np.cumprod(1 + daily)
+    total_return = equity[-1] - 1
+    years = len(daily) / TRADING_DAYS
+    volatility = daily.std(ddof=1) if len(daily) > 1 else 0.0
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+    cagr = equity[-1] ** (1 / years) - 1 if equity[-1] > 0 else -1.0
+    return {
+        "total_return_pct": float(total_return * 100),
+        "cagr_pct": float(cagr * 100),
+        "volatility_pct": float(volatility * np.sqrt(TRADING_DAYS) * 100),
+        "sharpe": float(daily.mean() / volatility * np.sqrt(TRADING_DAYS)) if volatility > 0 else 0.0,
+        "max_drawdown_pct": float(drawdown.min() * 100),
+        "exposure_pct": float(simulation["exposure"].mean() * 100),
+        "turnover_annual": float(simulation["turnover"].mean() * TRADING_DAYS),
+        "trades": float(simulation["entries"].sum()),
+    }
+
+
+def _as_arrays(close: pd.DataFrame, returns: Optional[pd.DataFrame]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    close = close.sort_index()
+    prices = close.to_numpy(dtype=np.float64, na_value=np.nan)
+    if returns is None or returns.empty:
+        return prices, None
+    aligned = returns.reindex(index=close.index, columns=close.columns)
+    return prices, aligned.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """
+    strategy/params: 실행한 전략과 파라미터, stats: 포트폴리오 성과 요약,
+    equity: 포트폴리오 자산 곡선(시작 1.0), daily_returns: 일간 수익률, per_ticker: 종목별 누적 수익률·매매 횟수·보유 비중
+    """
+
+    strategy: str
+    params: Dict[str, Any]
+    stats: Dict[str, float]
+    equity: pd.Series
+    daily_returns: pd.Series
+    per_ticker: pd.DataFrame
+
+
+def strategy_positions(
+    close: pd.DataFrame, strategy: str = "ma_crossover", returns: Optional[pd.DataFrame] = None, **params: Any
+) -> pd.DataFrame:
+    """
+    전략의 날짜×티커 보유 여부(불리언) 패널을 반환합니다. returns를 주면 그 수익률로 수정한 종가로 신호를 만듭니다.
+    """
+    close = close.sort_index()
+    panel = _Panel(*_as_arrays(close, returns))
+    return pd.DataFrame(_strategy(strategy)(panel, **params), index=close.index, columns=close.columns)
+
+
+def run_backtest(
+    close: pd.DataFrame,
+    strategy: str = "ma_crossover",
+    params: Optional[Mapping[str, Any]] = None,
+    returns: Optional[pd.DataFrame] = None,
+    cost_bps: float = DEFAULT_COST_BPS,
+) -> BacktestResult:
+    """
+    종가 패널(날짜×티커) 전체에 전략 하나를 적용해 포트폴리오 손익을 계산합니다.
+    returns(일간 수익률 패널, 소수)를 주면 손익과 신호 모두 그 수익률로 수정한 가격으로 계산합니다. (액면분할 등 보정용)
+    """
+    params = dict(params or {})
+    close = close.sort_index()
+    prices, changes = _as_arrays(close, returns)
+    panel = _Panel(prices, changes)
+    simulation = _simulate(panel, _strategy(strategy)(panel, **params), cost_bps / 10_000)
+
+    daily = pd.Series(simulation["daily"], index=close.index, name="daily_return")
+    per_ticker = pd.DataFrame(
+        {
+            "total_return_pct": (np.prod(1 + simulation["ticker_returns"], axis=0) - 1) * 100,
+            "trades": simulation["entries"].sum(axis=0),
+            "exposure_pct": simulation["held"].mean(axis=0) * 100,
+        },
+        index=close.columns.astype(str),
+    )
+    per_ticker.index.name = "티커"
+    return BacktestResult(
+        strategy=strategy,
+        params=params,
+        stats=_summarize(simulation),
+        equity=(1 + daily).cumprod().rename("equity"),
+        daily_returns=daily,
+        per_ticker=per_ticker,
+    )
+
+
+def parameter_grid(**axes: Iterable[Any]) -> List[Dict[str, Any]]:
+    """parameter_grid(fast=[5, 10], slow=[20, 60]) → 모든 조합의 파라미터 딕셔너리 목록."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(list(axes[name]) for name in names))]
+
+
+# 프로세스 풀 작업자마다 한 번만 만드는 패널 (작업 하나에는 파라미터만 전달합니다)
+_WORKER_PANEL: Optional[_Panel] = None
+
+
+def _init_worker(prices: np.ndarray, changes: Optional[np.ndarray]) -> None:
+    global _WORKER_PANEL
+    _WORKER_PANEL = _Panel(prices, changes)
+
+
+def _evaluate(panel: _Panel, strategy: str, params: Dict[str, Any], cost_rate: float) -> Optional[Dict[str, Any]]:
+    try:
+        positions = _strategy(strategy)(panel, **params)
+    except ValueError:
+        # fast >= slow처럼 성립하지 않는 조합은 건너뜁니다.
+        return None
+    return {**params, **_summarize(_simulate(panel, positions, cost_rate))}
+
+
+def _evaluate_in_worker(task: Tuple[str, Dict[str, Any], float]) -> Optional[Dict[str, Any]]:
+    strategy, params, cost_rate = task
+    return _evaluate(_WORKER_PANEL, strategy, params, cost_rate)
+
+
+def sweep(
+    close: pd.DataFrame,
+    grid: Sequence[Mapping[str, Any]],
+    strategy: str = "ma_crossover",
+    returns: Optional[pd.DataFrame] = None,
+    cost_bps: float = DEFAULT_COST_BPS,
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    파라미터 조합마다 run_backtest와 같은 시뮬레이션을 돌려 성과 표(조합당 한 행, 샤프 비율 내림차순)를 반환합니다.
+
+    processes가 2 이상이면(기본: CPU 수) 조합을 프로세스 풀에 나눠 계산합니다. 패널은 작업자마다 한 번만
+    넘기므로 조합이 많아도 전송 비용이 늘지 않습니다. 성립하지 않는 조합(fast >= slow 등)은 결과에서 빠집니다.
+    """
+    _strategy(strategy)
+    tasks = [(strategy, dict(params), cost_bps / 10_000) for params in grid]
+    if not tasks or close.empty:
+        return pd.DataFrame()
+    prices, changes = _as_arrays(close, returns)
+
+    workers = min(processes or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        panel = _Panel(prices, changes)
+        rows = [_evaluate(panel, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(prices, changes)) as executor:
+            rows = list(executor.map(_evaluate_in_worker, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+    results = pd.DataFrame([row for row in rows if row is not None])
+    if results.empty:
+        return results
+    return results.sort_values("sharpe", ascending=False, kind="stable").reset_index(drop=True)
+
+
+__all__ = [
+    "BacktestResult",
+    "DEFAULT_COST_BPS",
+    "STRATEGIES",
+    "TRADING_DAYS",
+    "parameter_grid",
+    "run_backtest",
+    "strategy_positions",
+    "sweep",
+]
@@ -0,0 +1,257 @@
+"""
+단일 시계열과 날짜×티커 패널에 모두 쓸 수 있는 벡터화 기술적 지표.
+
+모든 함수는 Series를 넣으면 Series를, DataFrame(패널)을 넣으면 같은 모양의 DataFrame을 돌려줍니다.
+EMA·RSI·ATR은 첫 값을 단순평균으로 잡은 뒤 지수 평활하는 표준 정의(Wilder)를 따릅니다.
+"""
+
+from typing import Dict, Mapping, Optional, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+Frame = TypeVar("Frame", pd.Series, pd.DataFrame)
+
+# 이 열 수 이상인 패널은 EMA 점화식을 날짜 축으로 한 번에(열 벡터 단위로) 진행합니다.
+_WIDE_PANEL_COLUMNS = 32
+
+
+def _to_2d(values: Frame) -> np.ndarray:
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return array.reshape(len(array), -1)
+
+
+def _wrap(array: np.ndarray, like: Frame) -> Frame:
+    if isinstance(like, pd.Series):
+        return pd.Series(array[:, 0], index=like.index, name=like.name)
+    return pd.DataFrame(array, index=like.index, columns=like.columns)
+
+
+def _rolling(values: Frame, window: int, how: str) -> Frame:
+    # rolling(window).<how>()와 같습니다. (구간에 결측이 있으면 결측) 열 방향 반복 없이 슬라이딩 뷰로 계산합니다.
+    array = _to_2d(values)
+    out = np.full(array.shape, np.nan)
+    if len(array) >= window:
+        view = np.lib.stride_tricks.sliding_window_view(array, window, axis=0)
+        out[window - 1 :] = getattr(np, how)(view, axis=-1)
+    return _wrap(out, values)
+
+
+def _ewm_rows(array: np.ndarray, alpha: float) -> np.ndarray:
+    # adjust=False, ignore_na=True 지수 평활을 날짜 순으로 진행합니다. (열 전체를 한 번에 갱신)
+    out = np.empty_like(array)
+    previous = np.full(array.shape[1], np.nan)
+    for row_index, row in enumerate(array):
+        blended = alpha * row + (1 - alpha) * previous
+        previous = np.where(np.isnan(previous), row, np.where(np.isnan(row), previous, blended))
+        out[row_index] = previous
+    return out
+
+
+def _seeded_ewm(values: Frame, alpha: float, period: int) -> Frame:
+    # 종목별로 유효값이 period개 쌓인 지점에서 그 평균으로 시작해 이후는 지수 평활합니다. (앞쪽 결측·거래정지 허용)
+    array = _to_2d(values)
+    observed = np.cumsum(~np.isnan(array), axis=0)
+    seeds = np.nancumsum(array, axis=0) / period
+    seeded = np.where(observed > period, array, np.where(observed == period, seeds, np.nan))
+    if seeded.shape[1] >= _WIDE_PANEL_COLUMNS:
+        smoothed = _ewm_rows(seeded, alpha)
+    else:
+        smoothed = pd.DataFrame(seeded).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().to_numpy()
+    return _wrap(np.where(observed < period, np.nan, smoothed), values)
+
+
+def ema(values: Frame, span: int) -> Frame:
+    return _seeded_ewm(values, 2.0 / (span + 1), span)
+
+
+def sma(values: Frame, window: int) -> Frame:
+    return _rolling(values, window, "mean")
+
+
+def rsi(close: Frame, period: int = 14) -> Frame:
+    delta = close.diff()
+    avg_gain = _seeded_ewm(delta.clip(lower=0), 1.0 / period, period)
+    avg_loss = _seeded_ewm(-delta.clip(upper=0), 1.0 / period, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100 - 100 / (1 + avg_gain / avg_loss)
+    # 하락이 없으면 100, 변동이 전혀 없으면 50
+    value = value.mask((avg_loss == 0) & (avg_gain > 0), 100.0)
+    return value.mask((avg_loss == 0) & (avg_gain == 0), 50.0)
+
+
+def macd(close: Frame, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[Frame, Frame, Frame]:
+    """(MACD선, 시그널선, 히스토그램)"""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger_bands(close: Frame, window: int = 20, num_std: float = 2.0) -> Tuple[Frame, Frame, Frame, Frame]:
+    """(상단, 중심, 하단, %B) — 표준편차는 모표준편차(ddof=0)를 씁니다."""
+    middle = _rolling(close, window, "mean")
+    deviation = _rolling(close, window, "std") * num_std
+    upper = middle + deviation
+    lower = middle - deviation
+    width = (upper - lower).where(upper != lower)
+    return upper, middle, lower, (close - lower) / width
+
+
+def true_range(high: Frame, low: Frame, close: Frame) -> Frame:
+    previous = close.shift(1)
+    return np.maximum(np.maximum(high - low, (high - previous).abs()), (low - previous).abs())
+
+
+def atr(high: Frame, low: Frame, close: Frame, period: int = 14) -> Frame:
+    return _seeded_ewm(true_range(high, low, close), 1.0 / period, period)
+
+
+def obv(close: Frame, volume: Frame) -> Frame:
+    # 첫 봉은 0에서 시작합니다. 종가가 없는 날(상장 전·거래정지)은 결측입니다.
+    direction = np.sign(close.diff()).fillna(0)
+    return (direction * volume.fillna(0)).cumsum().where(close.notna())
+
+
+def stochastic(
+    high: Frame, low: Frame, close: Frame, k_period: int = 14, smooth_k: int = 3, d_period: int = 3
+) -> Tuple[Frame, Frame]:
+    """슬로우 스토캐스틱 (%K, %D). 기간 고저가 같으면(변동 없음) 결측입니다."""
+    lowest = _rolling(low, k_period, "min")
+    highest = _rolling(high, k_period, "max")
+    fast_k = 100 * (close - lowest) / (highest - lowest).where(highest != lowest)
+    slow_k = _rolling(fast_k, smooth_k, "mean") if smooth_k > 1 else fast_k
+    return slow_k, _rolling(slow_k, d_period, "mean")
+
+
+def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    OHLCV 일봉 데이터프레임에 EMA·RSI·MACD·볼린저 밴드·ATR·OBV·스토캐스틱 컬럼을 한 번에 추가해 반환합니다.
+    고가·저가·거래량 컬럼이 없으면 해당 지표는 건너뜁니다.
+    """
+    enriched = df.copy()
+    close = enriched["종가"].astype(float)
+    enriched["EMA12"] = ema12 = ema(close, 12)
+    enriched["EMA26"] = ema26 = ema(close, 26)
+    enriched["RSI14"] = rsi(close, 14)
+    enriched["MACD"] = line = ema12 - ema26
+    enriched["MACD_signal"] = signal_line = ema(line, 9)
+    enriched["MACD_hist"] = line - signal_line
+    upper, middle, lower, percent_b = bollinger_bands(close)
+    enriched["BB_upper"], enriched["BB_mid"], enriched["BB_lower"], enriched["BB_pctb"] = upper, middle, lower, percent_b
+    if {"고가", "저가"}.issubset(enriched.columns):
+        high = enriched["고가"].astype(float)
+        low = enriched["저가"].astype(float)
+        enriched["ATR14"] = atr(high, low, close, 14)
+        enriched["STOCH_K"], enriched["STOCH_D"] = stochastic(high, low, close)
+    if "거래량" in enriched.columns:
+        enriched["OBV"] = obv(close, enriched["거래량"].astype(float))
+    return enriched
+
+
+_SUMMARY_FIELDS = {
+    "EMA12": "ema_12",
+    "EMA26": "ema_26",
+    "RSI14": "rsi_14",
+    "MACD": "macd",
+    "MACD_signal": "macd_signal",
+    "MACD_hist": "macd_hist",
+    "BB_upper": "bb_upper",
+    "BB_lower": "bb_lower",
+    "BB_pctb": "bb_pctb",
+    "ATR14": "atr_14",
+    "OBV": "obv",
+    "STOCH_K": "stoch_k",
+    "STOCH_D": "stoch_d",
+}
+
+
+def summarize_indicators(enriched: pd.DataFrame) -> Dict[str, Optional[float]]:
+    """
+    compute_indicators 결과의 마지막 봉 값을 딕셔너리로 정리합니다. 계산되지 않은 값은 None입니다.
+    """
+    if enriched.empty:
+        return {}
+    latest = enriched.iloc[-1]
+    summary: Dict[str, Optional[float]] = {}
+    for column, key in _SUMMARY_FIELDS.items():
+        value = latest.get(column)
+        summary[key] = float(value) if value is not None and pd.notna(value) else None
+    close = float(latest["종가"])
+    atr_value = summary.get("atr_14")
+    summary["atr_pct"] = atr_value / close * 100 if atr_value is not None and close else None
+    return summary
+
+
+def describe_indicators(summary: Mapping[str, Optional[float]]) -> str:
+    """
+    지표 요약을 에이전트 프롬프트용 한 줄 문장으로 바꿉니다.
+    """
+    segments = []
+    for key, label, pattern in (
+        ("rsi_14", "RSI(14)", "{:.1f}"),
+        ("macd_hist", "MACD 히스토그램", "{:+,.2f}"),
+        ("bb_pctb", "볼린저 %B", "{:.2f}"),
+        ("atr_pct", "ATR(14)/종가", "{:.2f}%"),
+        ("stoch_k", "스토캐스틱 %K", "{:.1f}"),
+        ("stoch_d", "%D", "{:.1f}"),
+        ("ma_gap_20_pct", "20일선 괴리율", "{:+.2f}%"),
+        ("return_20_pct", "20일 수익률", "{:+.2f}%"),
+    ):
+        value = summary.get(key)
+        if value is not None and pd.notna(value):
+            segments.append(f"{label}: {pattern.format(value)}")
+    return ", ".join(segments) if segments else "기술적 지표를 확보하지 못했습니다."
+
+
+def compute_panel_indicators(
+    close: pd.DataFrame,
+    high: Optional[pd.DataFrame] = None,
+    low: Optional[pd.DataFrame] = None,
+    volume: Optional[pd.DataFrame] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    날짜×티커 패널 전체에 같은 지표를 한 번에 계산합니다. 반환값은 지표 이름 → 패널 딕셔너리입니다.
+    """
+    close = close.astype(float)
+    ema12 = ema(close, 12)
+    ema26 = ema(close, 26)
+    line = ema12 - ema26
+    signal_line = ema(line, 9)
+    upper, middle, lower, percent_b = bollinger_bands(close)
+    panels: Dict[str, pd.DataFrame] = {
+        "EMA12": ema12,
+        "EMA26": ema26,
+        "RSI14": rsi(close, 14),
+        "MACD": line,
+        "MACD_signal": signal_line,
+        "MACD_hist": line - signal_line,
+        "BB_upper": upper,
+        "BB_mid": middle,
+        "BB_lower": lower,
+        "BB_pctb": percent_b,
+    }
+    if high is not None and low is not None:
+        high = high.reindex_like(close).astype(float)
+        low = low.reindex_like(close).astype(float)
+        panels["ATR14"] = atr(high, low, close, 14)
+        panels["STOCH_K"], panels["STOCH_D"] = stochastic(high, low, close)
+    if volume is not None:
+        panels["OBV"] = obv(close, volume.reindex_like(close).astype(float))
+    return panels
+
+
+__all__ = [
+    "ema",
+    "sma",
+    "rsi",
+    "macd",
+    "bollinger_bands",
+    "true_range",
+    "atr",
+    "obv",
+    "stochastic",
+    "compute_indicators",
+    "compute_panel_indicators",
+    "summarize_indicators",
+    "describe_indicators",
+]
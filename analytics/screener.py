@@ -0,0 +1,278 @@
+"""
+전 종목 지표·재무 컬럼 표에 대한 스크리너.
+
+필터 식(예: ``ma_gap_20_pct > 5 and volume_gap_pct > 100 and PER < 10``)은 파이썬 식 문법의 부분집합으로,
+한 번 파싱해 컬럼 단위 불리언 마스크를 만드는 함수로 컴파일됩니다. 허용 문법:
+
+- 비교: ``<, <=, >, >=, ==, !=`` (연쇄 비교 ``0 < PER < 10`` 포함), ``in`` / ``not in`` (목록)
+- 논리: ``and, or, not`` (``&, |, ~``도 허용)
+- 산술: ``+, -, *, /, %, **``, 단항 ``-``
+- 피연산자: 컬럼 이름(식별자), 숫자·문자열 상수
+
+결측값과의 비교는 거짓입니다.
+"""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+Compiled = Callable[[pd.DataFrame], Any]
+
+_MAX_EXPRESSION_LENGTH = 2_000
+
+_COMPARE_OPS = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+_ARITHMETIC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+
+class FilterSyntaxError(ValueError):
+    """필터 식을 해석할 수 없거나 없는 컬럼을 참조할 때 발생합니다."""
+
+
+def _column(table: pd.DataFrame, name: str) -> np.ndarray:
+    try:
+        series = table[name]
+    except KeyError:
+        raise FilterSyntaxError(f"Unknown field: {name}") from None
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=bool, na_value=False)
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy(dtype=object)
+
+
+def _missing(value: Any) -> Any:
+    array = np.asarray(value)
+    return np.isnan(array) if array.dtype.kind == "f" else pd.isna(array)
+
+
+def _as_mask(value: Any, table: pd.DataFrame) -> np.ndarray:
+    mask = np.asarray(value)
+    if mask.dtype != bool:
+        raise FilterSyntaxError("Filter must evaluate to a condition")
+    return np.broadcast_to(mask, (len(table),))
+
+
+def _fold(node: ast.AST) -> Optional[np.float64]:
+    # 숫자 상수만으로 된 부분식을 컴파일 시점에 float64로 미리 계산합니다. (파이썬 정수의 무한 정밀도 연산 방지)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        try:
+            value = np.float64(float(node.value))
+        except OverflowError:
+            raise FilterSyntaxError("Constant is out of range") from None
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _fold(node.operand)
+        if value is None:
+            return None
+        value = -value if isinstance(node.op, ast.USub) else value
+    elif isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC_OPS:
+        left, right = _fold(node.left), _fold(node.right)
+        if left is None or right is None:
+            return None
+        with np.errstate(all="ignore"):
+            value = _ARITHMETIC_OPS[type(node.op)](left, right)
+    else:
+        return None
+    if not np.isfinite(value):
+        raise FilterSyntaxError("Constant expression is out of range")
+    return value
+
+
+def _compile(node: ast.AST) -> Compiled:
+    if isinstance(node, ast.Expression):
+        return _compile(node.body)
+
+    folded = _fold(node)
+    if folded is not None:
+        return lambda _table: folded
+
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile(value) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+
+        def _bool(table: pd.DataFrame) -> np.ndarray:
+            mask = _as_mask(parts[0](table), table)
+            for part in parts[1:]:
+                mask = combine(mask, _as_mask(part(table), table))
+            return mask
+
+        return _bool
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile(node.operand)
+        if isinstance(node.op, (ast.Not, ast.Invert)):
+            return lambda table: ~_as_mask(operand(table), table)
+        if isinstance(node.op, ast.USub):
+            return lambda table: -operand(table)
+        if isinstance(node.op, ast.UAdd):
+            return operand
+
+    if isinstance(node, ast.BinOp):
+        left, right = _compile(node.left), _compile(node.right)
+        if isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            combine = np.logical_and if isinstance(node.op, ast.BitAnd) else np.logical_or
+            return lambda table: combine(_as_mask(left(table), table), _as_mask(right(table), table))
+        arithmetic = _ARITHMETIC_OPS.get(type(node.op))
+        if arithmetic is not None:
+
+            def _arithmetic(table: pd.DataFrame) -> Any:
+                try:
+                    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                        return arithmetic(left(table), right(table))
+                except TypeError:
+                    raise FilterSyntaxError("Arithmetic needs numeric fields") from None
+
+            return _arithmetic
+
+    if isinstance(node, ast.Compare):
+        operands = [_compile(node.left)] + [_compile(item) for item in node.comparators]
+        steps = []
+        for index, op in enumerate(node.ops):
+            if isinstance(op, (ast.In, ast.NotIn)):
+                steps.append((index, op, None))
+            elif type(op) in _COMPARE_OPS:
+                steps.append((index, op, _COMPARE_OPS[type(op)]))
+            else:
+                raise FilterSyntaxError(f"Unsupported comparison: {type(op).__name__}")
+
+        def _compare(table: pd.DataFrame) -> np.ndarray:
+            values = [operand(table) for operand in operands]
+            mask = np.ones(len(table), dtype=bool)
+            for index, op, compare in steps:
+                left, right = values[index], values[index + 1]
+                if compare is None:
+                    member = np.isin(left, np.asarray(right, dtype=object))
+                    mask &= ~member if isinstance(op, ast.NotIn) else member
+                else:
+                    try:
+                        with np.errstate(invalid="ignore"):
+                            mask &= _as_mask(compare(left, right), table)
+                        if isinstance(op, ast.NotEq):
+                            # 넘파이에서 NaN != x는 참이지만, 결측값과의 비교는 모두 거짓으로 맞춥니다.
+                            mask &= ~np.broadcast_to(_missing(left) | _missing(right), mask.shape)
+                    except TypeError:
+                        raise FilterSyntaxError("Cannot compare text and number fields") from None
+            return mask
+
+        return _compare
+
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda table: _column(table, name)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str)) and not isinstance(node.value, bool):
+        value = node.value
+        return lambda _table: value
+
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = []
+        for element in node.elts:
+            if not isinstance(element, ast.Constant) or isinstance(element.value, bool):
+                raise FilterSyntaxError("List items must be constants")
+            items.append(element.value)
+        return lambda _table: items
+
+    raise FilterSyntaxError(f"Unsupported expression: {type(node).__name__}")
+
+
+@lru_cache(maxsize=256)
+def compile_filter(expression: str) -> Compiled:
+    """
+    필터 식을 (표 → 불리언 마스크) 함수로 컴파일합니다. 같은 식은 다시 파싱하지 않습니다.
+    """
+    if len(expression) > _MAX_EXPRESSION_LENGTH:
+        raise FilterSyntaxError("Filter expression is too long")
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise FilterSyntaxError(f"Invalid filter: {exc.msg}") from None
+    compiled = _compile(tree)
+    return lambda table: _as_mask(compiled(table), table)
+
+
+def referenced_fields(expression: str) -> List[str]:
+    """필터 식이 참조하는 컬럼 이름 목록 (등장 순서)."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise FilterSyntaxError(f"Invalid filter: {exc.msg}") from None
+    return list(dict.fromkeys(node.id for node in ast.walk(tree) if isinstance(node, ast.Name)))
+
+
+def top_k_positions(values: np.ndarray, count: int, ascending: bool = False) -> np.ndarray:
+    """
+    상위 count개 위치만 부분 선택(argpartition)한 뒤 그 안에서만 정렬해 반환합니다. 결측값은 항상 뒤로 보냅니다.
+    """
+    keys = values.astype(np.float64) if ascending else -values.astype(np.float64)
+    keys = np.where(np.isnan(keys), np.inf, keys)
+    if count <= 0:
+        return np.empty(0, dtype=np.intp)
+    if count < len(keys):
+        candidates = np.argpartition(keys, count - 1)[:count]
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind="stable")]
+
+
+def screen(
+    table: pd.DataFrame,
+    expression: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    limit: Optional[int] = 50,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    필터 식에 맞는 행을 골라 sort_by 기준 상위 limit개(top-k)를 반환합니다.
+    expression이 비어 있으면 전체 표를, sort_by가 없으면 원래 순서를 씁니다.
+    columns를 주면 해당 컬럼(및 참조·정렬 컬럼)만 남깁니다.
+    """
+    rows = table
+    if expression and expression.strip():
+        rows = table[compile_filter(expression.strip())(table)]
+
+    count = len(rows) if limit is None else max(0, min(int(limit), len(rows)))
+    if sort_by:
+        if sort_by not in rows.columns:
+            raise FilterSyntaxError(f"Unknown field: {sort_by}")
+        values = _column(rows, sort_by)
+        if values.dtype == object:
+            rows = rows.sort_values(sort_by, ascending=ascending, na_position="last", kind="stable").iloc[:count]
+        else:
+            rows = rows.iloc[top_k_positions(values, count, ascending)]
+    else:
+        rows = rows.iloc[:count]
+
+    if columns:
+        keep = list(columns)
+        for extra in ([sort_by] if sort_by else []) + (referenced_fields(expression) if expression else []):
+            if extra not in keep and extra in rows.columns:
+                keep.append(extra)
+        rows = rows[[column for column in keep if column in rows.columns]]
+    return rows
+
+
+__all__ = [
+    "FilterSyntaxError",
+    "compile_filter",
+    "referenced_fields",
+    "screen",
+    "top_k_positions",
+]
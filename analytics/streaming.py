@@ -0,0 +1,211 @@
+"""새 일봉이 들어올 때마다 봉당 O(1)로 갱신하는 종목별 증분 지표 상태."""
+
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, MutableMapping, Optional, Tuple
+
+import pandas as pd
+
+from .universe import HIGH_LOW_WINDOW
+
+# 부동소수점 누적 오차를 없애기 위해 이동합을 다시 계산하는 주기(봉 수)
+_RESYNC_INTERVAL = 1_000
+
+
+def _safe_pct(base: float, comparison: float) -> float:
+    return (comparison / base - 1) * 100 if base else 0.0
+
+
+class IndicatorState:
+    """
+    한 종목의 스트리밍 지표 상태.
+
+    이동평균(MA5/20/60)과 거래량MA20은 이동합으로, 52주 고저는 단조 덱(monotonic deque)으로 유지하므로
+    update 한 번의 비용이 이력 길이와 무관합니다. snapshot()은 compute_indicator_snapshot과 같은 키를 반환하고,
+    to_dict()/from_dict()로 JSON 직렬화할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        ma_windows: Tuple[int, ...] = (5, 20, 60),
+        volume_window: int = 20,
+        return_windows: Tuple[int, ...] = (5, 20, 60),
+        high_low_window: int = HIGH_LOW_WINDOW,
+    ):
+        if min(ma_windows + return_windows + (volume_window, high_low_window)) < 1:
+            raise ValueError("windows must be positive")
+        self.ma_windows = tuple(int(window) for window in ma_windows)
+        self.volume_window = int(volume_window)
+        self.return_windows = tuple(int(window) for window in return_windows)
+        self.high_low_window = int(high_low_window)
+        self.count = 0
+        self.last_date: Optional[str] = None
+        self._closes: Deque[float] = deque(maxlen=max(max(self.ma_windows), max(self.return_windows) + 1))
+        self._volumes: Deque[float] = deque(maxlen=self.volume_window)
+        self._close_sums: Dict[int, float] = {window: 0.0 for window in self.ma_windows}
+        self._volume_sum = 0.0
+        # (봉 번호, 값) — 최댓값 덱은 값이 감소하는 순서, 최솟값 덱은 증가하는 순서를 유지합니다.
+        self._highs: Deque[Tuple[int, float]] = deque()
+        self._lows: Deque[Tuple[int, float]] = deque()
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def update(self, close: float, volume: float, date: Optional[Any] = None) -> bool:
+        """
+        일봉 하나를 반영합니다. date가 마지막으로 반영한 날짜 이하이면(재전송) 무시하고 False를 반환합니다.
+        """
+        key = pd.Timestamp(date).strftime("%Y%m%d") if date is not None else None
+        if key is not None and self.last_date is not None and key <= self.last_date:
+            return False
+        close = float(close)
+        volume = float(volume)
+
+        for window in self.ma_windows:
+            self._close_sums[window] += close
+            if len(self._closes) >= window:
+                self._close_sums[window] -= self._closes[-window]
+        self._closes.append(close)
+
+        self._volume_sum += volume
+        if len(self._volumes) == self.volume_window:
+            self._volume_sum -= self._volumes[0]
+        self._volumes.append(volume)
+
+        position = self.count
+        while self._highs and self._highs[-1][1] <= close:
+            self._highs.pop()
+        self._highs.append((position, close))
+        while self._lows and self._lows[-1][1] >= close:
+            self._lows.pop()
+        self._lows.append((position, close))
+        expired = position - self.high_low_window
+        while self._highs[0][0] <= expired:
+            self._highs.popleft()
+        while self._lows[0][0] <= expired:
+            self._lows.popleft()
+
+        self.count += 1
+        if key is not None:
+            self.last_date = key
+        if self.count % _RESYNC_INTERVAL == 0:
+            self._resync()
+        return True
+
+    def _resync(self) -> None:
+        closes = list(self._closes)
+        for window in self.ma_windows:
+            self._close_sums[window] = float(sum(closes[-window:]))
+        self._volume_sum = float(sum(self._volumes))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **kwargs: Any) -> "IndicatorState":
+        """
+        종가·거래량 컬럼이 있는 일봉 데이터프레임으로 상태를 초기화합니다. (최초 한 번만 이력 전체를 훑습니다)
+        """
+        state = cls(**kwargs)
+        for date, close, volume in zip(df.index, df["종가"].to_numpy(), df["거래량"].to_numpy()):
+            state.update(close, volume, date if isinstance(date, (pd.Timestamp, str)) else None)
+        return state
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def moving_average(self, window: int) -> float:
+        if window not in self._close_sums:
+            raise KeyError(f"MA{window} is not tracked")
+        return self._close_sums[window] / window if self.count >= window else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        if self.count == 0:
+            return {}
+        close = self._closes[-1]
+        volume = self._volumes[-1]
+        volume_avg = self._volume_sum / self.volume_window if self.count >= self.volume_window else 0.0
+        high = self._highs[0][1]
+        low = self._lows[0][1]
+        snapshot = {
+            "close": close,
+            "volume": volume,
+            f"volume_avg{self.volume_window}": volume_avg,
+            "volume_gap_pct": _safe_pct(volume_avg, volume),
+            "high_52": high,
+            "low_52": low,
+            "distance_high_pct": _safe_pct(high, close),
+            "distance_low_pct": _safe_pct(low, close),
+        }
+        for window in self.ma_windows:
+            ma = self.moving_average(window)
+            snapshot[f"ma_{window}"] = ma
+            snapshot[f"ma_gap_{window}_pct"] = _safe_pct(ma, close)
+        for window in self.return_windows:
+            base = self._closes[-(window + 1)] if self.count > window else 0.0
+            snapshot[f"return_{window}_pct"] = _safe_pct(base, close)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ma_windows": list(self.ma_windows),
+            "volume_window": self.volume_window,
+            "return_windows": list(self.return_windows),
+            "high_low_window": self.high_low_window,
+            "count": self.count,
+            "last_date": self.last_date,
+            "closes": list(self._closes),
+            "volumes": list(self._volumes),
+            "highs": [list(item) for item in self._highs],
+            "lows": [list(item) for item in self._lows],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "IndicatorState":
+        state = cls(
+            ma_windows=tuple(payload["ma_windows"]),
+            volume_window=payload["volume_window"],
+            return_windows=tuple(payload["return_windows"]),
+            high_low_window=payload["high_low_window"],
+        )
+        state.count = int(payload["count"])
+        state.last_date = payload.get("last_date")
+        state._closes.extend(float(value) for value in payload["closes"])
+        state._volumes.extend(float(value) for value in payload["volumes"])
+        state._highs.extend((int(position), float(value)) for position, value in payload["highs"])
+        state._lows.extend((int(position), float(value)) for position, value in payload["lows"])
+        state._resync()
+        return state
+
+
+def update_universe(
+    states: MutableMapping[str, IndicatorState],
+    cross_section: pd.DataFrame,
+    date: Any,
+    **kwargs: Any,
+) -> int:
+    """
+    하루치 전 종목 단면(티커 인덱스, 종가·거래량 컬럼)을 종목별 상태에 반영합니다. 비용은 O(종목 수)이며,
+    처음 보는 티커는 새 상태를 만듭니다. 실제로 갱신된 종목 수를 반환합니다.
+    """
+    updated = 0
+    for ticker, close, volume in zip(
+        cross_section.index.astype(str), cross_section["종가"].to_numpy(), cross_section["거래량"].to_numpy()
+    ):
+        if pd.isna(close):
+            continue
+        state = states.get(ticker)
+        if state is None:
+            state = states[ticker] = IndicatorState(**kwargs)
+        updated += state.update(close, 0.0 if pd.isna(volume) else volume, date)
+    return updated
+
+
+def dump_states(states: Mapping[str, IndicatorState]) -> Dict[str, Dict[str, Any]]:
+    return {ticker: state.to_dict() for ticker, state in states.items()}
+
+
+def load_states(payload: Mapping[str, Mapping[str, Any]]) -> Dict[str, IndicatorState]:
+    return {ticker: IndicatorState.from_dict(item) for ticker, item in payload.items()}
+
+
+__all__ = ["IndicatorState", "update_universe", "dump_states", "load_states"]
@@ -0,0 +1,91 @@
+"""날짜×티커 패널 전체에 대한 기술적 지표 스냅샷을 한 번에 계산하는 벡터화 엔진."""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 52주 고저 계산에 쓰는 거래일 수
+HIGH_LOW_WINDOW = 252
+
+
+def _safe_pct(base: np.ndarray, comparison: np.ndarray) -> np.ndarray:
+    # technical._safe_pct와 같은 규칙: 기준값이 0이거나 없으면 0.0
+    valid = np.isfinite(base) & (base != 0) & np.isfinite(comparison)
+    out = np.zeros(np.broadcast(base, comparison).shape, dtype=np.float64)
+    np.divide(comparison, base, out=out, where=valid)
+    return np.where(valid, (out - 1.0) * 100.0, 0.0)
+
+
+def _tail_mean(values: np.ndarray, window: int) -> np.ndarray:
+    # rolling(window).mean()의 마지막 값과 같습니다. 구간에 결측이 있거나 이력이 짧으면 NaN.
+    if window < 1 or len(values) < window:
+        return np.full(values.shape[1], np.nan)
+    return values[-window:].mean(axis=0)
+
+
+def _masked_extreme(values: np.ndarray, use_max: bool) -> np.ndarray:
+    fill = -np.inf if use_max else np.inf
+    filled = np.where(np.isnan(values), fill, values)
+    extreme = filled.max(axis=0) if use_max else filled.min(axis=0)
+    return np.where(np.isinf(extreme), np.nan, extreme)
+
+
+def compute_universe_snapshot(
+    close: pd.DataFrame,
+    volume: Optional[pd.DataFrame] = None,
+    ma_windows: Tuple[int, ...] = (5, 20, 60),
+    return_windows: Tuple[int, ...] = (5, 20, 60),
+    high_low_window: int = HIGH_LOW_WINDOW,
+) -> pd.DataFrame:
+    """
+    종가(및 거래량) 패널(날짜×티커)에서 모든 종목의 지표 스냅샷을 한 번에 계산해 티커×지표 표로 반환합니다.
+
+    컬럼 이름과 계산 규칙은 compute_indicator_snapshot과 같으며(이동평균·거래량 평균은 창 안에 결측이 있으면 0.0),
+    마지막 날짜에 종가가 없는 종목(거래정지·상장폐지)은 제외합니다.
+    """
+    if close.empty:
+        return pd.DataFrame()
+
+    close = close.sort_index()
+    tail = max(max(ma_windows, default=1), max(return_windows, default=0) + 1, high_low_window, 20)
+    prices = close.iloc[-tail:].to_numpy(dtype=np.float64, na_value=np.nan)
+    latest = prices[-1]
+
+    columns: Dict[str, np.ndarray] = {"close": latest}
+    if volume is not None and not volume.empty:
+        volumes = (
+            volume.reindex(index=close.index[-tail:], columns=close.columns)
+            .to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        latest_volume = volumes[-1]
+        volume_avg20 = np.nan_to_num(_tail_mean(volumes, 20), nan=0.0)
+        columns["volume"] = latest_volume
+        columns["volume_avg20"] = volume_avg20
+        columns["volume_gap_pct"] = _safe_pct(volume_avg20, latest_volume)
+
+    window_prices = prices[-high_low_window:]
+    high = _masked_extreme(window_prices, use_max=True)
+    low = _masked_extreme(window_prices, use_max=False)
+    columns["high_52"] = high
+    columns["low_52"] = low
+    columns["distance_high_pct"] = _safe_pct(high, latest)
+    columns["distance_low_pct"] = _safe_pct(low, latest)
+
+    for window in ma_windows:
+        ma = np.nan_to_num(_tail_mean(prices, window), nan=0.0)
+        columns[f"ma_{window}"] = ma
+        columns[f"ma_gap_{window}_pct"] = _safe_pct(ma, latest)
+
+    for window in return_windows:
+        if len(prices) > window:
+            columns[f"return_{window}_pct"] = _safe_pct(prices[-(window + 1)], latest)
+        else:
+            columns[f"return_{window}_pct"] = np.zeros_like(latest)
+
+    snapshot = pd.DataFrame(columns, index=close.columns.astype(str))
+    snapshot.index.name = "티커"
+    return snapshot[np.isfinite(latest)]
+
+
+__all__ = ["compute_universe_snapshot", "HIGH_LOW_WINDOW"]
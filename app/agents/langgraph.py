@@ -3,7 +3,7 @@
 import logging
 import os
 import tempfile
-from typing import List, Tuple, TypedDict
+from typing import List, Optional, Tuple, TypedDict
 
 from dotenv import load_dotenv
 from langchain.chains import create_retrieval_chain
@@ -15,6 +15,7 @@ from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain_openai import OpenAIEmbeddings
 from langgraph.graph import END, StateGraph
 
+from analytics.indicators import describe_indicators
 from app.services import data_fetcher
 from app.utils import LLMUnavailableError, get_shared_llm, invoke_prompt_safely
 
@@ -27,6 +28,7 @@ class AgentState(TypedDict):
     stock_name: str
     ticker: str
     ratios: dict
+    technicals: dict
     initial_analysis: str
     classification: str  # "positive", "negative", "neutral"
     news: List[dict]
@@ -101,11 +103,12 @@ def initial_analysis_node(state: AgentState):
     stock_name = state["stock_name"]
     ratios = state.get("ratios") or {}
     ratios_str = _build_ratio_prompt(ratios)
+    technicals_str = describe_indicators(state.get("technicals") or {})
 
     prompt = PromptTemplate.from_template(
         """당신은 전문 애널리스트입니다. '{stock_name}' 기업의 개요와 다음 재무 지표를 분석해주세요.
         - 기업의 주요 사업, 주력 제품 설명
-        - 재무 지표({ratios_str})를 해석하고, 이를 바탕으로 기업의 현재 상태를 'positive', 'negative', 'neutral' 중 하나로 분류해주세요.
+        - 재무 지표({ratios_str})와 기술적 지표({technicals_str})를 해석하고, 이를 바탕으로 기업의 현재 상태를 'positive', 'negative', 'neutral' 중 하나로 분류해주세요.
         - 분류에 대한 이유를 간략하게 설명해주세요.
         
         출력 형식은 "분류: [positive/negative/neutral]\n설명: [분석 내용]" 이어야 합니다.
@@ -113,7 +116,7 @@ def initial_analysis_node(state: AgentState):
     )
     response = invoke_prompt_safely(
         prompt,
-        {"stock_name": stock_name, "ratios_str": ratios_str},
+        {"stock_name": stock_name, "ratios_str": ratios_str, "technicals_str": technicals_str},
         fallback_message="분류: neutral\n설명: LLM 분석 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
         log_context="initial_analysis_node",
     )
@@ -201,8 +204,11 @@ def route_by_classification(state: AgentState):
     return "search_general_news"
 
 
-def run_analysis_agent(stock_name: str, ticker: str, ratios: dict):
-    """LangGraph Agent를 실행하여 종합 분석 보고서를 생성합니다."""
+def run_analysis_agent(stock_name: str, ticker: str, ratios: dict, technicals: Optional[dict] = None):
+    """
+    LangGraph Agent를 실행하여 종합 분석 보고서를 생성합니다.
+    technicals를 생략하면 캐시된 종목 지표 요약(data_fetcher.get_technical_summary)을 사용합니다.
+    """
     workflow = StateGraph(AgentState)
 
     workflow.add_node("initial_analysis", initial_analysis_node)
@@ -234,6 +240,7 @@ def run_analysis_agent(stock_name: str, ticker: str, ratios: dict):
         "stock_name": stock_name,
         "ticker": ticker,
         "ratios": ratios or {},
+        "technicals": dict(technicals) if technicals is not None else data_fetcher.get_technical_summary(stock_name),
     }
     final_state = app.invoke(initial_state)
 
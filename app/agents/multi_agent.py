@@ -7,6 +7,7 @@ from typing import Dict, List, Optional, TypedDict
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate
 
+from analytics.indicators import describe_indicators
 from app.services import data_fetcher
 from app.utils import invoke_prompt_safely
 
@@ -15,6 +16,7 @@ class MultiAgentResult(TypedDict):
     stock_name: str
     ticker: Optional[str]
     ratios: Dict[str, float]
+    technicals: Dict[str, Optional[float]]
     fundamentals: str
     news_items: List[Dict[str, str]]
     news_summary: str
@@ -106,9 +108,9 @@ def _news_agent(stock_name: str, news_items: List[Dict[str, str]]) -> str:
     )
 
 
-def _risk_agent(stock_name: str, fundamental: str, news_summary: str) -> str:
+def _risk_agent(stock_name: str, fundamental: str, news_summary: str, technical_context: str) -> str:
     prompt = ChatPromptTemplate.from_template(
-        """당신은 리스크 매니저입니다. 다음 두 에이전트의 보고서를 검토하고 위험 요인을 식별하세요.
+        """당신은 리스크 매니저입니다. 다음 두 에이전트의 보고서와 기술적 지표를 검토하고 위험 요인을 식별하세요.
 
 펀더멘털 분석:
 {fundamental}
@@ -116,6 +118,9 @@ def _risk_agent(stock_name: str, fundamental: str, news_summary: str) -> str:
 뉴스 분석:
 {news_summary}
 
+기술적 지표:
+{technical_context}
+
 요구사항:
 - 단기(1개월), 중기(3~6개월) 관점에서의 주요 리스크를 bullet로 정리하세요.
 - 각 리스크의 발생 가능성을 High/Medium/Low 로 표기하세요.
@@ -128,6 +133,7 @@ def _risk_agent(stock_name: str, fundamental: str, news_summary: str) -> str:
             "stock_name": stock_name,
             "fundamental": fundamental,
             "news_summary": news_summary,
+            "technical_context": technical_context,
         },
         fallback_message="리스크 보고서를 준비하지 못했습니다.",
         log_context="risk_agent",
@@ -187,7 +193,9 @@ def run_multi_agent_analysis(
     news_items = data_fetcher.search_news(stock_name)
     news_summary = _news_agent(stock_name, news_items)
 
-    risk_report = _risk_agent(stock_name, fundamental_report, news_summary)
+    # 지표 요약은 종목별로 캐시되어 있어 화면·API 호출과 계산을 공유합니다.
+    technicals = data_fetcher.get_technical_summary(stock_name)
+    risk_report = _risk_agent(stock_name, fundamental_report, news_summary, describe_indicators(technicals))
 
     final_recommendation = _synthesis_agent(
         stock_name, fundamental_report, news_summary, risk_report
@@ -197,6 +205,7 @@ def run_multi_agent_analysis(
         stock_name=stock_name,
         ticker=ticker,
         ratios=ratios,
+        technicals=technicals,
         fundamentals=fundamental_report,
         news_items=news_items,
         news_summary=news_summary,
@@ -0,0 +1,136 @@
+"""외부 HTTP API 호출용 공용 비동기 클라이언트 (커넥션 풀, keep-alive, 비차단 재시도)."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from .circuit_breaker import CircuitBreaker
+from .rate_limit import RateLimitExceeded, TokenBucket, is_rate_limited
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+DEFAULT_TIMEOUT = httpx.Timeout(8.0, connect=4.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+
+# httpx.AsyncClient의 커넥션은 만든 이벤트 루프에 묶이므로 루프별로 하나만 둡니다.
+_CLIENT: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프에서 공유하는 AsyncClient를 반환합니다. 루프가 바뀌면 새로 만듭니다.
+    """
+    global _CLIENT
+    loop = asyncio.get_running_loop()
+    with _CLIENT_LOCK:
+        if _CLIENT is not None and _CLIENT[0] is loop and not _CLIENT[1].is_closed:
+            return _CLIENT[1]
+        client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            follow_redirects=True,
+        )
+        _CLIENT = (loop, client)
+        return client
+
+
+async def aclose_async_client() -> None:
+    """
+    공유 클라이언트를 닫습니다. (FastAPI 종료 시 호출)
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        current, _CLIENT = _CLIENT, None
+    if current is not None and current[0] is asyncio.get_running_loop():
+        await current[1].aclose()
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Retry-After 헤더(초 단위)를 읽습니다. 없거나 날짜 형식이면 None을 반환합니다.
+    """
+    value = headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+async def request_json_with_retry(
+    url: str,
+    params: Dict[str, Any],
+    retries: int = 3,
+    backoff: float = 1.5,
+    limiter: Optional[TokenBucket] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Dict[str, Any]:
+    """
+    GET 요청을 보내 JSON을 반환합니다. 429/네트워크 오류는 asyncio.sleep으로 물러난 뒤 재시도합니다.
+    limiter를 주면 시도마다 요청 슬롯을 얻고, 429 응답 시 해당 소스의 속도를 낮춥니다.
+    breaker를 주면 시도마다 서킷 상태를 확인하고(열려 있으면 즉시 CircuitOpenError) 결과와 지연 시간을 기록합니다.
+    """
+    client = get_async_client()
+    for attempt in range(retries):
+        if breaker is not None:
+            breaker.allow()
+        started = time.monotonic()
+        try:
+            if limiter is not None:
+                await limiter.acquire_async()
+            response = await client.get(url, params=params)
+            if response.status_code == 429:
+                if limiter is not None:
+                    limiter.penalize(retry_after_seconds(response.headers))
+                if attempt < retries - 1:
+                    if breaker is not None:
+                        breaker.release_probe()
+                    sleep_for = backoff**attempt
+                    logger.info(
+                        "Yahoo Finance rate limited request; retrying",
+                        extra={
+                            "attempt": attempt + 1,
+                            "retries": retries,
+                            "sleep_for": sleep_for,
+                        },
+                    )
+                    await asyncio.sleep(sleep_for)
+                    continue
+            response.raise_for_status()
+            if limiter is not None:
+                limiter.reward()
+            if breaker is not None:
+                breaker.record_success(time.monotonic() - started)
+            return response.json()
+        except RateLimitExceeded:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+        except Exception as exc:
+            if breaker is not None:
+                if is_rate_limited(exc):
+                    breaker.release_probe()
+                else:
+                    breaker.record_failure(exc, time.monotonic() - started)
+            if attempt >= retries - 1:
+                raise
+            await asyncio.sleep(backoff**attempt)
+    raise RuntimeError("retries must be at least 1")  # pragma: no cover
+
+
+__all__ = [
+    "DEFAULT_HEADERS",
+    "get_async_client",
+    "aclose_async_client",
+    "request_json_with_retry",
+    "retry_after_seconds",
+]
@@ -0,0 +1,627 @@
+"""TTL과 크기 상한을 지키는 프로세스 공용 캐시 계층 (선택적으로 프로세스 간 공유 캐시를 2단계로 사용)."""
+
+import asyncio
+import atexit
+import functools
+import inspect
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import shared_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("GIFT_CACHE_MAX_ENTRIES", "512"))
+DEFAULT_MAX_BYTES = int(os.getenv("GIFT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+_MISSING = object()
+
+# 초 단위 TTL, 또는 저장 시점에 TTL을 계산하는 정책 (예: trading_calendar.MarketHoursTTL)
+TTLSpec = Union[float, Callable[[], Optional[float]], None]
+
+
+def _frame_size(value: Union[pd.DataFrame, pd.Series]) -> int:
+    # memory_usage(deep=True)는 쓰기 금지(freeze)된 object 배열을 읽지 못하므로 object 열은 원소 크기를 직접 더합니다.
+    frame = value.to_frame() if isinstance(value, pd.Series) else value
+    size = int(frame.memory_usage(index=False, deep=False).sum()) + int(frame.index.memory_usage(deep=True))
+    for _name, column in frame.items():
+        if column.dtype == object:
+            size += sum(sys.getsizeof(item) for item in column.to_numpy())
+    return size
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    캐시 값의 대략적인 메모리 사용량(바이트)을 추정합니다.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _frame_size(value)
+    size = sys.getsizeof(value)
+    if _depth > 4:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _depth + 1) for item in value)
+    return size
+
+
+def _freeze_frame(value: Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame, pd.Series]:
+    # 블록 배열을 쓰기 금지로 표시합니다. 공유된 뷰에 값을 제자리에서 쓰면 캐시 원본을 바꾸는 대신 ValueError가 납니다.
+    for array in getattr(value._mgr, "arrays", ()):
+        array = getattr(array, "_ndarray", array)
+        if isinstance(array, np.ndarray):
+            array.flags.writeable = False
+    return value
+
+
+def freeze(value: Any) -> Any:
+    """
+    캐시에 넣을 값을 읽기 전용으로 바꿉니다.
+    dict는 MappingProxyType, list는 tuple로 감싸고, DataFrame/Series는 값 배열을 쓰기 금지로 표시합니다.
+    (pandas 전역 옵션은 건드리지 않습니다.)
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _freeze_frame(value)
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _share(value: Any) -> Any:
+    # 캐시 원본 객체의 속성(index, columns 등)을 바꾸지 못하도록 프레임은 얕은 뷰로 내보냅니다. (값 배열은 freeze로 쓰기 금지)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
+
+
+_EMPTY_STATS = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "shared_hits": 0}
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at", "expires_at", "stale_until", "size")
+
+    def __init__(
+        self,
+        value: Any,
+        stored_at: float,
+        expires_at: Optional[float],
+        stale_until: Optional[float],
+        size: int,
+    ):
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.size = size
+
+    def is_fresh(self, now: float) -> bool:
+        return self.expires_at is None or now < self.expires_at
+
+    def expired(self, now: float) -> bool:
+        """
+        stale 허용 구간까지 지나 더 이상 제공할 수 없는 상태인지 여부입니다.
+        """
+        limit = self.stale_until if self.stale_until is not None else self.expires_at
+        return limit is not None and now >= limit
+
+
+class TTLCache:
+    """
+    만료 시각과 LRU 순서를 함께 관리하는 스레드 안전 캐시입니다.
+    항목 수(max_entries)나 추정 바이트(max_bytes)를 넘기면 가장 오래 쓰지 않은 항목부터 제거하며,
+    네임스페이스(보통 함수 이름)별 hit/miss/eviction 통계를 제공합니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _bump(self, namespace: str, field: str, amount: int = 1) -> None:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = dict(_EMPTY_STATS)
+        stats[field] += amount
+
+    def _remove(self, full_key: Tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(full_key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def lookup(
+        self,
+        namespace: str,
+        key: Hashable,
+        allow_stale: bool = False,
+        record_stats: bool = True,
+    ) -> Tuple[Any, bool, float]:
+        """
+        (값, 신선 여부, 저장 시각)을 반환합니다. 없으면 값 자리에 _MISSING을 돌려줍니다.
+        allow_stale=True이면 TTL이 지났지만 stale 허용 구간 안의 값도 반환합니다.
+        """
+        full_key = (namespace, key)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None:
+                if record_stats:
+                    self._bump(namespace, "misses")
+                return _MISSING, False, 0.0
+            fresh = entry.is_fresh(now)
+            if entry.expired(now) or (not fresh and not allow_stale):
+                self._remove(full_key)
+                self._bump(namespace, "expirations")
+                if record_stats:
+                    self._bump(namespace, "misses")
+                return _MISSING, False, 0.0
+            self._entries.move_to_end(full_key)
+            if record_stats:
+                self._bump(namespace, "hits" if fresh else "stale_hits")
+            return entry.value, fresh, entry.stored_at
+
+    def record(self, namespace: str, field: str) -> None:
+        with self._lock:
+            self._bump(namespace, field)
+
+    def get(self, namespace: str, key: Hashable, default: Any = _MISSING) -> Any:
+        value, _fresh, _stored_at = self.lookup(namespace, key)
+        return default if value is _MISSING else value
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        ttl: TTLSpec = None,
+        stale_ttl: TTLSpec = None,
+    ) -> None:
+        """
+        값을 저장합니다. ttl/stale_ttl에 호출 가능한 정책을 주면 저장 시점에 호출해 초 단위 값을 얻습니다.
+        """
+        full_key = (namespace, key)
+        now = time.time()
+        ttl = ttl() if callable(ttl) else ttl
+        stale_ttl = stale_ttl() if callable(stale_ttl) else stale_ttl
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.info(
+                "Cache value larger than budget; not cached",
+                extra={"namespace": namespace, "size": size},
+            )
+            return
+        expires_at = now + ttl if ttl is not None else None
+        stale_until = expires_at + stale_ttl if expires_at is not None and stale_ttl is not None else None
+        entry = _Entry(value, now, expires_at, stale_until, size)
+        with self._lock:
+            # 이전 항목을 한 번에 교체하므로 읽는 쪽은 항상 완전한 이전 값 또는 새 값을 봅니다.
+            self._remove(full_key)
+            self._entries[full_key] = entry
+            self._bytes += size
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        # 만료 항목을 먼저 정리하고, 그래도 상한을 넘으면 LRU 순으로 제거합니다.
+        if len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            for full_key in [k for k, entry in self._entries.items() if entry.expired(now)]:
+                self._remove(full_key)
+                self._bump(full_key[0], "expirations")
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            full_key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._bump(full_key[0], "evictions")
+
+    def invalidate(self, namespace: str, key: Hashable = _MISSING) -> None:
+        with self._lock:
+            if key is not _MISSING:
+                self._remove((namespace, key))
+                return
+            for full_key in [k for k in self._entries if k[0] == namespace]:
+                self._remove(full_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        전체 및 네임스페이스별 통계를 반환합니다.
+        """
+        with self._lock:
+            namespaces: Dict[str, Dict[str, int]] = {name: dict(values) for name, values in self._stats.items()}
+            for (namespace, _key), entry in self._entries.items():
+                stats = namespaces.setdefault(namespace, dict(_EMPTY_STATS))
+                stats["entries"] = stats.get("entries", 0) + 1
+                stats["bytes"] = stats.get("bytes", 0) + entry.size
+            totals = dict(_EMPTY_STATS)
+            for stats in namespaces.values():
+                stats.setdefault("entries", 0)
+                stats.setdefault("bytes", 0)
+                for field in totals:
+                    totals[field] += stats[field]
+            return {
+                **totals,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "namespaces": namespaces,
+            }
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 호출을 하나로 합칩니다.
+    먼저 도착한 호출만 실제로 실행하고, 실행 중에 도착한 호출(동기/비동기)은 같은 Future를 기다립니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._finish(key)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any], executor: Optional[ThreadPoolExecutor] = None) -> Any:
+        """
+        비동기 호출자용입니다. 선행 호출이면 fn을 실행하고(코루틴 함수는 await, 일반 함수는 스레드에서 실행),
+        아니면 진행 중인 결과를 await합니다.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            if inspect.iscoroutinefunction(fn):
+                result = await fn()
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(executor, fn)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._finish(key)
+
+
+# Streamlit 앱과 FastAPI 서버가 모두 사용하는 프로세스 공용 캐시
+DEFAULT_CACHE = TTLCache()
+SINGLE_FLIGHT = SingleFlight()
+
+# stale-while-revalidate 백그라운드 갱신용 스레드 풀과 진행 중인 갱신 목록
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+_REFRESHING: Dict[Tuple[str, Hashable], Future] = {}
+_REFRESH_LOCK = threading.Lock()
+atexit.register(_REFRESH_EXECUTOR.shutdown, wait=False)
+
+# 다른 프로세스가 같은 키를 적재 중일 때 공유 캐시에 결과가 올라오기를 기다리는 최대 시간(초)
+SHARED_WAIT_TIMEOUT = float(os.getenv("GIFT_SHARED_CACHE_WAIT", "15"))
+
+
+def _schedule_refresh(namespace: str, key: Hashable, loader: Callable[[], Any]) -> Optional[Future]:
+    """
+    loader(값을 적재해 캐시에 저장하는 함수)를 키당 한 번만 백그라운드에서 실행합니다.
+    """
+    full_key = (namespace, key)
+    with _REFRESH_LOCK:
+        if full_key in _REFRESHING:
+            return _REFRESHING[full_key]
+
+        def _run() -> None:
+            try:
+                loader()
+            except Exception as exc:
+                logger.warning(
+                    "Background cache refresh failed; keeping stale value",
+                    extra={"namespace": namespace, "error": str(exc)},
+                )
+            finally:
+                with _REFRESH_LOCK:
+                    _REFRESHING.pop(full_key, None)
+
+        future = _REFRESH_EXECUTOR.submit(_run)
+        _REFRESHING[full_key] = future
+        return future
+
+
+def wait_for_refreshes(timeout: Optional[float] = None) -> None:
+    """
+    진행 중인 백그라운드 갱신이 끝날 때까지 기다립니다. (테스트/종료 처리용)
+    """
+    with _REFRESH_LOCK:
+        pending = list(_REFRESHING.values())
+    for future in pending:
+        future.result(timeout=timeout)
+
+
+def _make_key(signature: Optional[inspect.Signature], args: tuple, kwargs: dict) -> Hashable:
+    if signature is not None:
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())
+        except TypeError:
+            pass
+    return (args, tuple(sorted(kwargs.items())))
+
+
+def _resolve_ttl(spec: TTLSpec) -> Optional[float]:
+    return spec() if callable(spec) else spec
+
+
+def cached(
+    ttl: TTLSpec = None,
+    stale_ttl: TTLSpec = None,
+    cache: Optional[TTLCache] = None,
+    shared: bool = False,
+    **_streamlit_options: Any,
+) -> Callable:
+    """
+    함수 결과를 TTL 캐시에 저장하는 데코레이터입니다.
+    Streamlit 런타임 여부와 관계없이 같은 캐시를 사용하며, 예외는 캐시하지 않습니다.
+    결과는 저장할 때 freeze로 고정하고 적중 시 복사하지 않으므로 반환값은 읽기 전용입니다.
+    (list는 tuple, dict는 MappingProxyType으로, DataFrame은 쓰기 금지 배열을 공유하는 얕은 뷰로 반환됩니다.
+    열 추가·인덱스 교체는 뷰에만 반영되고, 값을 제자리에서 고치려면 먼저 .copy()해야 합니다.)
+
+    ttl/stale_ttl에는 초 단위 값 대신 저장 시점에 TTL을 계산하는 정책(호출 가능 객체)을 줄 수 있습니다.
+    stale_ttl을 주면 stale-while-revalidate로 동작합니다. TTL이 지난 뒤 stale_ttl 동안은
+    만료된 값을 즉시 반환하고, 같은 키의 갱신은 백그라운드에서 한 번만 실행해 원자적으로 교체합니다.
+
+    shared=True이면 프로세스 캐시 미스 때 프로세스 간 공유 캐시(shared_cache)를 먼저 확인하고,
+    적재 결과를 남은 만료 시간과 함께 공유 캐시에도 씁니다. 여러 프로세스가 같은 키를 동시에 적재하려 하면
+    lease를 얻은 한 프로세스만 원 함수를 실행하고, 나머지는 공유 캐시에 결과가 올라오기를 기다립니다.
+    show_spinner 등 st.cache_data 전용 인자는 호환을 위해 받아서 무시합니다.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        namespace = f"{func.__module__}.{func.__qualname__}"
+        try:
+            signature: Optional[inspect.Signature] = inspect.signature(func)
+        except (TypeError, ValueError):  # pragma: no cover - 내장 함수 등
+            signature = None
+
+        def _store() -> TTLCache:
+            return cache if cache is not None else DEFAULT_CACHE
+
+        def _shared() -> Optional[shared_cache.SharedCache]:
+            return shared_cache.get_shared_cache() if shared else None
+
+        # 모듈을 다시 불러오면(importlib.reload) 이전 정의의 캐시 항목을 버립니다. (공유 캐시는 유지)
+        _store().invalidate(namespace)
+
+        def _shared_get(l2: shared_cache.SharedCache, key: Hashable) -> Optional[shared_cache.SharedEntry]:
+            # 공유 캐시 장애는 프로세스 캐시만 쓰는 것으로 대신합니다.
+            try:
+                return l2.get(namespace, key)
+            except sqlite3.Error as exc:
+                logger.warning("Shared cache read failed", extra={"namespace": namespace, "error": str(exc)})
+                return None
+
+        def _shared_set(l2: shared_cache.SharedCache, key: Hashable, value: Any, ttl_s, stale_s) -> None:
+            try:
+                l2.set(namespace, key, value, ttl=ttl_s, stale_ttl=stale_s)
+            except sqlite3.Error as exc:
+                logger.warning("Shared cache write failed", extra={"namespace": namespace, "error": str(exc)})
+
+        def _adopt(store: TTLCache, key: Hashable, entry: shared_cache.SharedEntry) -> Any:
+            # 다른 프로세스가 저장한 값을 남은 만료 시간 그대로 프로세스 캐시에 올립니다.
+            now = time.time()
+            value = freeze(entry.value)
+            remaining = max(0.0, entry.expires_at - now) if entry.expires_at is not None else None
+            stale_remaining = None
+            if remaining is not None and entry.stale_until is not None:
+                stale_remaining = max(0.0, entry.stale_until - now - remaining)
+            store.set(namespace, key, value, ttl=remaining, stale_ttl=stale_remaining)
+            store.record(namespace, "shared_hits")
+            return value
+
+        def _compute(store: TTLCache, key: Hashable, args: tuple, kwargs: dict, force: bool = False) -> Any:
+            """
+            원 함수를 실행해 결과를 캐시에 저장합니다. 공유 캐시에 다른 프로세스가 적재한 신선한 값이 있으면
+            (force=True이면 호출 이후에 적재된 값만) 원 함수 대신 그 값을 씁니다.
+            """
+            l2 = _shared()
+            if l2 is None:
+                value = freeze(func(*args, **kwargs))
+                store.set(namespace, key, value, ttl=ttl, stale_ttl=stale_ttl)
+                return value
+            started = time.time()
+            if not force:
+                entry = _shared_get(l2, key)
+                if entry is not None and entry.is_fresh(started):
+                    return _adopt(store, key, entry)
+            with l2.lease(namespace, key) as owner:
+                if not owner:
+                    try:
+                        entry = l2.wait_for(namespace, key, after=started if force else 0.0, timeout=SHARED_WAIT_TIMEOUT)
+                    except sqlite3.Error:
+                        entry = None
+                    if entry is not None:
+                        return _adopt(store, key, entry)
+                value = freeze(func(*args, **kwargs))
+                ttl_s, stale_s = _resolve_ttl(ttl), _resolve_ttl(stale_ttl)
+                store.set(namespace, key, value, ttl=ttl_s, stale_ttl=stale_s)
+                _shared_set(l2, key, value, ttl_s, stale_s)
+                return value
+
+        def _load_and_store(store: TTLCache, key: Hashable, args: tuple, kwargs: dict) -> Any:
+            # 선행 호출이 끝나기 직전에 합류한 경우를 대비해 한 번 더 확인합니다.
+            value, fresh, _stored_at = store.lookup(namespace, key, record_stats=False)
+            if value is not _MISSING and fresh:
+                return value
+            return _compute(store, key, args, kwargs)
+
+        async_loader: Optional[Callable[..., Awaitable[Any]]] = None
+
+        async def _aload_and_store(store: TTLCache, key: Hashable, args: tuple, kwargs: dict) -> Any:
+            value, fresh, _stored_at = store.lookup(namespace, key, record_stats=False)
+            if value is not _MISSING and fresh:
+                return value
+            l2 = _shared()
+            if l2 is not None:
+                entry = _shared_get(l2, key)
+                if entry is not None and entry.is_fresh(time.time()):
+                    return _adopt(store, key, entry)
+            value = freeze(await async_loader(*args, **kwargs))
+            ttl_s, stale_s = _resolve_ttl(ttl), _resolve_ttl(stale_ttl)
+            store.set(namespace, key, value, ttl=ttl_s, stale_ttl=stale_s)
+            if l2 is not None:
+                _shared_set(l2, key, value, ttl_s, stale_s)
+            return value
+
+        def _cached_value(store: TTLCache, key: Hashable, args: tuple, kwargs: dict) -> Any:
+            value, fresh, _stored_at = store.lookup(namespace, key, allow_stale=stale_ttl is not None)
+            if value is _MISSING:
+                l2 = _shared()
+                entry = _shared_get(l2, key) if l2 is not None else None
+                if entry is not None:
+                    fresh = entry.is_fresh(time.time())
+                    if fresh or stale_ttl is not None:
+                        value = _adopt(store, key, entry)
+            if value is not _MISSING and not fresh:
+                _schedule_refresh(namespace, key, lambda: _compute(store, key, args, kwargs))
+            return value
+
+        def _hashable_key(args: tuple, kwargs: dict) -> Optional[Hashable]:
+            key = _make_key(signature, args, kwargs)
+            try:
+                hash(key)
+            except TypeError:
+                return None
+            return key
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _hashable_key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            store = _store()
+            value = _cached_value(store, key, args, kwargs)
+            if value is _MISSING:
+                value = SINGLE_FLIGHT.do((namespace, key), lambda: _load_and_store(store, key, args, kwargs))
+            return _share(value)
+
+        async def aio(*args, **kwargs):
+            """
+            비동기 호출자용 진입점입니다. 캐시 적중 시 스레드를 쓰지 않고 바로 반환하며,
+            미스일 때는 동기 호출자와 같은 single-flight 키로 합쳐 한 번만 실행합니다.
+            async_loader로 코루틴이 등록되어 있으면 스레드 풀 대신 그 코루틴을 await합니다.
+            """
+            key = _hashable_key(args, kwargs)
+            if key is None:
+                return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+            store = _store()
+            value = _cached_value(store, key, args, kwargs)
+            if value is _MISSING:
+                if async_loader is not None:
+                    loader = functools.partial(_aload_and_store, store, key, args, kwargs)
+                else:
+                    loader = functools.partial(_load_and_store, store, key, args, kwargs)
+                value = await SINGLE_FLIGHT.do_async((namespace, key), loader)
+            return _share(value)
+
+        def refresh(*args, **kwargs):
+            """
+            캐시 상태와 관계없이 원 함수를 실행해 결과를 캐시에 넣고 반환합니다. (사전 적재/스케줄러용)
+            같은 키의 동시 미스와는 single-flight로, 다른 프로세스의 동시 갱신과는 공유 캐시 lease로 합쳐집니다.
+            """
+            key = _hashable_key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+            store = _store()
+            return _share(SINGLE_FLIGHT.do((namespace, key), lambda: _compute(store, key, args, kwargs, force=True)))
+
+        def register_async(func_async: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            """
+            aio 미스 때 스레드 대신 실행할 네이티브 코루틴을 등록합니다. 인자는 원 함수와 같아야 합니다.
+            """
+            nonlocal async_loader
+            async_loader = func_async
+            return func_async
+
+        def cache_clear() -> None:
+            _store().invalidate(namespace)
+            l2 = _shared()
+            if l2 is not None:
+                try:
+                    l2.invalidate(namespace)
+                except sqlite3.Error as exc:
+                    logger.warning("Shared cache invalidation failed", extra={"namespace": namespace, "error": str(exc)})
+
+        wrapper.cache_clear = cache_clear
+        wrapper.aio = aio
+        wrapper.refresh = refresh
+        wrapper.async_loader = register_async
+        wrapper.cache_namespace = namespace
+        return wrapper
+
+    return decorator
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    stats = DEFAULT_CACHE.stats()
+    l2 = shared_cache.get_shared_cache()
+    stats["shared"] = l2.stats() if l2 is not None else None
+    return stats
+
+
+__all__ = [
+    "TTLCache",
+    "SingleFlight",
+    "DEFAULT_CACHE",
+    "SINGLE_FLIGHT",
+    "cached",
+    "estimate_size",
+    "freeze",
+    "get_cache_stats",
+    "wait_for_refreshes",
+]
@@ -0,0 +1,245 @@
+"""외부 데이터 소스별 서킷 브레이커와 업스트림 상태(실패율, 지연 시간) 집계."""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+from .rate_limit import is_rate_limited
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 실패율·지연 시간을 계산하는 최근 호출 수
+_WINDOW = 50
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 업스트림을 호출하지 않고 바로 실패할 때 발생합니다."""
+
+
+class EmptyResultError(RuntimeError):
+    """
+    데이터가 있어야 할 호출이 빈 결과를 돌려줬을 때 발생합니다.
+    pykrx 등은 내부 오류를 삼키고 빈 프레임을 반환하므로, 가드 안에서 이 예외로 바꿔 실패로 셉니다.
+    """
+
+
+def is_empty_result(value: Any) -> bool:
+    if value is None:
+        return True
+    empty = getattr(value, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+def _percentile(values: Deque[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return round(ordered[index], 4)
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 열려서 reset_timeout초 동안 호출을 즉시 거절합니다.
+
+    대기 시간이 지나면 반열림(half-open) 상태가 되어 탐색 호출 하나만 통과시키고,
+    성공하면 닫히고 실패하면 다시 열립니다. 연이어 다시 열릴 때마다 대기 시간은 max_reset_timeout까지 두 배로 늘어납니다.
+    429(요청 제한)는 업스트림이 살아 있다는 뜻이므로 실패로 세지 않습니다. (rate_limit 버킷이 따로 처리)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 300.0,
+    ):
+        if failure_threshold < 1 or reset_timeout <= 0:
+            raise ValueError("failure_threshold must be at least 1 and reset_timeout positive")
+        self.name = name
+        self.failure_threshold = int(failure_threshold)
+        self.reset_timeout = float(reset_timeout)
+        self.max_reset_timeout = float(max(max_reset_timeout, reset_timeout))
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._cooldown = self.reset_timeout
+        self._probing = False
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=_WINDOW)
+        self._latencies: Deque[float] = deque(maxlen=_WINDOW)
+        self._last_error: Optional[str] = None
+        self._last_failure_at: Optional[float] = None
+        self._last_success_at: Optional[float] = None
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and self._opened_at is not None and now - self._opened_at >= self._cooldown:
+            self._state = HALF_OPEN
+        return self._state
+
+    def allow(self) -> None:
+        """
+        호출해도 되는지 확인합니다. 열려 있거나 반열림 상태에서 이미 탐색 호출이 진행 중이면 CircuitOpenError를 던집니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self._stats["rejected"] += 1
+            retry_in = max(0.0, self._cooldown - (now - (self._opened_at or now)))
+        raise CircuitOpenError(f"{self.name}: circuit open (retry in {retry_in:.1f}s)")
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        with self._lock:
+            self._stats["calls"] += 1
+            self._outcomes.append(True)
+            if latency is not None:
+                self._latencies.append(latency)
+            self._last_success_at = time.time()
+            self._consecutive_failures = 0
+            recovered = self._state != CLOSED
+            self._state = CLOSED
+            self._opened_at = None
+            self._cooldown = self.reset_timeout
+            self._probing = False
+        if recovered:
+            logger.info("Upstream circuit closed", extra={"source": self.name})
+
+    def record_failure(self, exc: BaseException, latency: Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._stats["calls"] += 1
+            self._stats["failures"] += 1
+            self._outcomes.append(False)
+            if latency is not None:
+                self._latencies.append(latency)
+            self._last_error = str(exc) or type(exc).__name__
+            self._last_failure_at = time.time()
+            self._consecutive_failures += 1
+            state = self._current_state(now)
+            reopen = state == HALF_OPEN
+            if reopen:
+                self._cooldown = min(self.max_reset_timeout, self._cooldown * 2)
+            if reopen or (state == CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = now
+                self._stats["opened"] += 1
+                opened = True
+            else:
+                opened = False
+            self._probing = False
+            cooldown = self._cooldown
+        if opened:
+            logger.warning(
+                "Upstream circuit opened",
+                extra={"source": self.name, "cooldown": cooldown, "error": self._last_error},
+            )
+
+    def release_probe(self) -> None:
+        # 탐색 호출이 성공/실패 판정 없이 끝난 경우(예: 429) 다음 탐색을 허용합니다.
+        with self._lock:
+            self._probing = False
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        허용 여부를 확인한 뒤 블록을 실행하고, 결과와 지연 시간을 기록합니다.
+        """
+        self.allow()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            if is_rate_limited(exc) or not isinstance(exc, Exception):
+                self.release_probe()
+            else:
+                self.record_failure(exc, time.monotonic() - started)
+            raise
+        else:
+            self.record_success(time.monotonic() - started)
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self.guard():
+            return fn(*args, **kwargs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            outcomes = list(self._outcomes)
+            retry_in = None
+            if state == OPEN and self._opened_at is not None:
+                retry_in = round(max(0.0, self._cooldown - (now - self._opened_at)), 3)
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_rate": round(outcomes.count(False) / len(outcomes), 4) if outcomes else None,
+                "latency_p50": _percentile(self._latencies, 0.5),
+                "latency_p95": _percentile(self._latencies, 0.95),
+                "retry_in": retry_in,
+                "last_error": self._last_error,
+                "last_failure_at": self._last_failure_at,
+                "last_success_at": self._last_success_at,
+                **self._stats,
+            }
+
+
+def _from_env(name: str, failure_threshold: int, reset_timeout: float) -> CircuitBreaker:
+    # 예: GIFT_BREAKER_THRESHOLD_KRX=5, GIFT_BREAKER_RESET_KRX=30
+    env_key = name.upper()
+    return CircuitBreaker(
+        name,
+        failure_threshold=int(os.getenv(f"GIFT_BREAKER_THRESHOLD_{env_key}", str(failure_threshold))),
+        reset_timeout=float(os.getenv(f"GIFT_BREAKER_RESET_{env_key}", str(reset_timeout))),
+    )
+
+
+# 데이터 소스별 기본 설정 (rate_limit 버킷과 같은 이름)
+DDG = _from_env("ddg", failure_threshold=3, reset_timeout=60.0)
+YAHOO = _from_env("yahoo", failure_threshold=3, reset_timeout=30.0)
+KRX = _from_env("krx", failure_threshold=5, reset_timeout=30.0)
+
+BREAKERS: Dict[str, CircuitBreaker] = {breaker.name: breaker for breaker in (DDG, YAHOO, KRX)}
+
+
+def get_circuit_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: breaker.snapshot() for name, breaker in BREAKERS.items()}
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "EmptyResultError",
+    "is_empty_result",
+    "CLOSED",
+    "OPEN",
+    "HALF_OPEN",
+    "DDG",
+    "YAHOO",
+    "KRX",
+    "BREAKERS",
+    "get_circuit_stats",
+]
@@ -1,32 +1,61 @@
 """데이터 수집 및 가공 유틸리티."""
 
-import copy
-import functools
+import asyncio
 import json
 import logging
+import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import pandas as pd
 import requests
-import streamlit as st
 from duckduckgo_search import DDGS
 from pykrx import stock
-
-try:
-    from streamlit.runtime.scriptrunner import get_script_run_ctx
-except Exception:  # pragma: no cover - streamlit runtime 모듈 미배포 환경 대비
-    get_script_run_ctx = None
+from pykrx.website import krx
+
+from analytics.backtest import DEFAULT_COST_BPS, BacktestResult, run_backtest, sweep
+from analytics.indicators import compute_indicators, compute_panel_indicators, summarize_indicators
+from analytics.screener import screen, top_k_positions
+from analytics.technical import compute_indicator_snapshot, prepare_price_frame
+from analytics.adjust import adjust_close_panel
+from analytics.universe import compute_universe_snapshot
+
+from . import circuit_breaker, rate_limit
+from .async_http import DEFAULT_HEADERS, request_json_with_retry, retry_after_seconds
+from .cache import DEFAULT_CACHE, _share, cached, freeze, get_cache_stats
+from .market_panel import MarketPanelStore
+from .news_store import NewsStore
+from .ohlcv_store import OhlcvStore
+from .shared_cache import get_shared_cache
+from .stock_search import SearchHit, StockSearchIndex
+from .ticker_catalog import TickerCatalog, TickerCatalogStore
+from .trading_calendar import KST, KRX_CALENDAR, MarketHoursTTL, last_market_close
+from .watchlist import WatchSymbol, chunked, load_watchlist
 
 logger = logging.getLogger(__name__)
 
 # pykrx 호출 실패 시 마지막 정상 데이터를 재사용하기 위한 임시 캐시
+# (공유 캐시의 LAST_SUCCESS_NAMESPACE에도 기록해 다른 프로세스와 재기동 후에도 복원합니다.)
 _LAST_SUCCESS_CACHE: Dict[str, Any] = {}
 _LAST_ERRORS: Dict[str, str] = {}
+_LAST_ERROR_AT: Dict[str, float] = {}
+_LAST_SUCCESS_AT: Dict[str, float] = {}
+# version을 넘겨 기록한 키의 마지막 값 버전 (같으면 다시 고정·공유하지 않습니다)
+_LAST_SUCCESS_VERSION: Dict[str, Hashable] = {}
+
+# 만료된 대시보드 데이터를 백그라운드 갱신 동안 계속 제공할 수 있는 최대 시간
+DASHBOARD_STALE_TTL = 60 * 60 * 6
+
+LAST_SUCCESS_NAMESPACE = "data_fetcher.last_success"
+
+# KRX 데이터 캐시 정책: 장중에는 짧은 주기로 갱신하고, 장 마감 후에는 다음 개장까지 유지합니다.
+KRX_INTRADAY_TTL = MarketHoursTTL(intraday=300)
+# 글로벌 선물·환율은 KRX 휴장과 무관하게 거래되므로 고정 주기로 갱신합니다.
+GLOBAL_SNAPSHOT_TTL = 600
 
 # 대시보드에 표시할 주요 지수 코드
 _ADDITIONAL_INDEX_TARGETS = {
@@ -35,6 +64,11 @@ _ADDITIONAL_INDEX_TARGETS = {
     "KOSPI200": "1028",
 }
 
+# 지수 일봉 이력 저장소 (지수 코드당 Parquet 파티션). 장중 지수 갱신 주기에 맞춰 5분마다 최신 봉을 다시 받습니다.
+MARKET_INDICES_LOOKBACK_DAYS = 30
+INDEX_HISTORY_MAX_WORKERS = 4
+INDEX_HISTORY_MAX_LOOKBACK_DAYS = 365 * 20
+
 # 주도 섹터 시황용 타깃
 _SECTOR_CANDIDATES = [
     "KRX 반도체",
@@ -44,6 +78,13 @@ _SECTOR_CANDIDATES = [
     "KRX 에너지화학",
 ]
 
+# 지수 카탈로그(이름↔코드)를 만들 때 조회하는 시장
+INDEX_CATALOG_MARKETS = ("KOSPI", "KOSDAQ", "KRX", "테마")
+# 섹터 순환 표: 시장별 일괄 등락률 조회 대상과 기간별 수익률 계산에 쓰는 거래일 수
+SECTOR_INDEX_MARKETS = ("KRX", "KOSPI", "KOSDAQ")
+SECTOR_RETURN_PERIODS = {"1D": 1, "1W": 5, "1M": 21}
+SECTOR_HISTORY_LOOKBACK_DAYS = 45
+
 # 글로벌 지표 및 환율 (야후 파이낸스 심볼)
 _GLOBAL_SYMBOLS = {
     "S&P 500 Futures": "ES=F",
@@ -52,86 +93,179 @@ _GLOBAL_SYMBOLS = {
     "USD/KRW": "KRW=X",
 }
 
+# 글로벌 패널 관심 종목 (GIFT_WATCHLIST_FILE로 교체 가능)
+WATCHLIST: Tuple[WatchSymbol, ...] = load_watchlist()
+
 _REQUEST_SESSION = requests.Session()
-_REQUEST_SESSION.headers.update(
-    {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
-)
+_REQUEST_SESSION.headers.update(DEFAULT_HEADERS)
 
 PERSISTENT_CACHE_DIR = Path(".cache")
 PERSISTENT_CACHE_DIR.mkdir(exist_ok=True)
-GLOBAL_SNAPSHOT_CACHE_FILE = PERSISTENT_CACHE_DIR / "global_snapshot.json"
+# 다른 프로세스가 남긴 글로벌 스냅샷을 대체값으로 쓸 수 있는 최대 경과 시간
 GLOBAL_SNAPSHOT_CACHE_TTL = 60 * 15  # 15분
 
-_NEWS_LOCK = threading.Lock()
-_LAST_NEWS_TIMESTAMP = 0.0
-_NEWS_MIN_INTERVAL = 0.4  # DDG 요청 간 최소 간격(초)
+# 종목별 일봉 이력 저장소 (티커당 Parquet 파티션)
+STOCK_HISTORY_LOOKBACK_DAYS = 365
+_OHLCV_STORE = OhlcvStore(PERSISTENT_CACHE_DIR / "ohlcv")
 
+# 지수 일봉 저장소의 재동기화 간격. 캐시 TTL(장중 5분)과 warmer 선행 갱신(만료 30초 전, 즉 270초마다)보다
+# 짧아야 갱신 때마다 실제로 새 봉을 받습니다. (같은 주기 안의 다른 조회 구간 요청만 합쳐 줍니다)
+INDEX_STORE_REFRESH_INTERVAL = 60
+_INDEX_STORE = OhlcvStore(PERSISTENT_CACHE_DIR / "index_ohlcv", refresh_interval=INDEX_STORE_REFRESH_INTERVAL)
 
-def _has_streamlit_runtime() -> bool:
-    if get_script_run_ctx is None:
-        return False
-    try:
-        return get_script_run_ctx() is not None
-    except RuntimeError:
-        return False
+# 거래일별 전 종목 일봉 단면 저장소 (날짜×티커 패널)
+_MARKET_PANEL = MarketPanelStore(PERSISTENT_CACHE_DIR / "panel")
+# 백테스트가 읽는 패널 기간. 워머의 market_panel 작업은 최근 STOCK_HISTORY_LOOKBACK_DAYS만 채우므로,
+# 더 긴 기간은 backfill_market_panel(BACKTEST_LOOKBACK_DAYS)로 한 번 채워 둡니다.
+BACKTEST_LOOKBACK_DAYS = 365 * 10
+# 수집 중 관측된 휴장일(빈 단면)을 거래일 달력에 반영합니다.
+KRX_CALENDAR.add_holidays(_MARKET_PANEL.holidays())
 
+# 거래일별 전 지수 종가·등락률 단면 저장소 (날짜×지수 코드 패널, 섹터 순환 표용)
+_INDEX_PANEL = MarketPanelStore(PERSISTENT_CACHE_DIR / "index_panel")
+KRX_CALENDAR.add_holidays(_INDEX_PANEL.holidays())
 
-def cache_data_or_lru(*cache_args, **cache_kwargs):
-    """
-    Streamlit 런타임에서는 st.cache_data를, 그 외 환경(FastAPI 실행 등)에서는 lru_cache를 사용합니다.
-    """
+# 종목명↔티커 카탈로그 (거래일과 함께 디스크에 저장)
+TICKER_CATALOG_FILE = PERSISTENT_CACHE_DIR / "ticker_catalog.json"
+CATALOG_MARKETS = ("KOSPI", "KOSDAQ")
 
-    def decorator(func):
-        lru_cached = functools.lru_cache(maxsize=None)(func)
-        streamlit_cached = {"fn": None}
+# 검색어별 뉴스 결과 저장소 (Streamlit/API 프로세스가 함께 사용)
+NEWS_STORE_FILE = PERSISTENT_CACHE_DIR / "news.sqlite3"
+NEWS_TTL = int(os.getenv("GIFT_NEWS_TTL", str(60 * 15)))
+_NEWS_STORE = NewsStore(NEWS_STORE_FILE, ttl=NEWS_TTL)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            if _has_streamlit_runtime():
-                if streamlit_cached["fn"] is None:
-                    streamlit_cached["fn"] = st.cache_data(*cache_args, **cache_kwargs)(func)
-                return streamlit_cached["fn"](*args, **kwargs)
-            return lru_cached(*args, **kwargs)
+# 뉴스 일괄 검색의 최대 동시 실행 수 (실제 속도는 rate_limit.DDG 버킷이 제한)
+NEWS_BATCH_MAX_WORKERS = 8
 
-        return wrapper
 
-    return decorator
+def _remember_result(key: str, value: Any, version: Optional[Hashable] = None) -> Any:
+    """
+    정상 수집 결과를 읽기 전용으로 고정해 보관하고, 같은 객체를 그대로 반환합니다.
+    공유 캐시 기록(Arrow 인코딩 + SQLite 쓰기)이 따르므로 캐시 로더 안처럼 새 값을 만들 때만 호출하고,
+    매번 호출되는 경로는 version을 넘겨 값이 바뀌었을 때만 기록되게 합니다.
+    """
+    if version is not None and key in _LAST_SUCCESS_CACHE and _LAST_SUCCESS_VERSION.get(key) == version:
+        _LAST_SUCCESS_AT[key] = time.time()
+        return _LAST_SUCCESS_CACHE[key]
+    frozen = freeze(value)
+    _LAST_SUCCESS_CACHE[key] = frozen
+    _LAST_SUCCESS_AT[key] = time.time()
+    if version is not None:
+        _LAST_SUCCESS_VERSION[key] = version
+    shared = get_shared_cache()
+    if shared is not None:
+        try:
+            shared.set(LAST_SUCCESS_NAMESPACE, key, frozen)
+        except Exception as exc:
+            logger.warning("Failed to share last good result", extra={"key": key, "error": str(exc)})
+    return frozen
 
 
-def _deep_copy(value: Any) -> Any:
-    if isinstance(value, pd.DataFrame):
-        return value.copy()
-    if isinstance(value, (dict, list)):
-        return copy.deepcopy(value)
-    return value
+def _frame_version(frame: pd.DataFrame) -> Hashable:
+    # 값·인덱스·컬럼이 같으면 같은 버전입니다. (행 해시 합, 수백 행 기준 1ms 미만)
+    return (tuple(frame.columns), len(frame), int(pd.util.hash_pandas_object(frame, index=True).sum()))
 
 
-def _remember_result(key: str, value: Any) -> Any:
-    _LAST_SUCCESS_CACHE[key] = _deep_copy(value)
-    return _deep_copy(value)
+def _shared_last_success(key: str) -> Optional[Any]:
+    shared = get_shared_cache()
+    if shared is None:
+        return None
+    try:
+        return shared.get(LAST_SUCCESS_NAMESPACE, key)
+    except Exception as exc:
+        logger.warning("Failed to read shared last good result", extra={"key": key, "error": str(exc)})
+        return None
 
 
-def _fallback_result(key: str, default: Any) -> Any:
+def _fallback_result(key: str, default: Any, max_age: Optional[float] = None) -> Any:
+    """
+    이 프로세스의 마지막 정상값, 없으면 공유 캐시에 다른 프로세스(또는 재기동 전)가 남긴 값을 반환합니다.
+    max_age를 주면 공유 캐시의 값은 저장된 지 max_age초 이내인 것만 씁니다.
+    """
     fallback = _LAST_SUCCESS_CACHE.get(key)
     if fallback is not None:
-        return _deep_copy(fallback)
+        return fallback
+    entry = _shared_last_success(key)
+    if entry is not None and (max_age is None or time.time() - entry.stored_at <= max_age):
+        return freeze(entry.value)
     return default
 
 
 def _record_error(key: str, message: Optional[str]) -> None:
     if message:
         _LAST_ERRORS[key] = message
+        _LAST_ERROR_AT[key] = time.time()
     else:
         _LAST_ERRORS.pop(key, None)
+        _LAST_ERROR_AT.pop(key, None)
 
 
 def get_last_data_error(key: str) -> Optional[str]:
     return _LAST_ERRORS.get(key)
 
 
+def get_data_age(key: str) -> Optional[float]:
+    """
+    key 데이터셋을 마지막으로 정상 수집한 뒤 지난 시간(초)을 반환합니다. 수집 이력이 없으면 None.
+    """
+    fetched_at = _LAST_SUCCESS_AT.get(key)
+    if fetched_at is None:
+        entry = _shared_last_success(key)
+        if entry is None:
+            return None
+        fetched_at = entry.stored_at
+    return max(0.0, time.time() - fetched_at)
+
+
+def get_data_health() -> Dict[str, Dict[str, Any]]:
+    """
+    데이터셋별 상태를 반환합니다.
+    status는 ok(마지막 수집 성공), degraded(실패했지만 이전 정상값으로 대체 중), failing(대체값 없음) 중 하나입니다.
+    """
+    now = time.time()
+    health: Dict[str, Dict[str, Any]] = {}
+    for key in sorted(set(_LAST_ERRORS) | set(_LAST_SUCCESS_AT)):
+        error = _LAST_ERRORS.get(key)
+        fetched_at = _LAST_SUCCESS_AT.get(key)
+        if error is None:
+            status = "ok"
+        else:
+            status = "degraded" if key in _LAST_SUCCESS_CACHE else "failing"
+        health[key] = {
+            "status": status,
+            "error": error,
+            "error_at": _LAST_ERROR_AT.get(key),
+            "last_success_at": fetched_at,
+            "age_seconds": round(now - fetched_at, 3) if fetched_at is not None else None,
+        }
+    return health
+
+
+def get_upstream_health() -> Dict[str, Dict[str, Any]]:
+    """
+    업스트림(KRX/Yahoo/DuckDuckGo)별 서킷 상태, 최근 실패율·지연 시간과 요청 제한 현황을 반환합니다.
+    """
+    limits = rate_limit.get_rate_limit_stats()
+    return {
+        name: {**stats, "rate_limit": limits.get(name)}
+        for name, stats in circuit_breaker.get_circuit_stats().items()
+    }
+
+
+def _krx_call(fn: Callable[..., Any], *args: Any, expect_data: bool = True, **kwargs: Any) -> Any:
+    """
+    pykrx 호출을 KRX 서킷 브레이커와 요청 제한 아래에서 실행합니다.
+    서킷이 열려 있으면 요청 슬롯을 기다리지 않고 바로 CircuitOpenError를 던집니다.
+    pykrx는 오류를 삼키고 빈 결과를 돌려주므로, expect_data이면 빈 결과를 EmptyResultError로 바꿔 실패로 셉니다.
+    휴장일 단면이나 새 봉이 없을 수 있는 증분 구간처럼 빈 결과가 정상인 호출만 expect_data=False로 부릅니다.
+    """
+    with circuit_breaker.KRX.guard():
+        result = rate_limit.KRX.call(fn, *args, **kwargs)
+        if expect_data and circuit_breaker.is_empty_result(result):
+            raise circuit_breaker.EmptyResultError(f"{getattr(fn, '__name__', fn)} returned no data")
+        return result
+
+
 def _build_global_snapshot_placeholder() -> List[Dict[str, Any]]:
     return [
         {
@@ -147,26 +281,46 @@ def _build_global_snapshot_placeholder() -> List[Dict[str, Any]]:
 
 
 def _request_with_retry(url: str, params: Dict[str, Any], retries: int = 3, backoff: float = 1.5) -> Dict[str, Any]:
+    """
+    Yahoo Finance에 GET 요청을 보내 JSON을 반환합니다.
+    시도마다 서킷 상태를 확인하므로, 장애로 서킷이 열리면 남은 재시도와 대기 없이 CircuitOpenError로 끝납니다.
+    """
+    breaker = circuit_breaker.YAHOO
     last_exc: Optional[Exception] = None
     for attempt in range(retries):
+        breaker.allow()
+        started = time.monotonic()
         try:
+            rate_limit.YAHOO.acquire()
             response = _REQUEST_SESSION.get(url, params=params, timeout=8)
-            if response.status_code == 429 and attempt < retries - 1:
-                sleep_for = backoff**attempt
-                logger.info(
-                    "Yahoo Finance rate limited request; retrying",
-                    extra={
-                        "attempt": attempt + 1,
-                        "retries": retries,
-                        "sleep_for": sleep_for,
-                    },
-                )
-                time.sleep(sleep_for)
-                continue
+            if response.status_code == 429:
+                rate_limit.YAHOO.penalize(retry_after_seconds(response.headers))
+                if attempt < retries - 1:
+                    breaker.release_probe()
+                    sleep_for = backoff**attempt
+                    logger.info(
+                        "Yahoo Finance rate limited request; retrying",
+                        extra={
+                            "attempt": attempt + 1,
+                            "retries": retries,
+                            "sleep_for": sleep_for,
+                        },
+                    )
+                    time.sleep(sleep_for)
+                    continue
             response.raise_for_status()
+            rate_limit.YAHOO.reward()
+            breaker.record_success(time.monotonic() - started)
             return response.json()
+        except rate_limit.RateLimitExceeded:
+            breaker.release_probe()
+            raise
         except Exception as exc:
             last_exc = exc
+            if rate_limit.is_rate_limited(exc):
+                breaker.release_probe()
+            else:
+                breaker.record_failure(exc, time.monotonic() - started)
             if attempt < retries - 1:
                 sleep_for = backoff ** attempt
                 time.sleep(sleep_for)
@@ -175,132 +329,335 @@ def _request_with_retry(url: str, params: Dict[str, Any], retries: int = 3, back
     raise last_exc  # pragma: no cover
 
 
-def _load_persistent_snapshot() -> Optional[List[Dict[str, Any]]]:
-    if not GLOBAL_SNAPSHOT_CACHE_FILE.exists():
-        return None
-    try:
-        raw = json.loads(GLOBAL_SNAPSHOT_CACHE_FILE.read_text(encoding="utf-8"))
-        timestamp = raw.get("timestamp")
-        if timestamp and time.time() - float(timestamp) > GLOBAL_SNAPSHOT_CACHE_TTL:
-            return None
-        return raw.get("data")
-    except Exception:
-        return None
+def _sync_index_history(ticker: str, start: datetime, end: datetime) -> pd.DataFrame:
+    # 지수 일봉도 종목 일봉과 같은 Parquet 저장소에 누적하고, 마지막 저장일 이후 구간만 받아옵니다.
+    return _INDEX_STORE.sync(
+        ticker,
+        lambda fromdate, todate: _krx_call(
+            stock.get_index_ohlcv_by_date, fromdate, todate, ticker, expect_data=False
+        ),
+        start=start,
+        end=end,
+    )
+
+
+def _load_index_closes(targets: Sequence[Tuple[str, str]], lookback_days: int) -> pd.DataFrame:
+    """
+    (라벨, 지수 코드) 목록의 종가를 병렬로 동기화해 날짜×라벨 프레임으로 반환합니다.
+    일부 지수가 실패하면 나머지로 구성하고, 모두 실패하면 예외를 던집니다.
+    """
+    end = datetime.now()
+    start = end - timedelta(days=lookback_days)
+    closes: Dict[str, pd.Series] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(INDEX_HISTORY_MAX_WORKERS, len(targets)))) as executor:
+        futures = {
+            executor.submit(_sync_index_history, ticker, start, end): (label, ticker) for label, ticker in targets
+        }
+        for future in as_completed(futures):
+            label, ticker = futures[future]
+            try:
+                history = future.result()
+            except Exception as inner_exc:
+                logger.warning(
+                    "Failed to load index component",
+                    extra={"label": label, "ticker": ticker, "error": str(inner_exc)},
+                )
+                continue
+            if not history.empty:
+                closes[label] = history["종가"].rename(label)
 
+    if not closes:
+        raise RuntimeError("No index data available")
 
-def _save_persistent_snapshot(data: List[Dict[str, Any]]) -> None:
-    payload = {"timestamp": time.time(), "data": data}
-    GLOBAL_SNAPSHOT_CACHE_FILE.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    # 완료 순서와 관계없이 요청한 순서대로 열을 놓습니다.
+    frame = pd.concat([closes[label] for label, _ticker in targets if label in closes], axis=1)
+    frame.index = pd.DatetimeIndex(frame.index).strftime("%Y-%m-%d")
+    return frame
 
 
-def _get_index_frame(start_date: str, end_date: str, ticker: str, label: str) -> pd.DataFrame:
-    frame = stock.get_index_ohlcv_by_date(start_date, end_date, ticker)
-    return frame["종가"].to_frame(label)
+@cached(ttl=60 * 60 * 24, shared=True, show_spinner=False)
+def _index_catalog(business_day: str) -> pd.DataFrame:
+    rows: List[Dict[str, str]] = []
+    for market in INDEX_CATALOG_MARKETS:
+        for ticker in _krx_call(stock.get_index_ticker_list, business_day, market=market):
+            rows.append({"티커": str(ticker), "지수명": stock.get_index_ticker_name(ticker), "시장": market})
+    if not rows:
+        raise RuntimeError("Empty index catalog")
+    return _remember_result("index_catalog", pd.DataFrame(rows).drop_duplicates("티커").set_index("티커"))
+
+
+def get_index_catalog() -> pd.DataFrame:
+    """
+    KRX 지수 카탈로그(지수 코드 → 지수명, 시장)를 반환합니다.
+    영업일마다 한 번만 시장별 목록을 받아 만들고, 공유 캐시로 다른 프로세스와 함께 씁니다.
+    """
+    key = "index_catalog"
+    try:
+        catalog = _index_catalog(_latest_business_day())
+        _record_error(key, None)
+        return catalog
+    except Exception as exc:
+        logger.warning("get_index_catalog failed", exc_info=exc)
+        _record_error(key, str(exc))
+        return _fallback_result(key, pd.DataFrame(columns=["지수명", "시장"]))
 
 
 def _find_index_ticker(target_name: str, date: str) -> Optional[str]:
     try:
-        for market in ("KOSPI", "KOSDAQ", "KRX", "테마"):
-            tickers = stock.get_index_ticker_list(date, market=market)
-            for ticker in tickers:
-                if stock.get_index_ticker_name(ticker) == target_name:
-                    return ticker
+        catalog = _index_catalog(date)
     except Exception as exc:
         logger.warning(
             "Failed to resolve index ticker",
             extra={"target": target_name, "error": str(exc)},
         )
-    return None
-
-
-def _load_sector_snapshot(
-    sector_name: str, start_date: str, end_date: str, reference_day: str
-) -> Optional[Dict[str, Any]]:
-    ticker = _find_index_ticker(sector_name, reference_day)
-    if not ticker:
         return None
-    sector_df = stock.get_index_ohlcv_by_date(start_date, end_date, ticker)
-    if sector_df.empty:
-        return None
-    latest = sector_df.iloc[-1]["종가"]
-    previous = sector_df.iloc[-2]["종가"] if len(sector_df) > 1 else latest
-    diff = latest - previous
-    change_pct = (diff / previous * 100) if previous else 0
-    return {
-        "섹터": sector_name,
-        "현재가": latest,
-        "전일대비": diff,
-        "등락률(%)": change_pct,
-    }
+    matches = catalog.index[catalog["지수명"] == target_name]
+    return str(matches[0]) if len(matches) else None
 
 
-@cache_data_or_lru(ttl=900, show_spinner=False)
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
 def get_market_indices() -> pd.DataFrame:
     """
-    최근 한 달간의 주요 지수 종가를 반환합니다.
+    최근 한 달간의 주요 지수 종가를 반환합니다. 지수별 이력은 병렬로, 저장소에 없는 날짜만 받아옵니다.
     """
     key = "market_indices"
-    today = datetime.now().strftime("%Y%m%d")
-    start_date = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
     try:
-        frames = []
-        for label, ticker in _ADDITIONAL_INDEX_TARGETS.items():
+        indices_df = _load_index_closes(list(_ADDITIONAL_INDEX_TARGETS.items()), MARKET_INDICES_LOOKBACK_DAYS)
+        result = _remember_result(key, indices_df)
+        _record_error(key, None)
+        return result
+    except Exception as exc:
+        logger.warning("get_market_indices failed", exc_info=exc)
+        _record_error(key, str(exc))
+        return _fallback_result(key, pd.DataFrame())
+
+
+def _resolve_index_targets(indices: Iterable[str]) -> List[Tuple[str, str]]:
+    # 라벨(KOSPI 등 기본 대상)과 지수 코드(예: "1028")를 모두 받습니다. 코드는 지수명을 라벨로 씁니다.
+    targets: List[Tuple[str, str]] = []
+    for item in dict.fromkeys(str(index).strip() for index in indices):
+        if not item:
+            continue
+        ticker = _ADDITIONAL_INDEX_TARGETS.get(item.upper(), item)
+        label = item.upper() if item.upper() in _ADDITIONAL_INDEX_TARGETS else None
+        if label is None:
             try:
-                frame = _get_index_frame(start_date, today, ticker, label)
-                frames.append(frame)
-            except Exception as inner_exc:
-                logger.warning(
-                    "Failed to load index component",
-                    extra={"label": label, "ticker": ticker, "error": str(inner_exc)},
-                )
+                label = stock.get_index_ticker_name(ticker) or ticker
+            except Exception:
+                label = ticker
+        targets.append((label, ticker))
+    return targets
 
-        if not frames:
-            raise RuntimeError("No index data available")
 
-        indices_df = pd.concat(frames, axis=1)
-        indices_df.index = indices_df.index.strftime("%Y-%m-%d")
-        result = _remember_result(key, indices_df)
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _index_history(targets: Tuple[Tuple[str, str], ...], lookback_days: int) -> pd.DataFrame:
+    key = f"index_history::{','.join(ticker for _label, ticker in targets)}::{lookback_days}"
+    try:
+        result = _remember_result(key, _load_index_closes(list(targets), lookback_days))
         _record_error(key, None)
         return result
     except Exception as exc:
-        logger.warning("get_market_indices failed", exc_info=exc)
+        logger.warning("get_index_history failed", extra={"targets": targets, "error": str(exc)})
         _record_error(key, str(exc))
         return _fallback_result(key, pd.DataFrame())
 
 
-def _load_top_100_market_cap_stocks() -> pd.DataFrame:
-    latest_day = stock.get_nearest_business_day_in_a_week()
-    df_cap = stock.get_market_cap_by_ticker(latest_day)
-    df_change = stock.get_market_price_change_by_ticker(latest_day, latest_day)
+def get_index_history(indices: Optional[Iterable[str]] = None, lookback_days: int = 365) -> pd.DataFrame:
+    """
+    임의의 지수 목록과 조회 기간(일)에 대한 종가 프레임(날짜×지수)을 반환합니다.
+    indices에는 기본 라벨(KOSPI, KOSDAQ, KOSPI200)이나 KRX 지수 코드(예: "1028")를 줄 수 있습니다.
+    지수별 이력은 로컬 저장소에 누적되므로 긴 기간(예: 5년)도 처음 한 번만 전체를 받아오고,
+    이후에는 새 거래일만 덧붙입니다. 기본 대시보드 호출(get_market_indices)과는 캐시를 따로 씁니다.
+    """
+    targets = _resolve_index_targets(indices if indices is not None else _ADDITIONAL_INDEX_TARGETS)
+    if not targets:
+        return pd.DataFrame()
+    lookback_days = max(1, min(int(lookback_days), INDEX_HISTORY_MAX_LOOKBACK_DAYS))
+    return _index_history(tuple(targets), lookback_days)
+
+
+# 순위 API 정렬 키 → 전 종목 프레임 컬럼
+RANKING_SORT_KEYS = {"cap": "시가총액", "change": "등락률", "volume": "거래량", "turnover": "거래대금"}
+RANKING_MARKETS = ("ALL",) + CATALOG_MARKETS
+RANKING_COLUMNS = ["종목코드", "이름", "시장", "현재가", "등락률", "거래량", "거래대금", "시가총액"]
+
 
-    if df_cap.empty or df_change.empty:
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _market_frame(business_day: str) -> pd.DataFrame:
+    df_cap = _krx_call(stock.get_market_cap_by_ticker, business_day)
+    df_day = ingest_market_day(business_day)
+
+    if df_cap.empty or df_day is None or df_day.empty:
         raise RuntimeError("Empty market cap or price change data")
 
-    df_merged = pd.merge(
-        df_cap,
-        df_change[["종목명", "등락률"]],
-        left_index=True,
-        right_index=True,
-        how="left",
-    )
+    catalog = get_ticker_catalog()
+    ticker_names = catalog.ticker_to_name if catalog is not None else {}
+    ticker_markets = catalog.ticker_to_market if catalog is not None else {}
+    frame = df_cap[["종가", "거래량", "거래대금", "시가총액"]].join(df_day[["등락률"]], how="left")
+    frame.index = frame.index.astype(str)
+    frame.index.name = "종목코드"
+    frame["이름"] = frame.index.map(lambda ticker: ticker_names.get(ticker))
+    frame["시장"] = frame.index.map(lambda ticker: ticker_markets.get(ticker))
+    frame = frame.rename(columns={"종가": "현재가"})
+    return _remember_result("market_frame", frame.reset_index()[RANKING_COLUMNS])
+
+
+def get_market_frame() -> pd.DataFrame:
+    """
+    최근 거래일의 전 종목 시세·시가총액 병합 프레임을 반환합니다.
+    장중에는 5분마다, 장 마감 후에는 다음 개장까지 한 번만 만들어 공유 캐시로 함께 씁니다.
+    """
+    key = "market_frame"
+    try:
+        frame = _market_frame(_latest_business_day())
+        _record_error(key, None)
+        return frame
+    except Exception as exc:
+        logger.warning("get_market_frame failed", exc_info=exc)
+        _record_error(key, str(exc))
+        return _fallback_result(key, pd.DataFrame(columns=RANKING_COLUMNS))
+
+
+def refresh_market_frame() -> pd.DataFrame:
+    """
+    캐시 상태와 관계없이 최근 거래일의 전 종목 프레임을 다시 만듭니다. (이 프레임으로 만드는 캐시를 갱신하기 전에 호출)
+    """
+    return _market_frame.refresh(_latest_business_day())
+
+
+def rank_stocks(
+    market: str = "ALL",
+    sort_by: str = "cap",
+    ascending: bool = False,
+    offset: int = 0,
+    limit: int = 100,
+    top_n: Optional[int] = None,
+    frame: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    전 종목 프레임에서 시장 필터와 정렬 키(cap/change/volume/turnover)로 순위를 매겨 한 페이지를 반환합니다.
+    top_n을 주면 상위 top_n개 안에서만 offset/limit로 페이지를 나눕니다. 인덱스는 1부터 시작하는 순위입니다.
+    같은 거래일 프레임을 재사용하므로 조건을 바꿔도 업스트림 호출이 늘지 않습니다.
+    """
+    market = (market or "ALL").upper()
+    if market not in RANKING_MARKETS:
+        raise ValueError(f"Unknown market: {market}")
+    if sort_by not in RANKING_SORT_KEYS:
+        raise ValueError(f"Unknown sort key: {sort_by}")
+    offset = max(0, int(offset))
+    limit = max(0, int(limit))
+
+    frame = get_market_frame() if frame is None else frame
+    if market != "ALL":
+        frame = frame[frame["시장"] == market]
+    end = offset + limit
+    if top_n is not None:
+        end = min(end, max(0, int(top_n)))
+    if frame.empty or end <= offset:
+        return pd.DataFrame(columns=RANKING_COLUMNS)
+
+    positions = top_k_positions(frame[RANKING_SORT_KEYS[sort_by]].to_numpy(), min(end, len(frame)), ascending)
+    page = frame.iloc[positions[offset:end]].reset_index(drop=True)
+    page.index = page.index + offset + 1
+    return page
+
+
+# 스크리너 표에 붙이는 패널 지표(마지막 거래일 값)와 재무 지표 컬럼
+SCREENER_INDICATORS = {
+    "RSI14": "rsi_14",
+    "MACD_hist": "macd_hist",
+    "BB_pctb": "bb_pctb",
+    "ATR14": "atr_14",
+    "STOCH_K": "stoch_k",
+    "STOCH_D": "stoch_d",
+}
+SCREENER_FUNDAMENTALS = ("BPS", "PER", "PBR", "EPS", "DIV", "DPS")
+
+
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _screener_table(business_day: str) -> pd.DataFrame:
+    panels = {field: get_market_panel(field) for field in ("종가", "고가", "저가", "거래량", "등락률")}
+    # 패널 종가는 수정 전 가격이므로 등락률로 이어 붙인 수정 가격으로 계산해야 분할일에 가짜 급락이 생기지 않습니다.
+    close = adjust_close_panel(panels["종가"], panels["등락률"])
+    ratio = close / panels["종가"]
+    volume = panels["거래량"] / ratio
+    table = compute_universe_snapshot(close, volume)
+    if not table.empty:
+        indicators = compute_panel_indicators(close, panels["고가"] * ratio, panels["저가"] * ratio, volume)
+        latest = pd.DataFrame({alias: indicators[name].iloc[-1] for name, alias in SCREENER_INDICATORS.items()})
+        table = table.join(latest)
+        table["atr_pct"] = table["atr_14"] / table["close"] * 100
+
+    market = get_market_frame().set_index("종목코드")[["이름", "시장", "등락률", "거래대금", "시가총액"]]
+    if market.empty and table.empty:
+        raise RuntimeError("No market data for screener")
+    combined = market.join(table, how="outer") if not market.empty else table
+    fundamentals = get_market_fundamentals()
+    if not fundamentals.empty:
+        combined = combined.join(fundamentals[[column for column in SCREENER_FUNDAMENTALS if column in fundamentals]])
+    combined.index = combined.index.astype(str)
+    combined.index.name = "티커"
+    return _remember_result("screener_table", combined.reset_index())
+
+
+def get_screener_table() -> pd.DataFrame:
+    """
+    스크리너용 전 종목 컬럼 표(종목명·시장·시세, 지표 스냅샷, RSI 등 패널 지표, PER 등 재무 지표)를 반환합니다.
+    저장된 전 종목 패널과 거래일 프레임으로 만들며, 장중에는 5분마다 다시 만들어 공유 캐시로 함께 씁니다.
+    """
+    key = "screener_table"
+    try:
+        table = _screener_table(_latest_business_day())
+        _record_error(key, None)
+        return table
+    except Exception as exc:
+        logger.warning("get_screener_table failed", exc_info=exc)
+        _record_error(key, str(exc))
+        return _fallback_result(key, pd.DataFrame())
+
 
-    df_top100 = df_merged.sort_values(by="시가총액", ascending=False).head(100)
-    df_final = df_top100[["종목명", "종가", "등락률", "시가총액"]]
 
-    df_final = df_final.rename(columns={"종목명": "이름", "종가": "현재가"})
-    df_final = df_final.reset_index().rename(columns={"티커": "종목코드"})
-    df_final.index = df_final.index + 1
-    return df_final
+def refresh_screener_table() -> pd.DataFrame:
+    """
+    캐시 상태와 관계없이 최근 거래일의 스크리너 표를 다시 만듭니다. (워머용, 실패하면 오류를 기록하고 예외를 던집니다)
+    """
+    key = "screener_table"
+    try:
+        table = _screener_table.refresh(_latest_business_day())
+    except Exception as exc:
+        _record_error(key, str(exc))
+        raise
+    _record_error(key, None)
+    return table
+
+def run_screener(
+    expression: Optional[str] = None,
+    sort_by: Optional[str] = "시가총액",
+    ascending: bool = False,
+    limit: int = 50,
+) -> Tuple[pd.DataFrame, int]:
+    """
+    필터 식(예: "ma_gap_20_pct > 5 and volume_gap_pct > 100 and PER < 10")으로 전 종목을 걸러
+    sort_by 기준 상위 limit개와 전체 일치 종목 수를 반환합니다. 식이 잘못되면 FilterSyntaxError를 던집니다.
+    """
+    table = get_screener_table()
+    if table.empty:
+        return table, 0
+    matches = screen(table, expression, sort_by=None, limit=None)
+    return screen(matches, None, sort_by=sort_by, ascending=ascending, limit=limit), len(matches)
 
 
-@cache_data_or_lru(ttl=900, show_spinner=False)
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
 def get_top_100_market_cap_stocks() -> pd.DataFrame:
     """
-    시가총액 상위 100개 종목 정보를 반환합니다.
+    시가총액 상위 100개 종목 정보를 반환합니다. (rank_stocks의 기본 조회)
     """
     key = "top_100"
     try:
-        df_final = _load_top_100_market_cap_stocks()
+        frame = get_market_frame()
+        if frame.empty:
+            raise RuntimeError(get_last_data_error("market_frame") or "Empty market frame")
+        df_final = rank_stocks(limit=100, frame=frame)[["종목코드", "이름", "현재가", "등락률", "시가총액"]]
         result = _remember_result(key, df_final)
         _record_error(key, None)
         return result
@@ -310,29 +667,179 @@ def get_top_100_market_cap_stocks() -> pd.DataFrame:
         return _fallback_result(key, pd.DataFrame())
 
 
-@cache_data_or_lru(show_spinner=False, ttl=60 * 60 * 6)
-def get_stock_name_ticker_map() -> Dict[str, str]:
+def _build_ticker_catalog() -> TickerCatalog:
+    # 시장별 전종목 시세 한 번으로 티커/종목명을 일괄 수집합니다. (종목당 개별 호출 없음)
+    trading_date = _krx_call(stock.get_nearest_business_day_in_a_week)
+    names: Dict[str, str] = {}
+    markets: Dict[str, str] = {}
+    for market in CATALOG_MARKETS:
+        listing = _krx_call(krx.get_market_ticker_and_name, trading_date, market)
+        names.update(listing.to_dict())
+        markets.update({ticker: market for ticker in listing.index})
+    return TickerCatalog(trading_date=trading_date, names=names, markets=markets)
+
+
+_TICKER_CATALOG = TickerCatalogStore(TICKER_CATALOG_FILE, _build_ticker_catalog)
+
+
+def refresh_ticker_catalog(force: bool = False) -> TickerCatalog:
     """
-    종목명-티커 매핑을 캐싱하여 반환합니다.
+    카탈로그가 오래되었거나 force=True이면 동기적으로 다시 생성합니다. (스케줄러용)
+    """
+    catalog = None if force else _TICKER_CATALOG.load()
+    if catalog is not None and not _TICKER_CATALOG.is_stale(catalog):
+        return catalog
+    return _TICKER_CATALOG.refresh()
+
+
+def get_ticker_catalog() -> Optional[TickerCatalog]:
+    """
+    디스크에 보관된 종목 카탈로그를 반환합니다. 날짜가 바뀌면 백그라운드에서 재생성합니다.
     """
     key = "name_ticker_map"
     try:
-        tickers_kospi = stock.get_market_ticker_list(market="KOSPI")
-        tickers_kosdaq = stock.get_market_ticker_list(market="KOSDAQ")
-        all_tickers = tickers_kospi + tickers_kosdaq
-        name_ticker_map = {stock.get_market_ticker_name(ticker): ticker for ticker in all_tickers}
-        result = _remember_result(key, name_ticker_map)
+        catalog = _TICKER_CATALOG.get()
         _record_error(key, None)
-        return result
+        return catalog
     except Exception as exc:
-        logger.warning("get_stock_name_ticker_map failed", exc_info=exc)
+        logger.warning("get_ticker_catalog failed", exc_info=exc)
         _record_error(key, str(exc))
-        return _fallback_result(key, {})
+        return None
+
+
+def get_stock_name_ticker_map() -> Mapping[str, str]:
+    """
+    종목명-티커 매핑을 반환합니다. (읽기 전용)
+    """
+    catalog = get_ticker_catalog()
+    return catalog.name_to_ticker if catalog is not None else {}
+
+
+def get_ticker_name(ticker: str) -> Optional[str]:
+    catalog = get_ticker_catalog()
+    return catalog.ticker_to_name.get(ticker) if catalog is not None else None
+
+
+def get_market_tickers(market: str) -> List[str]:
+    """
+    카탈로그 기준 시장(KOSPI/KOSDAQ) 소속 티커 목록을 반환합니다.
+    """
+    catalog = get_ticker_catalog()
+    return catalog.tickers_in(market) if catalog is not None else []
+
+
+def _fetch_market_cross_section(date: str) -> pd.DataFrame:
+    # 달력상 거래일인데 빈 단면이면 휴장일로 기록하지 않고 실패로 처리합니다.
+    return _krx_call(
+        stock.get_market_ohlcv_by_ticker, date, market="ALL", expect_data=KRX_CALENDAR.is_session(date)
+    )
+
+
+def _is_session_closed(date: str) -> bool:
+    return pd.Timestamp(date).date() <= last_market_close().date()
+
+
+def _closed_sessions_since(start: datetime) -> pd.DatetimeIndex:
+    return KRX_CALENDAR.sessions(start, last_market_close().date())
+
+
+def ingest_market_day(date: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    하루치 전 종목 일봉 단면을 pykrx 한 번 호출로 받아 패널에 적재합니다.
+    장 마감 전 데이터는 저장하지 않고 결과만 반환하며, 휴장일이면 None을 반환합니다.
+    """
+    day = date or _krx_call(stock.get_nearest_business_day_in_a_week)
+    persist = _is_session_closed(day)
+    frame = _MARKET_PANEL.ingest_day(day, _fetch_market_cross_section, persist=persist)
+    if frame is None and persist:
+        KRX_CALENDAR.add_holidays([day])
+    return frame
+
+
+def backfill_market_panel(lookback_days: int = STOCK_HISTORY_LOOKBACK_DAYS) -> Dict[str, int]:
+    """
+    최근 lookback_days 동안 누락된 거래일을 하루 한 번의 호출로 채웁니다.
+    새 배포에서도 스크리너·백테스트가 쓸 이력이 있도록 워머가 주기적으로 실행하며,
+    채우지 못한 날짜가 있으면 market_panel 오류로 기록합니다. (다음 실행에서 그 날짜만 다시 시도)
+    """
+    key = "market_panel"
+    start = datetime.now() - timedelta(days=lookback_days)
+    summary = _MARKET_PANEL.backfill(_closed_sessions_since(start), _fetch_market_cross_section)
+    KRX_CALENDAR.add_holidays(_MARKET_PANEL.holidays())
+    if summary["failed"]:
+        _record_error(key, f"{summary['failed']} of {summary['requested']} sessions failed to backfill")
+    else:
+        _record_error(key, None)
+    return summary
+
+
+def get_market_panel(field: str = "종가", lookback_days: int = STOCK_HISTORY_LOOKBACK_DAYS) -> pd.DataFrame:
+    """
+    저장된 패널에서 지정 필드의 날짜×티커 데이터프레임을 반환합니다. (업스트림 호출 없음)
+    """
+    start = datetime.now() - timedelta(days=lookback_days)
+    return _MARKET_PANEL.load_panel(field, start=start)
+
+
+def _backtest_panels(
+    lookback_days: int, tickers: Optional[Sequence[str]]
+) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+    close = get_market_panel("종가", lookback_days)
+    if tickers:
+        close = close.reindex(columns=[str(ticker) for ticker in tickers])
+    changes = get_market_panel("등락률", lookback_days)
+    returns = changes.reindex_like(close) / 100 if not changes.empty and not close.empty else None
+    return close, returns
+
+
+def run_strategy_backtest(
+    strategy: str = "ma_crossover",
+    params: Optional[Mapping[str, Any]] = None,
+    lookback_days: int = BACKTEST_LOOKBACK_DAYS,
+    tickers: Optional[Sequence[str]] = None,
+    cost_bps: float = DEFAULT_COST_BPS,
+) -> Optional[BacktestResult]:
+    """
+    저장된 전 종목 패널로 전략 하나를 백테스트합니다. (업스트림 호출 없음)
+    패널 종가는 수정 전 가격이므로 등락률을 누적한 수정 가격으로 신호와 손익을 계산하고, 패널이 비어 있으면 None을 반환합니다.
+    """
+    close, returns = _backtest_panels(lookback_days, tickers)
+    if close.empty:
+        return None
+    return run_backtest(close, strategy, params, returns=returns, cost_bps=cost_bps)
+
+
+def run_strategy_sweep(
+    grid: Sequence[Mapping[str, Any]],
+    strategy: str = "ma_crossover",
+    lookback_days: int = BACKTEST_LOOKBACK_DAYS,
+    tickers: Optional[Sequence[str]] = None,
+    cost_bps: float = DEFAULT_COST_BPS,
+    processes: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    저장된 전 종목 패널로 파라미터 조합별 백테스트를 프로세스 풀에서 돌려 성과 표를 반환합니다. (업스트림 호출 없음)
+    """
+    close, returns = _backtest_panels(lookback_days, tickers)
+    started = time.perf_counter()
+    results = sweep(close, grid, strategy, returns=returns, cost_bps=cost_bps, processes=processes)
+    logger.info(
+        "Strategy sweep finished",
+        extra={
+            "strategy": strategy,
+            "combinations": len(grid),
+            "shape": list(close.shape),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    )
+    return results
 
 
 def get_stock_info_by_name(stock_name: str) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     """
-    종목명을 기준으로 1년간의 일별 OHLCV 데이터를 반환합니다.
+    종목명을 기준으로 1년간의 일별 OHLCV 데이터(수정주가)를 반환합니다.
+    종목별 Parquet 저장소에서 마지막 저장일 이후의 봉만 pykrx로 보충합니다. 전 종목 패널은 수정 전 가격이라
+    액면분할이 급락처럼 보이므로, 패널 적용 여부나 시간대에 따라 값이 달라지지 않도록 이 저장소만 씁니다.
     """
     name_ticker_map = get_stock_name_ticker_map()
     ticker = name_ticker_map.get(stock_name)
@@ -341,15 +848,23 @@ def get_stock_info_by_name(stock_name: str) -> Tuple[Optional[pd.DataFrame], Opt
         return None, None
 
     key = f"stock_info::{ticker}"
+    today = datetime.now()
+    start = today - timedelta(days=STOCK_HISTORY_LOOKBACK_DAYS)
     try:
-        today = datetime.now()
-        start_date = (today - timedelta(days=365)).strftime("%Y%m%d")
-        today_str = today.strftime("%Y%m%d")
-
-        df = stock.get_market_ohlcv_by_date(start_date, today_str, ticker)
+        df = _OHLCV_STORE.sync(
+            ticker,
+            lambda fromdate, todate: _krx_call(
+                stock.get_market_ohlcv_by_date, fromdate, todate, ticker, expect_data=False
+            ),
+            start=start,
+            end=today,
+        )
+        if df.empty:
+            raise RuntimeError("Empty OHLCV history")
+        df = df.copy()
         df.index = df.index.strftime("%Y-%m-%d")
 
-        return _remember_result(key, df), ticker
+        return _remember_result(key, df, version=_frame_version(df)), ticker
     except Exception as exc:
         logger.warning(
             "get_stock_info_by_name failed",
@@ -358,52 +873,144 @@ def get_stock_info_by_name(stock_name: str) -> Tuple[Optional[pd.DataFrame], Opt
         fallback = _fallback_result(key, None)
         if fallback is not None:
             return fallback, ticker
+        stored = _OHLCV_STORE.read(ticker, start=start, end=today)
+        if not stored.empty:
+            stored = stored.copy()
+            stored.index = stored.index.strftime("%Y-%m-%d")
+            return stored, ticker
         return None, ticker
 
 
-def search_stocks_by_keyword(keyword: str) -> List[str]:
+_SEARCH_INDEX_LOCK = threading.Lock()
+_SEARCH_INDEX: Optional[Tuple[Mapping[str, str], StockSearchIndex]] = None
+
+
+def _get_search_index() -> StockSearchIndex:
+    global _SEARCH_INDEX
+    name_ticker_map = get_stock_name_ticker_map()
+    cached = _SEARCH_INDEX
+    if cached is not None and cached[0] is name_ticker_map:
+        return cached[1]
+    with _SEARCH_INDEX_LOCK:
+        cached = _SEARCH_INDEX
+        if cached is not None and cached[0] is name_ticker_map:
+            return cached[1]
+        index = StockSearchIndex(name_ticker_map.items())
+        _SEARCH_INDEX = (name_ticker_map, index)
+        return index
+
+
+def search_stocks(keyword: str, limit: Optional[int] = None) -> List[SearchHit]:
     """
-    키워드를 포함하는 종목명 리스트를 반환합니다.
+    카탈로그 기반 검색 인덱스로 순위가 매겨진 종목 검색 결과를 반환합니다.
+    접두어, 부분 문자열, 초성(예: "ㅅㅅㅈㅈ"), 티커, 영문 별칭과 오타를 지원합니다.
     """
-    name_ticker_map = get_stock_name_ticker_map()
-    keyword_lower = keyword.lower()
-    return [name for name in name_ticker_map.keys() if keyword_lower in name.lower()]
+    return _get_search_index().search(keyword, limit=limit)
 
 
-@cache_data_or_lru(ttl=900, show_spinner=False)
-def get_financial_ratios(ticker: str) -> Dict[str, Any]:
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _stock_indicators(stock_name: str) -> pd.DataFrame:
+    stock_df, _ticker = get_stock_info_by_name(stock_name)
+    if stock_df is None or stock_df.empty:
+        raise LookupError(f"No price history for {stock_name}")
+    return compute_indicators(prepare_price_frame(stock_df))
+
+
+def get_stock_indicators(stock_name: str) -> pd.DataFrame:
     """
-    최신 재무 지표를 반환합니다.
+    1년 일봉에 이동평균·EMA·RSI·MACD·볼린저 밴드·ATR·OBV·스토캐스틱 컬럼을 붙여 반환합니다.
+    종목별로 캐시되므로 화면을 다시 그리거나 에이전트가 다시 물어도 재계산하지 않습니다.
+    """
+    try:
+        return _stock_indicators(stock_name)
+    except Exception as exc:
+        logger.warning("get_stock_indicators failed", extra={"stock": stock_name, "error": str(exc)})
+        return pd.DataFrame()
+
+
+def get_technical_summary(stock_name: str) -> Dict[str, Optional[float]]:
+    """
+    get_stock_indicators의 마지막 봉 기준 지표 요약(이동평균 괴리율, 52주 고저, RSI, MACD 등)을 반환합니다.
+    """
+    enriched = get_stock_indicators(stock_name)
+    if enriched.empty:
+        return {}
+    return {**compute_indicator_snapshot(enriched), **summarize_indicators(enriched)}
+
+
+def search_stocks_by_keyword(keyword: str, limit: Optional[int] = None) -> List[str]:
     """
-    key = f"ratios::{ticker}"
+    키워드와 일치하는 종목명 리스트를 관련도 순으로 반환합니다.
+    """
+    return [hit.name for hit in search_stocks(keyword, limit=limit)]
+
+
+@cached(ttl=MarketHoursTTL(intraday=600), shared=True, show_spinner=False)
+def _latest_business_day() -> str:
+    return _krx_call(stock.get_nearest_business_day_in_a_week)
+
+
+@cached(ttl=60 * 60 * 24, shared=True, show_spinner=False)
+def _load_market_fundamentals(business_day: str) -> pd.DataFrame:
+    df = _krx_call(stock.get_market_fundamental_by_ticker, business_day, market="ALL")
+    if df.empty:
+        raise RuntimeError("Empty fundamentals data")
+    return df
+
+
+# 영업일 단위 전 종목 재무지표 (티커 → 지표 딕셔너리), 마지막 정상값을 fallback으로도 사용
+_FUNDAMENTALS_LOCK = threading.Lock()
+_FUNDAMENTALS: Dict[str, Any] = {"business_day": None, "frame": None, "records": {}}
+
+
+def _get_fundamentals_snapshot() -> Dict[str, Any]:
+    key = "market_fundamentals"
     try:
-        latest_day = stock.get_nearest_business_day_in_a_week()
-        df = stock.get_market_fundamental_by_ticker(latest_day)
-        ratios = df.loc[ticker].to_dict()
-        result = _remember_result(key, ratios)
+        business_day = _latest_business_day()
+        with _FUNDAMENTALS_LOCK:
+            if _FUNDAMENTALS["business_day"] == business_day:
+                return dict(_FUNDAMENTALS)
+
+        frame = freeze(_load_market_fundamentals(business_day))
+        records = frame.to_dict(orient="index")
+        with _FUNDAMENTALS_LOCK:
+            _FUNDAMENTALS.update(business_day=business_day, frame=frame, records=records)
+            snapshot = dict(_FUNDAMENTALS)
         _record_error(key, None)
-        return result
+        return snapshot
     except Exception as exc:
-        logger.warning(
-            "get_financial_ratios failed", extra={"ticker": ticker, "error": str(exc)}
-        )
+        logger.warning("Failed to load market fundamentals", extra={"error": str(exc)})
         _record_error(key, str(exc))
-        return _fallback_result(key, {})
+        with _FUNDAMENTALS_LOCK:
+            return dict(_FUNDAMENTALS)
+
+
+def get_market_fundamentals() -> pd.DataFrame:
+    """
+    최신 영업일의 전 종목 재무지표(BPS/PER/PBR/EPS/DIV/DPS) 프레임을 반환합니다.
+    영업일당 한 번만 내려받으며, 값 배열이 쓰기 금지인 얕은 뷰를 돌려줍니다.
+    """
+    frame = _get_fundamentals_snapshot()["frame"]
+    return _share(frame) if frame is not None else pd.DataFrame()
 
 
-def _throttle_news_requests() -> None:
-    global _LAST_NEWS_TIMESTAMP
-    with _NEWS_LOCK:
-        now = time.time()
-        wait_for = _NEWS_MIN_INTERVAL - (now - _LAST_NEWS_TIMESTAMP)
-        if wait_for > 0:
-            time.sleep(wait_for)
-        _LAST_NEWS_TIMESTAMP = time.time()
+def get_financial_ratios_batch(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 종목의 최신 재무 지표를 한 번에 반환합니다. 찾지 못한 종목은 빈 딕셔너리입니다.
+    """
+    records = _get_fundamentals_snapshot()["records"]
+    return {ticker: dict(records.get(ticker) or {}) for ticker in tickers}
+
+
+def get_financial_ratios(ticker: str) -> Dict[str, Any]:
+    """
+    최신 재무 지표를 반환합니다.
+    """
+    return get_financial_ratios_batch([ticker])[ticker]
 
 
 def _search_news_raw(keyword: str) -> List[Dict[str, str]]:
-    _throttle_news_requests()
-    with DDGS() as ddgs:
+    with circuit_breaker.DDG.guard(), rate_limit.DDG.slot(), DDGS() as ddgs:
         results = list(
             ddgs.news(
                 keywords=f"{keyword} 주가",
@@ -427,33 +1034,59 @@ def _search_news_raw(keyword: str) -> List[Dict[str, str]]:
     ]
 
 
-@cache_data_or_lru(ttl=300, show_spinner=False)
-def search_news(stock_name: str) -> List[Dict[str, str]]:
-    """
-    DuckDuckGo Search를 이용해 최신 뉴스를 검색합니다.
-    동일 쿼리 반복 시 캐싱해 외부 API 호출량을 줄입니다.
-    """
+def _fetch_and_store_news(stock_name: str) -> List[Dict[str, str]]:
     try:
-        return _search_news_raw(stock_name)
+        return _NEWS_STORE.put(stock_name, _search_news_raw(stock_name))
+    except rate_limit.RateLimitExceeded:
+        raise
     except Exception as exc:
         logger.warning(
             "search_news failed", extra={"stock_name": stock_name, "error": str(exc)}
         )
-        return []
+        # 업스트림 장애 시 만료된 저장 결과라도 반환합니다.
+        return _NEWS_STORE.get(stock_name, max_age=float("inf")) or []
 
 
-def search_news_batch(queries: List[str]) -> Dict[str, List[Dict[str, str]]]:
+# 프로세스 캐시도 뉴스 저장소와 같은 주기로 만료시켜, 저장소 TTL(GIFT_NEWS_TTL) 하나로 두 계층을 맞춥니다.
+@cached(ttl=NEWS_TTL, show_spinner=False)
+def search_news(stock_name: str) -> Sequence[Mapping[str, str]]:
+    """
+    DuckDuckGo Search를 이용해 최신 뉴스를 검색합니다. 캐시와 공유되는 읽기 전용 시퀀스입니다.
+    프로세스 간에 공유되는 뉴스 저장소를 먼저 확인하고, 없거나 만료된 경우에만 업스트림을 호출합니다.
+    마감 시각(deadline_scope) 안에 요청 슬롯을 얻지 못하면 결과를 캐시하지 않고 RateLimitExceeded를 던집니다.
+    """
+    stored = _NEWS_STORE.get(stock_name)
+    if stored is not None:
+        return stored
+    return _fetch_and_store_news(stock_name)
+
+
+def search_news_batch(
+    queries: List[str], timeout: Optional[float] = None
+) -> Dict[str, Sequence[Mapping[str, str]]]:
     """
     여러 키워드에 대해 동시에 뉴스를 검색합니다.
     각 쿼리별 결과 리스트를 딕셔너리로 반환합니다.
+    뉴스 저장소에 유효한 결과가 있는 쿼리는 한 번의 조회로 채우고, 나머지만 업스트림에서 병렬로 가져옵니다.
+    동시 실행 수는 DDG 요청 한도가 허용하는 만큼이며, timeout(초) 안에 시작하지 못한 쿼리는 빈 리스트가 됩니다.
     """
     unique_queries: List[str] = list(dict.fromkeys(q for q in queries if q))
     if not unique_queries:
         return {}
 
-    results: Dict[str, List[Dict[str, str]]] = {}
-    with ThreadPoolExecutor(max_workers=min(len(unique_queries), 3)) as executor:
-        futures = {executor.submit(search_news, query): query for query in unique_queries}
+    results: Dict[str, Sequence[Mapping[str, str]]] = _NEWS_STORE.get_many(unique_queries)
+    missing = [query for query in unique_queries if query not in results]
+    if not missing:
+        return results
+
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    def _search(query: str) -> Sequence[Mapping[str, str]]:
+        with rate_limit.deadline_scope(deadline):
+            return search_news(query)
+
+    with ThreadPoolExecutor(max_workers=min(len(missing), NEWS_BATCH_MAX_WORKERS)) as executor:
+        futures = {executor.submit(_search, query): query for query in missing}
         for future in as_completed(futures):
             query = futures[future]
             try:
@@ -468,41 +1101,32 @@ def search_news_batch(queries: List[str]) -> Dict[str, List[Dict[str, str]]]:
     return results
 
 
-@cache_data_or_lru(ttl=900, show_spinner=False)
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
 def get_sector_performance(top_n: int = 5) -> pd.DataFrame:
     """
     주도 섹터의 하루 등락률을 계산해 반환합니다.
+    섹터 표와 같은 당일 지수 단면(시장별 일괄 등락률 조회)에서 골라내므로 섹터별 개별 호출이 없습니다.
     """
     key = f"sector_performance::{top_n}"
     try:
-        reference_day = stock.get_nearest_business_day_in_a_week()
-        start_date = (datetime.now() - timedelta(days=10)).strftime("%Y%m%d")
-        end_date = reference_day
-
-        rows: List[Dict[str, Any]] = []
-        with ThreadPoolExecutor(max_workers=min(4, len(_SECTOR_CANDIDATES))) as executor:
-            futures = {
-                executor.submit(
-                    _load_sector_snapshot, sector_name, start_date, end_date, reference_day
-                ): sector_name
-                for sector_name in _SECTOR_CANDIDATES
-            }
-            for future in as_completed(futures):
-                sector_name = futures[future]
-                try:
-                    snapshot = future.result()
-                    if snapshot:
-                        rows.append(snapshot)
-                except Exception as inner_exc:
-                    logger.warning(
-                        "Failed to load sector data",
-                        extra={"sector": sector_name, "error": str(inner_exc)},
-                    )
-
-        if not rows:
+        day = _latest_business_day()
+        today = _index_day(day)
+        names = get_index_catalog()["지수명"].reindex(today.index)
+        picked = today[names.isin(_SECTOR_CANDIDATES)]
+        if picked.empty:
             raise RuntimeError("No sector data retrieved")
 
-        df = pd.DataFrame(rows)
+        close = picked["종가"].astype(float)
+        change = picked["등락률"].astype(float)
+        previous = close / (1 + change / 100)
+        df = pd.DataFrame(
+            {
+                "섹터": names.reindex(picked.index).values,
+                "현재가": close.values,
+                "전일대비": (close - previous).values,
+                "등락률(%)": change.values,
+            }
+        )
         df.sort_values("등락률(%)", ascending=False, inplace=True)
         df.reset_index(drop=True, inplace=True)
         result = _remember_result(key, df.head(top_n))
@@ -514,67 +1138,492 @@ def get_sector_performance(top_n: int = 5) -> pd.DataFrame:
         return _fallback_result(key, pd.DataFrame())
 
 
-@cache_data_or_lru(ttl=600, show_spinner=False)
-def get_global_market_snapshot() -> List[Dict[str, Any]]:
+def _fetch_index_cross_section(date: str) -> pd.DataFrame:
+    # 시장별 일괄 등락률(지수명 기준) 조회 결과를 카탈로그로 지수 코드에 맞춰 하나로 합칩니다.
+    catalog = get_index_catalog()
+    if catalog.empty:
+        raise RuntimeError("Index catalog unavailable")
+    frames: List[pd.DataFrame] = []
+    for market in SECTOR_INDEX_MARKETS:
+        changes = _krx_call(
+            stock.get_index_price_change, date, date, market, expect_data=KRX_CALENDAR.is_session(date)
+        )
+        if changes is None or changes.empty:
+            continue
+        names = catalog.loc[catalog["시장"] == market, "지수명"]
+        name_to_ticker = pd.Series(names.index, index=names.values)
+        name_to_ticker = name_to_ticker[~name_to_ticker.index.duplicated()]
+        changes = changes.copy()
+        changes.index = changes.index.map(name_to_ticker)
+        frames.append(changes[changes.index.notna()])
+    if not frames:
+        return pd.DataFrame()
+    frame = pd.concat(frames)
+    return frame[~frame.index.duplicated()]
+
+
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _index_day(business_day: str) -> pd.DataFrame:
+    # 당일 전 지수 단면입니다. 섹터 표와 주도 섹터가 같은 단면을 공유하며, 장 마감 후에는 패널에 저장된 파일을 읽습니다.
+    today = _INDEX_PANEL.ingest_day(
+        business_day, _fetch_index_cross_section, persist=_is_session_closed(business_day)
+    )
+    if today is None or today.empty:
+        raise RuntimeError("No sector index data retrieved")
+    return today
+
+
+def refresh_index_day() -> pd.DataFrame:
+    """
+    캐시 상태와 관계없이 최근 거래일의 전 지수 단면을 다시 받습니다. (섹터 표·주도 섹터를 갱신하기 전에 호출)
+    """
+    return _index_day.refresh(_latest_business_day())
+
+
+def backfill_index_panel(lookback_days: int = SECTOR_HISTORY_LOOKBACK_DAYS) -> Dict[str, int]:
+    """
+    최근 lookback_days 동안 지수 패널에 누락된 거래일을 채웁니다. (거래일당 시장 수만큼 호출)
+    """
+    start = datetime.now() - timedelta(days=lookback_days)
+    return _INDEX_PANEL.backfill(_closed_sessions_since(start), _fetch_index_cross_section)
+
+
+def _session_before(day: pd.Timestamp, sessions: int) -> pd.Timestamp:
+    base = day.date()
+    for _ in range(sessions):
+        base = KRX_CALENDAR.previous_session(base, inclusive=False)
+    return pd.Timestamp(base)
+
+
+def _build_sector_table(today: pd.DataFrame, closes: pd.DataFrame, catalog: pd.DataFrame) -> pd.DataFrame:
+    # closes는 당일 행을 포함한 날짜×지수 종가 패널입니다. 1D는 KRX 공식 등락률을, 나머지는 저장된 종가를 씁니다.
+    # 기준일은 거래일 달력으로 정하고, 패널에 그날이 빠져 있으면 그 이전 마지막 저장 종가(asof)를 씁니다.
+    closes = closes.sort_index()
+    day = closes.index[-1]
+    table = pd.DataFrame(index=today.index)
+    table["섹터"] = catalog["지수명"].reindex(table.index)
+    table["시장"] = catalog["시장"].reindex(table.index)
+    table["현재가"] = today["종가"]
+    for label, sessions in SECTOR_RETURN_PERIODS.items():
+        if label == "1D" and "등락률" in today.columns:
+            table[f"{label}(%)"] = today["등락률"].astype(float)
+            continue
+        stored = closes.loc[: _session_before(day, sessions)]
+        if stored.empty:
+            table[f"{label}(%)"] = float("nan")
+            continue
+        base = stored.ffill().iloc[-1].reindex(table.index)
+        table[f"{label}(%)"] = (table["현재가"] / base.where(base != 0) - 1) * 100
+    table = table[table["섹터"].notna()]
+    table.index.name = "티커"
+    return table.sort_values("1D(%)", ascending=False).reset_index()
+
+
+@cached(ttl=KRX_INTRADAY_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def get_sector_table() -> pd.DataFrame:
     """
-    글로벌 선물/환율 스냅샷을 반환합니다.
+    KRX·KOSPI·KOSDAQ 전체 지수의 현재가와 1D/1W/1M 수익률(%)을 반환합니다.
+    당일 단면은 시장별 일괄 등락률 조회로 받고, 1W/1M 수익률은 지수 패널에 저장된 종가 이력으로 계산합니다.
     """
+    key = "sector_table"
+    try:
+        backfill_index_panel()
+        day = _latest_business_day()
+        today = _index_day(day)
+        start = datetime.now() - timedelta(days=SECTOR_HISTORY_LOOKBACK_DAYS)
+        history = _INDEX_PANEL.load_panel("종가", start=start)
+        day_ts = pd.Timestamp(day)
+        if not history.empty:
+            history = history[history.index < day_ts]
+        today_row = today["종가"].rename(day_ts).to_frame().T
+        closes = pd.concat([history, today_row]) if not history.empty else today_row
+        table = _build_sector_table(today, closes, get_index_catalog())
+        result = _remember_result(key, table)
+        _record_error(key, None)
+        return result
+    except Exception as exc:
+        logger.warning("get_sector_table failed", exc_info=exc)
+        _record_error(key, str(exc))
+        return _fallback_result(key, pd.DataFrame())
+
+
+_YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
+
+def _global_quote_params() -> Dict[str, Any]:
+    return {"symbols": ",".join(_GLOBAL_SYMBOLS.values())}
+
+
+def _store_global_snapshot(payload: Dict[str, Any]) -> Sequence[Mapping[str, Any]]:
+    results = payload.get("quoteResponse", {}).get("result", [])
+
+    snapshot: List[Dict[str, Any]] = []
+    for label, symbol in _GLOBAL_SYMBOLS.items():
+        quote = next((item for item in results if item.get("symbol") == symbol), {})
+        if not quote:
+            continue
+        price = quote.get("regularMarketPrice")
+        change = quote.get("regularMarketChange")
+        change_pct = quote.get("regularMarketChangePercent")
+        snapshot.append(
+            {
+                "label": label,
+                "price": price,
+                "change": change,
+                "change_pct": change_pct,
+                "source": "Yahoo Finance",
+                "timestamp": quote.get("regularMarketTime"),
+            }
+        )
+
+    if not snapshot:
+        raise RuntimeError("Empty snapshot response")
+
+    result = _remember_result("global_market_snapshot", snapshot)
+    _record_error("global_market_snapshot", None)
+    return result
+
+
+def _global_snapshot_fallback(exc: Exception) -> Sequence[Mapping[str, Any]]:
     key = "global_market_snapshot"
+    logger.warning("get_global_market_snapshot failed", exc_info=exc)
+    _record_error(key, str(exc))
+    fallback = _fallback_result(key, None, max_age=GLOBAL_SNAPSHOT_CACHE_TTL)
+    if fallback:
+        return fallback
+    return freeze(_build_global_snapshot_placeholder())
+
+
+@cached(ttl=GLOBAL_SNAPSHOT_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def get_global_market_snapshot() -> Sequence[Mapping[str, Any]]:
+    """
+    글로벌 선물/환율 스냅샷을 반환합니다. 캐시와 공유되는 읽기 전용 시퀀스입니다.
+    """
     try:
-        payload = _request_with_retry(
-            "https://query1.finance.yahoo.com/v7/finance/quote",
-            params={"symbols": ",".join(_GLOBAL_SYMBOLS.values())},
+        payload = _request_with_retry(_YAHOO_QUOTE_URL, params=_global_quote_params())
+        return _store_global_snapshot(payload)
+    except Exception as exc:
+        return _global_snapshot_fallback(exc)
+
+
+@get_global_market_snapshot.async_loader
+async def get_global_market_snapshot_async() -> Sequence[Mapping[str, Any]]:
+    """
+    get_global_market_snapshot의 네이티브 비동기 버전입니다.
+    공유 httpx.AsyncClient로 요청하고 재시도 대기도 이벤트 루프를 막지 않습니다.
+    캐시를 거치려면 get_global_market_snapshot.aio()를 사용하세요.
+    """
+    try:
+        payload = await request_json_with_retry(
+            _YAHOO_QUOTE_URL,
+            params=_global_quote_params(),
+            limiter=rate_limit.YAHOO,
+            breaker=circuit_breaker.YAHOO,
         )
-        results = payload.get("quoteResponse", {}).get("result", [])
+        return _store_global_snapshot(payload)
+    except Exception as exc:
+        return _global_snapshot_fallback(exc)
 
-        snapshot: List[Dict[str, Any]] = []
-        for label, symbol in _GLOBAL_SYMBOLS.items():
-            quote = next((item for item in results if item.get("symbol") == symbol), {})
-            if not quote:
-                continue
-            price = quote.get("regularMarketPrice")
-            change = quote.get("regularMarketChange")
-            change_pct = quote.get("regularMarketChangePercent")
-            snapshot.append(
-                {
-                    "label": label,
-                    "price": price,
-                    "change": change,
-                    "change_pct": change_pct,
-                    "source": "Yahoo Finance",
-                    "timestamp": quote.get("regularMarketTime"),
-                }
-            )
 
-        if not snapshot:
-            raise RuntimeError("Empty snapshot response")
+# 관심 종목 전체 시세: 청크당 한 번의 quote 요청을 병렬로 보냅니다.
+_YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v7/finance/spark"
+GLOBAL_QUOTE_CHUNK_SIZE = 50
+GLOBAL_QUOTE_MAX_WORKERS = 4
+_GLOBAL_QUOTE_COLUMNS = ["label", "group", "price", "change", "change_pct", "currency", "market_state", "timestamp"]
 
-        _save_persistent_snapshot(snapshot)
-        result = _remember_result(key, snapshot)
-        _record_error(key, None)
-        return result
+# 장중 스파크라인: 청크(최대 20개)당 한 번의 spark 요청으로 가져와 시리즈별 TTL로 캐시합니다.
+SPARKLINE_CHUNK_SIZE = 20
+SPARKLINE_RANGE = "1d"
+SPARKLINE_INTERVAL = "5m"
+# 마지막 봉이 오래된(휴장 중인) 시리즈는 이 시간 동안 유지합니다.
+SPARKLINE_IDLE_TTL = 60 * 60
+_SPARKLINE_NAMESPACE = f"{__name__}.sparkline"
+_INTERVAL_SECONDS = {"1m": 60, "2m": 120, "5m": 300, "15m": 900, "30m": 1800, "60m": 3600, "1h": 3600, "1d": 86400}
+
+
+def get_watchlist(groups: Optional[Iterable[str]] = None) -> Tuple[WatchSymbol, ...]:
+    """
+    설정된 관심 종목 목록을 반환합니다. groups를 주면 해당 구분만 남깁니다.
+    """
+    if groups is None:
+        return WATCHLIST
+    wanted = set(groups)
+    return tuple(item for item in WATCHLIST if item.group in wanted)
+
+
+def _quote_chunks() -> List[Sequence[str]]:
+    return chunked([item.symbol for item in WATCHLIST], GLOBAL_QUOTE_CHUNK_SIZE)
+
+
+def _assemble_global_quotes(chunks: Sequence[Sequence[str]], outcomes: Sequence[Any]) -> pd.DataFrame:
+    """
+    청크별 응답(또는 예외)을 관심 종목 순서의 프레임으로 합칩니다.
+    일부 청크가 실패하면 해당 심볼은 이전 정상값으로 채우고, 모두 실패하면 예외를 던집니다.
+    """
+    key = "global_quotes"
+    quotes: Dict[str, Dict[str, Any]] = {}
+    failed: List[str] = []
+    errors: List[str] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, BaseException):
+            failed.extend(chunk)
+            errors.append(str(outcome))
+            continue
+        for quote in outcome.get("quoteResponse", {}).get("result", []) or []:
+            if quote.get("symbol"):
+                quotes[quote["symbol"]] = quote
+    if not quotes:
+        raise RuntimeError(errors[0] if errors else "Empty quote response")
+
+    previous = _LAST_SUCCESS_CACHE.get(key)
+    rows: List[Dict[str, Any]] = []
+    for item in WATCHLIST:
+        quote = quotes.get(item.symbol)
+        if quote is None:
+            if previous is not None and item.symbol in previous.index:
+                rows.append({"symbol": item.symbol, **previous.loc[item.symbol].to_dict()})
+            continue
+        rows.append(
+            {
+                "symbol": item.symbol,
+                "label": item.label,
+                "group": item.group,
+                "price": quote.get("regularMarketPrice"),
+                "change": quote.get("regularMarketChange"),
+                "change_pct": quote.get("regularMarketChangePercent"),
+                "currency": quote.get("currency"),
+                "market_state": quote.get("marketState"),
+                "timestamp": quote.get("regularMarketTime"),
+            }
+        )
+    frame = pd.DataFrame(rows, columns=["symbol", *_GLOBAL_QUOTE_COLUMNS]).set_index("symbol")
+    result = _remember_result(key, frame)
+    _record_error(key, f"{len(failed)} symbols unavailable: {errors[0]}" if failed else None)
+    return result
+
+
+def _global_quotes_fallback(exc: Exception) -> pd.DataFrame:
+    key = "global_quotes"
+    logger.warning("get_global_quotes failed", exc_info=exc)
+    _record_error(key, str(exc))
+    return _fallback_result(key, pd.DataFrame(columns=_GLOBAL_QUOTE_COLUMNS))
+
+
+@cached(ttl=GLOBAL_SNAPSHOT_TTL, stale_ttl=DASHBOARD_STALE_TTL, shared=True, show_spinner=False)
+def _global_quote_table() -> pd.DataFrame:
+    chunks = _quote_chunks()
+
+    def _fetch(chunk: Sequence[str]) -> Any:
+        try:
+            return _request_with_retry(_YAHOO_QUOTE_URL, params={"symbols": ",".join(chunk)})
+        except Exception as exc:
+            return exc
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(GLOBAL_QUOTE_MAX_WORKERS, len(chunks)))) as executor:
+            outcomes = list(executor.map(_fetch, chunks))
+        return _assemble_global_quotes(chunks, outcomes)
     except Exception as exc:
-        logger.warning("get_global_market_snapshot failed", exc_info=exc)
-        _record_error(key, str(exc))
-        fallback = _fallback_result(key, None)
-        if fallback:
-            return fallback
-        persistent = _load_persistent_snapshot()
-        if persistent:
-            return persistent
-        return _build_global_snapshot_placeholder()
+        return _global_quotes_fallback(exc)
+
+
+@_global_quote_table.async_loader
+async def _global_quote_table_async() -> pd.DataFrame:
+    chunks = _quote_chunks()
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                request_json_with_retry(
+                    _YAHOO_QUOTE_URL,
+                    params={"symbols": ",".join(chunk)},
+                    limiter=rate_limit.YAHOO,
+                    breaker=circuit_breaker.YAHOO,
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        return _assemble_global_quotes(chunks, outcomes)
+    except Exception as exc:
+        return _global_quotes_fallback(exc)
+
+
+def get_global_quotes(groups: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    관심 종목 전체 시세를 심볼 인덱스 프레임으로 반환합니다. groups를 주면 해당 구분만 남깁니다.
+    전체 목록을 청크 단위 병렬 요청으로 한 번에 받아 캐시하므로, 구분별 조회는 캐시된 표의 뷰입니다.
+    """
+    return _filter_quote_groups(_global_quote_table(), groups)
+
+
+async def get_global_quotes_async(groups: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    return _filter_quote_groups(await _global_quote_table.aio(), groups)
+
+
+def _filter_quote_groups(frame: pd.DataFrame, groups: Optional[Iterable[str]]) -> pd.DataFrame:
+    if groups is None or frame.empty:
+        return frame
+    return frame[frame["group"].isin(list(groups))]
+
+
+def _parse_sparklines(payload: Dict[str, Any]) -> Dict[str, pd.Series]:
+    """
+    spark 응답을 심볼별 종가 시리즈(KST 시각 인덱스)로 바꿉니다. (v7 result 목록과 심볼 키 형식 모두 지원)
+    """
+    if "spark" in payload:
+        entries = []
+        for result in payload["spark"].get("result") or []:
+            response = (result.get("response") or [{}])[0]
+            closes = ((response.get("indicators") or {}).get("quote") or [{}])[0].get("close")
+            entries.append((result.get("symbol"), response.get("timestamp"), closes))
+    else:
+        entries = [(symbol, item.get("timestamp"), item.get("close")) for symbol, item in payload.items() if isinstance(item, dict)]
+
+    series: Dict[str, pd.Series] = {}
+    for symbol, timestamps, closes in entries:
+        if not symbol or not timestamps or not closes:
+            continue
+        index = pd.to_datetime(pd.Series(timestamps[: len(closes)], dtype="int64"), unit="s", utc=True).dt.tz_convert(KST)
+        values = pd.Series(closes[: len(index)], index=pd.DatetimeIndex(index), dtype="float64", name=symbol)
+        series[symbol] = values.dropna()
+    return series
+
+
+def _sparkline_ttl(series: pd.Series, interval: str, now: Optional[float] = None) -> float:
+    """
+    시리즈별 TTL: 마지막 봉이 최근이면(거래 중) 봉 간격만큼, 오래되었으면(휴장) SPARKLINE_IDLE_TTL만큼 유지합니다.
+    """
+    step = _INTERVAL_SECONDS.get(interval, 300)
+    if series.empty:
+        return float(step)
+    now = time.time() if now is None else now
+    last = series.index[-1].timestamp()
+    return float(step) if now - last <= 3 * step else float(SPARKLINE_IDLE_TTL)
+
+
+def _store_sparkline(key: Tuple[str, str, str], series: pd.Series, interval: str) -> None:
+    ttl = _sparkline_ttl(series, interval)
+    DEFAULT_CACHE.set(_SPARKLINE_NAMESPACE, key, series, ttl=ttl)
+    shared = get_shared_cache()
+    if shared is not None:
+        try:
+            shared.set(_SPARKLINE_NAMESPACE, key, series, ttl=ttl)
+        except Exception as exc:
+            logger.warning("Failed to share sparkline", extra={"symbol": key[0], "error": str(exc)})
+
+
+def _cached_sparkline(key: Tuple[str, str, str]) -> Optional[pd.Series]:
+    series = DEFAULT_CACHE.get(_SPARKLINE_NAMESPACE, key, None)
+    if series is not None:
+        return series
+    shared = get_shared_cache()
+    entry = None
+    if shared is not None:
+        try:
+            entry = shared.get(_SPARKLINE_NAMESPACE, key)
+        except Exception:
+            entry = None
+    if entry is None or not entry.is_fresh(time.time()):
+        return None
+    remaining = entry.expires_at - time.time() if entry.expires_at is not None else None
+    DEFAULT_CACHE.set(_SPARKLINE_NAMESPACE, key, entry.value, ttl=remaining)
+    return entry.value
+
+
+def get_sparklines(
+    symbols: Optional[Iterable[str]] = None,
+    range_: str = SPARKLINE_RANGE,
+    interval: str = SPARKLINE_INTERVAL,
+) -> Dict[str, pd.Series]:
+    """
+    심볼별 장중 종가 시리즈를 반환합니다. (기본: 관심 종목 전체, 당일 5분봉)
+    시리즈마다 따로 캐시되며, 만료된 심볼만 청크 단위 spark 요청을 병렬로 보내 채웁니다.
+    가져오지 못한 심볼은 결과에서 빠집니다.
+    """
+    symbols = list(dict.fromkeys(symbols if symbols is not None else (item.symbol for item in WATCHLIST)))
+    results: Dict[str, pd.Series] = {}
+    missing: List[str] = []
+    for symbol in symbols:
+        series = _cached_sparkline((symbol, range_, interval))
+        if series is None:
+            missing.append(symbol)
+        else:
+            results[symbol] = series
+    if not missing:
+        return {symbol: results[symbol].copy(deep=False) for symbol in symbols if symbol in results}
+
+    key = "global_sparklines"
+
+    def _fetch(chunk: Sequence[str]) -> Dict[str, pd.Series]:
+        payload = _request_with_retry(
+            _YAHOO_SPARK_URL, params={"symbols": ",".join(chunk), "range": range_, "interval": interval}
+        )
+        return _parse_sparklines(payload)
+
+    chunks = chunked(missing, SPARKLINE_CHUNK_SIZE)
+    errors: List[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(GLOBAL_QUOTE_MAX_WORKERS, len(chunks)))) as executor:
+        futures = {executor.submit(_fetch, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                fetched = future.result()
+            except Exception as exc:
+                logger.warning("Failed to load sparklines", extra={"symbols": len(futures[future]), "error": str(exc)})
+                errors.append(str(exc))
+                continue
+            for symbol, series in fetched.items():
+                _store_sparkline((symbol, range_, interval), series, interval)
+                results[symbol] = series
+    _record_error(key, errors[0] if errors else None)
+    return {symbol: results[symbol].copy(deep=False) for symbol in symbols if symbol in results}
 
 
 __all__ = [
     "get_market_indices",
+    "get_index_history",
     "get_top_100_market_cap_stocks",
+    "get_market_frame",
+    "get_screener_table",
+    "run_screener",
+    "run_strategy_backtest",
+    "run_strategy_sweep",
+    "BACKTEST_LOOKBACK_DAYS",
+    "get_stock_indicators",
+    "get_technical_summary",
+    "rank_stocks",
+    "refresh_market_frame",
+    "refresh_screener_table",
+    "refresh_index_day",
+    "RANKING_SORT_KEYS",
+    "get_ticker_catalog",
+    "refresh_ticker_catalog",
     "get_stock_name_ticker_map",
+    "get_ticker_name",
+    "get_market_tickers",
     "get_stock_info_by_name",
+    "ingest_market_day",
+    "backfill_market_panel",
+    "get_market_panel",
+    "search_stocks",
     "search_stocks_by_keyword",
     "get_financial_ratios",
+    "get_financial_ratios_batch",
+    "get_market_fundamentals",
     "search_news",
     "search_news_batch",
     "get_sector_performance",
+    "get_sector_table",
+    "get_index_catalog",
+    "backfill_index_panel",
     "get_global_market_snapshot",
+    "get_global_market_snapshot_async",
+    "get_watchlist",
+    "get_global_quotes",
+    "get_global_quotes_async",
+    "get_sparklines",
     "get_last_data_error",
+    "get_data_health",
+    "get_upstream_health",
+    "get_data_age",
+    "get_cache_stats",
 ]
@@ -0,0 +1,233 @@
+"""거래일별 전 종목 일봉 단면을 누적해 날짜×티커 패널로 제공하는 저장소."""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+PANEL_FIELDS = ("시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률")
+
+CrossSectionFetcher = Callable[[str], pd.DataFrame]
+
+
+def _date_key(value) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.strftime("%Y%m%d")
+    return str(value).replace("-", "")
+
+
+def is_holiday_frame(frame: pd.DataFrame) -> bool:
+    """
+    pykrx는 휴장일 조회 시 빈 프레임이나 OHLC가 모두 0인 프레임을 돌려줍니다.
+    """
+    if frame is None or frame.empty:
+        return True
+    ohlc = [column for column in ("시가", "고가", "저가", "종가") if column in frame.columns]
+    if not ohlc:
+        return False
+    return bool((frame[ohlc] == 0).all(axis=None))
+
+
+class MarketPanelStore:
+    """
+    거래일 하나당 Parquet 파일 하나(전 종목 단면)를 저장합니다.
+    N일을 채우려면 업스트림 호출 N번이면 되며, 읽을 때는 날짜×티커 패널로 조립합니다.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        # 필드별 날짜×티커 패널과 그 안에 담긴 날짜. 저장된 거래일 파일은 바뀌지 않으므로 새 날짜만 읽어 덧붙입니다.
+        self._panel_cache: Dict[str, Tuple[Set[str], pd.DataFrame]] = {}
+
+    # ------------------------------------------------------------------
+    # 저장 구조
+    # ------------------------------------------------------------------
+    def path_for(self, day) -> Path:
+        return self.root / f"date={_date_key(day)}" / "part-0.parquet"
+
+    @property
+    def _holiday_file(self) -> Path:
+        return self.root / "holidays.json"
+
+    def stored_dates(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        dates = [
+            entry.name.split("=", 1)[1]
+            for entry in self.root.iterdir()
+            if entry.is_dir() and entry.name.startswith("date=") and (entry / "part-0.parquet").exists()
+        ]
+        return sorted(dates)
+
+    def holidays(self) -> Set[str]:
+        if not self._holiday_file.exists():
+            return set()
+        try:
+            return set(json.loads(self._holiday_file.read_text(encoding="utf-8")))
+        except Exception:
+            return set()
+
+    def _mark_holiday(self, day: str) -> None:
+        holidays = self.holidays()
+        holidays.add(day)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._holiday_file.with_name(f".holidays.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(sorted(holidays)), encoding="utf-8")
+        os.replace(tmp_path, self._holiday_file)
+
+    def missing_dates(self, candidates: Iterable) -> List[str]:
+        """
+        후보 날짜 중 아직 저장되지 않았고 휴장일로도 기록되지 않은 날짜를 반환합니다.
+        """
+        known = set(self.stored_dates()) | self.holidays()
+        return [key for key in (_date_key(day) for day in candidates) if key not in known]
+
+    def covers(self, candidates: Iterable) -> bool:
+        return not self.missing_dates(candidates)
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    def write_day(self, day, frame: pd.DataFrame) -> None:
+        key = _date_key(day)
+        columns = [column for column in PANEL_FIELDS if column in frame.columns]
+        cross_section = frame[columns].copy()
+        cross_section.index = cross_section.index.astype(str)
+        cross_section.index.name = "티커"
+        table = pa.Table.from_pandas(cross_section.reset_index(), preserve_index=False)
+
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".part-0.{os.getpid()}.{threading.get_ident()}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        with self._lock:
+            for dates, _panel in self._panel_cache.values():
+                if key in dates:
+                    self._panel_cache.clear()
+                    break
+
+    def ingest_day(self, day, fetch: CrossSectionFetcher, persist: bool = True) -> Optional[pd.DataFrame]:
+        """
+        하루치 전 종목 단면을 한 번의 호출로 받아 저장합니다.
+        이미 저장된 날짜는 디스크에서 읽고, 휴장일이면 기록만 남기고 None을 반환합니다.
+        persist=False이면(장중 미확정 데이터 등) 저장하지 않고 결과만 돌려줍니다.
+        """
+        key = _date_key(day)
+        if persist:
+            stored = self.read_day(key)
+            if stored is not None:
+                return stored
+            if key in self.holidays():
+                return None
+
+        frame = fetch(key)
+        if is_holiday_frame(frame):
+            if persist:
+                self._mark_holiday(key)
+            return None
+        if persist:
+            self.write_day(key, frame)
+            logger.info("Market panel day ingested", extra={"date": key, "tickers": len(frame)})
+        return frame
+
+    def backfill(self, candidates: Sequence, fetch: CrossSectionFetcher) -> Dict[str, int]:
+        """
+        누락된 거래일만 하루 한 번씩 호출해 채웁니다.
+        """
+        summary = {"requested": 0, "ingested": 0, "holidays": 0, "failed": 0}
+        for key in self.missing_dates(candidates):
+            summary["requested"] += 1
+            try:
+                frame = self.ingest_day(key, fetch)
+            except Exception as exc:
+                summary["failed"] += 1
+                logger.warning("Market panel backfill failed", extra={"date": key, "error": str(exc)})
+                continue
+            if frame is None:
+                summary["holidays"] += 1
+            else:
+                summary["ingested"] += 1
+        return summary
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def read_day(self, day) -> Optional[pd.DataFrame]:
+        path = self.path_for(day)
+        if not path.exists():
+            return None
+        try:
+            return pq.read_table(path).to_pandas().set_index("티커")
+        except Exception as exc:
+            logger.warning("Failed to read market panel day", extra={"path": str(path), "error": str(exc)})
+            return None
+
+    def _dates_between(self, start=None, end=None) -> List[str]:
+        low = _date_key(start) if start is not None else None
+        high = _date_key(end) if end is not None else None
+        return [
+            key
+            for key in self.stored_dates()
+            if (low is None or key >= low) and (high is None or key <= high)
+        ]
+
+    def _read_field(self, dates: Iterable[str], field: str) -> pd.DataFrame:
+        rows = {}
+        for key in dates:
+            path = self.path_for(key)
+            try:
+                day_frame = pq.read_table(path, columns=["티커", field]).to_pandas().set_index("티커")
+            except Exception as exc:
+                logger.warning("Failed to read market panel day", extra={"path": str(path), "error": str(exc)})
+                continue
+            rows[pd.Timestamp(key)] = day_frame[field]
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+    def load_panel(self, field: str = "종가", start=None, end=None) -> pd.DataFrame:
+        """
+        지정한 필드의 날짜×티커 패널을 반환합니다.
+        요청 구간의 거래일 파일만 읽고, 필드별 패널을 메모리에 두어 다음 호출에는 새로 저장된 날짜만 읽습니다.
+        """
+        if field not in PANEL_FIELDS:
+            return pd.DataFrame()
+        dates = self._dates_between(start, end)
+        with self._lock:
+            cached_dates, panel = self._panel_cache.get(field, (set(), pd.DataFrame()))
+        missing = [key for key in dates if key not in cached_dates]
+        if missing:
+            fresh = self._read_field(missing, field)
+            if not fresh.empty:
+                panel = fresh if panel.empty else pd.concat([panel, fresh])
+                panel = panel.sort_index().sort_index(axis=1)
+                panel.index.name = "날짜"
+                panel.columns.name = "티커"
+            with self._lock:
+                read = {key for key in missing if pd.Timestamp(key) in fresh.index}
+                self._panel_cache[field] = (cached_dates | read, panel)
+        if panel.empty:
+            return pd.DataFrame()
+        return _slice_dates(panel, start, end)
+
+
+def _slice_dates(frame: pd.DataFrame, start, end) -> pd.DataFrame:
+    if start is not None:
+        frame = frame[frame.index >= pd.Timestamp(_date_key(start))]
+    if end is not None:
+        frame = frame[frame.index <= pd.Timestamp(_date_key(end))]
+    return frame
+
+
+__all__ = ["MarketPanelStore", "PANEL_FIELDS", "is_holiday_frame"]
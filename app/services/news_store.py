@@ -0,0 +1,220 @@
+"""뉴스 검색 결과를 프로세스 간에 공유하는 SQLite(WAL) 저장소."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# 추적용 쿼리 파라미터는 같은 기사를 다른 URL로 보이게 하므로 제거합니다.
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+# 오래된 행 정리는 저장 시 최대 이 간격(초)마다 한 번 수행합니다.
+_PURGE_INTERVAL = 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS query_articles (
+    query TEXT NOT NULL,
+    url_key TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (query, url_key)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen);
+"""
+
+
+def normalize_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL이 같은 키가 되도록 정규화합니다.
+    (스킴/호스트 소문자화, www. 제거, 프래그먼트·추적 파라미터 제거, 끝 슬래시 제거)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAMS)
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https" if parts.scheme in ("http", "https", "") else parts.scheme, host, path, query, ""))
+
+
+def _article_key(item: Dict[str, str]) -> str:
+    url_key = normalize_url(item.get("link", ""))
+    if url_key:
+        return url_key
+    # 링크가 없는 결과는 제목으로 중복을 판단합니다.
+    title = " ".join((item.get("title") or "").split()).lower()
+    return "title:" + hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+
+class NewsStore:
+    """
+    검색어별 뉴스 결과를 저장합니다.
+
+    기사는 정규화된 URL 기준으로 한 번만 저장되어 여러 검색어가 공유하고, 처음 본 시각(first_seen)을 유지합니다.
+    검색어 결과는 ttl(초)이 지나면 만료되며, 만료된 결과도 업스트림 장애 시 대체값으로 읽을 수 있습니다.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = 900, retention: float = 7 * 86400):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.retention = retention
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._last_purge = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간에 공유하지 않고 스레드마다 하나씩 엽니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+        self._local.conn = conn
+        return conn
+
+    def get(self, query: str, max_age: Optional[float] = None) -> Optional[List[Dict[str, str]]]:
+        """
+        max_age(기본: ttl)초 안에 저장된 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+        max_age=float("inf")이면 만료 여부와 관계없이 마지막 결과를 반환합니다.
+        """
+        return self.get_many([query], max_age=max_age).get(query)
+
+    def get_many(self, queries: Iterable[str], max_age: Optional[float] = None) -> Dict[str, List[Dict[str, str]]]:
+        """
+        여러 검색어의 유효한 결과를 한 번에 읽습니다. 결과가 없는 검색어는 키가 빠집니다.
+        """
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+        max_age = self.ttl if max_age is None else max_age
+        cutoff = time.time() - max_age
+        conn = self._connect()
+        placeholders = ",".join("?" * len(queries))
+        fresh = [
+            row["query"]
+            for row in conn.execute(
+                f"SELECT query FROM queries WHERE query IN ({placeholders}) AND fetched_at >= ?",
+                (*queries, cutoff),
+            )
+        ]
+        results: Dict[str, List[Dict[str, str]]] = {query: [] for query in fresh}
+        if not fresh:
+            return results
+        placeholders = ",".join("?" * len(fresh))
+        rows = conn.execute(
+            f"""
+            SELECT qa.query, a.url, a.title, a.snippet
+            FROM query_articles qa JOIN articles a ON a.url_key = qa.url_key
+            WHERE qa.query IN ({placeholders})
+            ORDER BY qa.query, qa.rank
+            """,
+            fresh,
+        )
+        for row in rows:
+            results[row["query"]].append({"title": row["title"], "snippet": row["snippet"], "link": row["url"]})
+        return results
+
+    def put(self, query: str, items: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        검색 결과를 저장하고 URL 기준으로 중복을 제거한 목록을 반환합니다.
+        """
+        now = time.time()
+        unique: Dict[str, Dict[str, str]] = {}
+        for item in items:
+            unique.setdefault(_article_key(item), item)
+
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                INSERT INTO articles (url_key, url, title, snippet, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    title = excluded.title, snippet = excluded.snippet, last_seen = excluded.last_seen
+                """,
+                [
+                    (key, item.get("link", ""), item.get("title", ""), item.get("snippet", ""), now, now)
+                    for key, item in unique.items()
+                ],
+            )
+            conn.execute("DELETE FROM query_articles WHERE query = ?", (query,))
+            conn.executemany(
+                "INSERT INTO query_articles (query, url_key, rank) VALUES (?, ?, ?)",
+                [(query, key, rank) for rank, key in enumerate(unique)],
+            )
+            conn.execute(
+                "INSERT INTO queries (query, fetched_at) VALUES (?, ?) "
+                "ON CONFLICT(query) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (query, now),
+            )
+        if now - self._last_purge > _PURGE_INTERVAL:
+            self._last_purge = now
+            self.purge()
+        return list(unique.values())
+
+    def first_seen(self, url: str) -> Optional[float]:
+        row = self._connect().execute(
+            "SELECT first_seen FROM articles WHERE url_key = ?", (normalize_url(url),)
+        ).fetchone()
+        return row["first_seen"] if row else None
+
+    def purge(self) -> int:
+        """
+        보존 기간(retention)이 지난 검색어와 어느 검색어에도 속하지 않는 기사를 지웁니다. 지운 기사 수를 반환합니다.
+        """
+        cutoff = time.time() - self.retention
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM query_articles WHERE query IN (SELECT query FROM queries WHERE fetched_at < ?)",
+                (cutoff,),
+            )
+            conn.execute("DELETE FROM queries WHERE fetched_at < ?", (cutoff,))
+            removed = conn.execute(
+                "DELETE FROM articles WHERE last_seen < ? "
+                "AND url_key NOT IN (SELECT url_key FROM query_articles)",
+                (cutoff,),
+            ).rowcount
+        if removed:
+            logger.info("Purged expired news articles", extra={"removed": removed})
+        return removed
+
+
+__all__ = ["NewsStore", "normalize_url"]
@@ -0,0 +1,192 @@
+"""종목별 일봉(OHLCV) 이력을 Parquet 파일로 보관하는 로컬 저장소."""
+
+import logging
+import math
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .trading_calendar import KST, is_market_hours, last_market_close, to_kst
+
+logger = logging.getLogger(__name__)
+
+_META_SYNCED_AT = b"gift.synced_at"
+_META_COVERED_FROM = b"gift.covered_from"
+
+OhlcvFetcher = Callable[[str, str], pd.DataFrame]
+
+
+class OhlcvStore:
+    """
+    티커 하나당 Parquet 파일 하나로 일봉 이력을 누적 저장합니다.
+    동기화 시에는 마지막 저장일 이후 구간만 업스트림에서 받아와 덧붙입니다.
+    """
+
+    def __init__(self, root: Path, refresh_interval: float = 60 * 15):
+        self.root = Path(root)
+        self.refresh_interval = refresh_interval
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path_for(self, ticker: str) -> Path:
+        return self.root / f"{ticker}.parquet"
+
+    def _lock_for(self, ticker: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(ticker)
+            if lock is None:
+                lock = self._locks[ticker] = threading.Lock()
+            return lock
+
+    def _read_table(self, ticker: str) -> Optional[pa.Table]:
+        path = self.path_for(ticker)
+        if not path.exists():
+            return None
+        try:
+            return pq.read_table(path)
+        except Exception as exc:
+            logger.warning(
+                "Failed to read OHLCV partition; ignoring",
+                extra={"ticker": ticker, "path": str(path), "error": str(exc)},
+            )
+            return None
+
+    def _write(self, ticker: str, frame: pd.DataFrame, synced_at: float, covered_from: Optional[str]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(frame, preserve_index=True)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_META_SYNCED_AT] = repr(synced_at).encode()
+        if covered_from:
+            metadata[_META_COVERED_FROM] = covered_from.encode()
+        table = table.replace_schema_metadata(metadata)
+
+        path = self.path_for(ticker)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+
+    def read(
+        self,
+        ticker: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        저장된 일봉을 [start, end] 구간으로 잘라 반환합니다. 없으면 빈 데이터프레임을 반환합니다.
+        """
+        table = self._read_table(ticker)
+        if table is None:
+            return pd.DataFrame()
+        frame = table.to_pandas()
+        return _slice(frame, start, end)
+
+    def sync(
+        self,
+        ticker: str,
+        fetch: OhlcvFetcher,
+        start: datetime,
+        end: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        저장소를 최신 상태로 맞춘 뒤 [start, end] 구간을 반환합니다.
+
+        fetch(start_yyyymmdd, end_yyyymmdd)는 pykrx `get_market_ohlcv_by_date`와 같은
+        형태(날짜 인덱스)의 데이터프레임을 반환해야 합니다. 이미 최신이면 업스트림을 호출하지 않습니다.
+        """
+        now = to_kst(now)
+        end = end or now.replace(tzinfo=None)
+        start_str = start.strftime("%Y%m%d")
+        end_str = end.strftime("%Y%m%d")
+
+        with self._lock_for(ticker):
+            table = self._read_table(ticker)
+            if table is None or table.num_rows == 0:
+                stored = pd.DataFrame()
+                metadata: Dict[bytes, bytes] = {}
+            else:
+                stored = table.to_pandas()
+                metadata = dict(table.schema.metadata or {})
+
+            synced_at = float(metadata.get(_META_SYNCED_AT, b"0"))
+            covered_from = metadata.get(_META_COVERED_FROM, b"").decode() or None
+            needs_prefix = covered_from is None or covered_from > start_str
+
+            if not needs_prefix and self._is_fresh(synced_at, now):
+                return _slice(stored, start, end)
+
+            pieces = [stored] if not stored.empty else []
+            if stored.empty or needs_prefix:
+                # 저장 이력이 없거나 요청 구간이 저장 범위보다 앞서면 전체 구간을 다시 받습니다.
+                fetched = fetch(start_str, end_str)
+                pieces = [stored, fetched] if not stored.empty else [fetched]
+                covered_from = min(filter(None, [covered_from, start_str]))
+            else:
+                # 마지막 저장일부터 다시 받아 장중에 저장된 미완성 봉을 덮어씁니다.
+                tail_start = stored.index.max().strftime("%Y%m%d")
+                tail = fetch(tail_start, end_str)
+                if _is_rebased(stored, tail):
+                    # 액면분할·배당 등으로 수정주가가 다시 계산되었으므로 저장 구간 전체를 새로 받습니다.
+                    logger.info("OHLCV history re-adjusted upstream; refetching", extra={"ticker": ticker})
+                    pieces = [fetch(covered_from or start_str, end_str)]
+                else:
+                    pieces.append(tail)
+
+            merged = _merge_frames(pieces)
+            if merged.empty:
+                return merged
+            self._write(ticker, merged, now.timestamp(), covered_from)
+            logger.info(
+                "OHLCV partition synced",
+                extra={"ticker": ticker, "rows": len(merged)},
+            )
+            return _slice(merged, start, end)
+
+    def _is_fresh(self, synced_at: float, now: datetime) -> bool:
+        if not synced_at:
+            return False
+        if now.timestamp() - synced_at < self.refresh_interval:
+            return True
+        # 마지막 장 마감 이후에 동기화했고 지금이 장중이 아니라면 새 봉이 생길 수 없습니다.
+        return synced_at >= last_market_close(now).timestamp() and not is_market_hours(now)
+
+
+def _is_rebased(stored: pd.DataFrame, fetched: pd.DataFrame) -> bool:
+    # 겹치는 봉(마지막 저장일)의 시가를 비교합니다. 시가는 장 시작 후 바뀌지 않으므로
+    # 장중에 저장된 미완성 봉이어도 값이 다르면 과거 수정주가가 다시 계산된 것입니다.
+    if fetched is None or fetched.empty:
+        return False
+    overlap = stored.index.max()
+    column = next((name for name in ("시가", "종가") if name in stored.columns and name in fetched.columns), None)
+    if column is None or overlap not in fetched.index:
+        return False
+    before, after = float(stored.at[overlap, column]), float(fetched.at[overlap, column])
+    return not math.isclose(before, after, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def _merge_frames(pieces) -> pd.DataFrame:
+    frames = [piece for piece in pieces if piece is not None and not piece.empty]
+    if not frames:
+        return pd.DataFrame()
+    merged = pd.concat(frames)
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def _slice(frame: pd.DataFrame, start: Optional[datetime], end: Optional[datetime]) -> pd.DataFrame:
+    if frame.empty:
+        return frame
+    if start is not None:
+        frame = frame[frame.index >= pd.Timestamp(start.date())]
+    if end is not None:
+        frame = frame[frame.index <= pd.Timestamp(end.date())]
+    return frame
+
+
+__all__ = ["OhlcvStore", "is_market_hours", "last_market_close", "KST"]
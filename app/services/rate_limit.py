@@ -0,0 +1,225 @@
+"""외부 데이터 소스별 토큰 버킷 요청 제한기 (버스트, 적응형 감속, 마감 시각)."""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 호출 체인 아래쪽(캐시 데코레이터 안쪽 등)까지 마감 시각을 전달하기 위한 컨텍스트 변수
+_DEADLINE: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("rate_limit_deadline", default=None)
+
+# 요청 제한으로 보는 HTTP 상태와 예외 클래스 이름 (선택 의존성은 import하지 않고 이름으로 판별: duckduckgo_search 등)
+_RATE_LIMIT_STATUS = 429
+_RATE_LIMIT_EXCEPTIONS = ("RatelimitException", "TooManyRequests", "RateLimitError")
+
+
+class RateLimitExceeded(TimeoutError):
+    """마감 시각 안에 요청 슬롯을 얻을 수 없을 때 발생합니다."""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for source in (getattr(exc, "response", None), exc):
+        for attr in ("status_code", "status"):
+            status = getattr(source, attr, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """
+    업스트림이 요청을 거절(429 등)한 예외인지 판별합니다.
+    예외 메시지가 아니라 응답의 HTTP 상태나 예외 타입으로 판단하므로, 본문에 "429"가 들어간 일반 오류는 해당하지 않습니다.
+    """
+    if _status_code(exc) == _RATE_LIMIT_STATUS:
+        return True
+    return any(cls.__name__ in _RATE_LIMIT_EXCEPTIONS for cls in type(exc).__mro__)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """
+    블록 안의 모든 acquire가 time.monotonic() 기준 deadline을 넘기지 않도록 합니다.
+    """
+    token = _DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    return _DEADLINE.get()
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷입니다.
+
+    토큰은 락 안에서 예약만 하고 대기는 락 밖에서 하므로, 여러 스레드가 한도 안에서 동시에 진행합니다.
+    업스트림이 거절하면 penalize()로 속도를 절반으로 낮추고 잠시 멈추며, 성공이 이어지면 원래 속도로 회복합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        recovery: float = 0.1,
+    ):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.name = name
+        self.base_rate = float(rate)
+        self.burst = int(burst)
+        self.min_rate = float(min_rate) if min_rate is not None else self.base_rate / 8
+        self.recovery = recovery
+        self._rate = self.base_rate
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0.0, "rejected": 0, "throttled": 0}
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def _reserve(self, deadline: Optional[float]) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 할 시간(초)을 반환합니다. 마감을 넘기면 예약을 취소하고 예외를 던집니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(-self._tokens / self._rate, self._blocked_until - now, 0.0)
+            if deadline is not None and now + wait > deadline:
+                self._tokens += 1
+                self._stats["rejected"] += 1
+                raise RateLimitExceeded(f"{self.name}: no request slot before deadline (wait {wait:.2f}s)")
+            self._stats["acquired"] += 1
+            self._stats["waited"] += wait
+            return wait
+
+    def acquire(self, deadline: Optional[float] = None) -> float:
+        """
+        요청 슬롯을 얻을 때까지 블록합니다. deadline을 생략하면 deadline_scope의 값을 사용합니다.
+        """
+        wait = self._reserve(deadline if deadline is not None else current_deadline())
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, deadline: Optional[float] = None) -> float:
+        wait = self._reserve(deadline if deadline is not None else current_deadline())
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        업스트림 거절 시 호출합니다. 속도를 절반으로 줄이고 retry_after(기본: 토큰 하나 간격) 동안 멈춥니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._rate = max(self.min_rate, self._rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self._rate
+            self._blocked_until = max(self._blocked_until, now + pause)
+            self._stats["throttled"] += 1
+            rate = self._rate
+        logger.info(
+            "Upstream rejected request; slowing down",
+            extra={"source": self.name, "rate": rate, "pause": pause},
+        )
+
+    def reward(self) -> None:
+        """
+        요청이 성공했을 때 호출합니다. 줄어든 속도를 기본값 쪽으로 조금씩 되돌립니다.
+        """
+        if self._rate >= self.base_rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._rate = min(self.base_rate, self._rate + self.base_rate * self.recovery)
+
+    @contextmanager
+    def slot(self, deadline: Optional[float] = None) -> Iterator[None]:
+        """
+        슬롯을 얻은 뒤 블록을 실행하고, 결과에 따라 속도를 조정합니다.
+        """
+        self.acquire(deadline)
+        try:
+            yield
+        except BaseException as exc:
+            if is_rate_limited(exc):
+                self.penalize()
+            raise
+        else:
+            self.reward()
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self.slot():
+            return fn(*args, **kwargs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": round(self._rate, 4),
+                "base_rate": self.base_rate,
+                "burst": self.burst,
+                "tokens": round(max(self._tokens, 0.0), 3),
+                "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 3),
+                **self._stats,
+            }
+
+
+def _from_env(name: str, rate: float, burst: int) -> TokenBucket:
+    # 예: GIFT_RATE_DDG=2.5, GIFT_BURST_DDG=3
+    env_key = name.upper()
+    return TokenBucket(
+        name,
+        rate=float(os.getenv(f"GIFT_RATE_{env_key}", str(rate))),
+        burst=int(os.getenv(f"GIFT_BURST_{env_key}", str(burst))),
+    )
+
+
+# 데이터 소스별 기본 한도
+DDG = _from_env("ddg", rate=2.5, burst=3)
+YAHOO = _from_env("yahoo", rate=5.0, burst=5)
+KRX = _from_env("krx", rate=8.0, burst=8)
+
+LIMITERS: Dict[str, TokenBucket] = {bucket.name: bucket for bucket in (DDG, YAHOO, KRX)}
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: bucket.snapshot() for name, bucket in LIMITERS.items()}
+
+
+__all__ = [
+    "TokenBucket",
+    "RateLimitExceeded",
+    "DDG",
+    "YAHOO",
+    "KRX",
+    "LIMITERS",
+    "deadline_scope",
+    "current_deadline",
+    "is_rate_limited",
+    "get_rate_limit_stats",
+]
@@ -0,0 +1,347 @@
+"""Streamlit·uvicorn 프로세스가 함께 쓰는 2단계(L2) 캐시 저장소 (SQLite WAL, DataFrame은 Arrow IPC)."""
+
+import base64
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = Path(os.getenv("GIFT_SHARED_CACHE_PATH", ".cache/shared_cache.sqlite3"))
+
+# 한 값의 직렬화 크기 상한. 넘으면 공유하지 않고 프로세스 캐시에만 둡니다.
+MAX_VALUE_BYTES = int(os.getenv("GIFT_SHARED_CACHE_MAX_VALUE_BYTES", str(64 * 1024 * 1024)))
+
+# 만료(stale 구간 포함)된 지 이 시간이 지난 항목은 정리합니다. (마지막 정상값 보관용 항목은 만료가 없음)
+_RETENTION = 7 * 86400
+_PURGE_INTERVAL = 60 * 60
+
+# 다른 프로세스의 적재를 기다릴 때 확인 간격(초)
+_POLL_INTERVAL = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL,
+    stale_until REAL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+
+class SharedEntry(NamedTuple):
+    value: Any
+    stored_at: float
+    expires_at: Optional[float]
+    stale_until: Optional[float]
+
+    def is_fresh(self, now: float) -> bool:
+        return self.expires_at is None or now < self.expires_at
+
+    def expired(self, now: float) -> bool:
+        limit = self.stale_until if self.stale_until is not None else self.expires_at
+        return limit is not None and now >= limit
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+# JSON에 없는 타입을 보존하기 위한 태그. tuple은 list로, 중첩된 DataFrame/Series는 직렬화 자체가 안 되므로 감싸서 저장합니다.
+_TUPLE_TAG = "__tuple__"
+_ARROW_TAG = "__arrow__"
+
+
+def _encode_arrow(value: Union[pd.DataFrame, pd.Series]) -> Tuple[str, bytes]:
+    kind = "arrow" if isinstance(value, pd.DataFrame) else "arrow_series"
+    frame = value if isinstance(value, pd.DataFrame) else value.to_frame()
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return kind, sink.getvalue().to_pybytes()
+
+
+def _tag(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return {_TUPLE_TAG: [_tag(item) for item in value]}
+    if isinstance(value, list):
+        return [_tag(item) for item in value]
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _tag(item) for key, item in value.items()}
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        kind, payload = _encode_arrow(value)
+        return {_ARROW_TAG: kind, "payload": base64.b64encode(payload).decode("ascii")}
+    return value
+
+
+def _untag(obj: Dict[str, Any]) -> Any:
+    if obj.keys() == {_TUPLE_TAG}:
+        return tuple(obj[_TUPLE_TAG])
+    if obj.keys() == {_ARROW_TAG, "payload"}:
+        return decode_value(obj[_ARROW_TAG], base64.b64decode(obj["payload"]))
+    return obj
+
+
+def encode_value(value: Any) -> Tuple[str, bytes]:
+    """
+    값을 (형식, 바이트)로 직렬화합니다. DataFrame/Series는 Arrow IPC 스트림, 그 밖의 값은 JSON입니다.
+    JSON 안의 tuple과 중첩 프레임(예: (DataFrame, 티커))은 태그를 붙여 원래 타입으로 복원되게 합니다.
+    직렬화할 수 없으면 TypeError 또는 pyarrow 예외를 던집니다.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _encode_arrow(value)
+    return "json", json.dumps(_tag(value), ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def decode_value(kind: str, payload: bytes) -> Any:
+    if kind in ("arrow", "arrow_series"):
+        frame = pa.ipc.open_stream(io.BytesIO(payload)).read_all().to_pandas()
+        return frame.iloc[:, 0] if kind == "arrow_series" else frame
+    if kind == "json":
+        return json.loads(payload.decode("utf-8"), object_hook=_untag)
+    raise ValueError(f"unknown shared cache value kind: {kind}")
+
+
+def key_text(key: Hashable) -> str:
+    # cached()의 키는 (인자 이름, 값) 튜플이므로 repr이 프로세스 간에 같습니다.
+    return key if isinstance(key, str) else repr(key)
+
+
+class SharedCache:
+    """
+    (네임스페이스, 키)별 값을 만료 시각과 함께 SQLite 파일에 저장해 여러 프로세스가 공유합니다.
+
+    같은 볼륨을 마운트한 Streamlit 앱, uvicorn 워커, 워머가 한 파일을 읽고 쓰며,
+    lease()로 한 키의 업스트림 적재를 한 프로세스만 하도록 조율합니다.
+    """
+
+    def __init__(self, path: Union[str, Path], max_value_bytes: int = MAX_VALUE_BYTES, retention: float = _RETENTION):
+        self.path = Path(path)
+        self.max_value_bytes = max_value_bytes
+        self.retention = retention
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._last_purge = 0.0
+        self._owner = f"{os.getpid()}"
+        self._stats = {"reads": 0, "hits": 0, "writes": 0, "skipped": 0, "lease_waits": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간에 공유하지 않고 스레드마다 하나씩 엽니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+        self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: Hashable) -> Optional[SharedEntry]:
+        """
+        저장된 항목을 반환합니다. 없거나 stale 구간까지 만료되었으면 None을 반환합니다.
+        """
+        self._stats["reads"] += 1
+        row = self._connect().execute(
+            "SELECT kind, payload, stored_at, expires_at, stale_until FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key_text(key)),
+        ).fetchone()
+        if row is None:
+            return None
+        kind, payload, stored_at, expires_at, stale_until = row
+        entry = SharedEntry(None, stored_at, expires_at, stale_until)
+        if entry.expired(time.time()):
+            return None
+        try:
+            value = decode_value(kind, payload)
+        except Exception as exc:
+            logger.warning("Failed to decode shared cache entry", extra={"namespace": namespace, "error": str(exc)})
+            return None
+        self._stats["hits"] += 1
+        return entry._replace(value=value)
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+    ) -> bool:
+        """
+        값을 저장합니다. 직렬화할 수 없거나 크기 상한을 넘으면 저장하지 않고 False를 반환합니다.
+        """
+        try:
+            kind, payload = encode_value(value)
+        except Exception as exc:
+            self._stats["skipped"] += 1
+            logger.debug("Value not shareable; kept in process cache", extra={"namespace": namespace, "error": str(exc)})
+            return False
+        if len(payload) > self.max_value_bytes:
+            self._stats["skipped"] += 1
+            logger.info("Shared cache value too large", extra={"namespace": namespace, "size": len(payload)})
+            return False
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        stale_until = expires_at + stale_ttl if expires_at is not None and stale_ttl is not None else None
+        self._connect().execute(
+            """
+            INSERT INTO entries (namespace, key, kind, payload, stored_at, expires_at, stale_until)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(namespace, key) DO UPDATE SET
+                kind = excluded.kind, payload = excluded.payload, stored_at = excluded.stored_at,
+                expires_at = excluded.expires_at, stale_until = excluded.stale_until
+            """,
+            (namespace, key_text(key), kind, sqlite3.Binary(payload), now, expires_at, stale_until),
+        )
+        self._stats["writes"] += 1
+        if now - self._last_purge > _PURGE_INTERVAL:
+            self._last_purge = now
+            self.purge()
+        return True
+
+    def _try_lease(self, namespace: str, key: str, owner: str, duration: float) -> bool:
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT owner, expires_at FROM leases WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is not None and row[1] > now and row[0] != owner:
+                return False
+            conn.execute(
+                "INSERT INTO leases (namespace, key, owner, expires_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at",
+                (namespace, key, owner, now + duration),
+            )
+        return True
+
+    @contextmanager
+    def lease(self, namespace: str, key: Hashable, duration: float = 60.0) -> Iterator[bool]:
+        """
+        키의 적재 권한을 얻으면 True를 내줍니다. 다른 프로세스가 적재 중이면 False입니다.
+        권한은 블록을 벗어나면 반납되며, 프로세스가 죽어도 duration초 뒤에는 만료됩니다.
+        """
+        text = key_text(key)
+        owner = f"{self._owner}:{threading.get_ident()}"
+        try:
+            acquired = self._try_lease(namespace, text, owner, duration)
+        except sqlite3.Error as exc:
+            logger.warning("Shared cache lease failed", extra={"namespace": namespace, "error": str(exc)})
+            acquired = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    self._connect().execute(
+                        "DELETE FROM leases WHERE namespace = ? AND key = ? AND owner = ?", (namespace, text, owner)
+                    )
+                except sqlite3.Error:
+                    pass
+
+    def wait_for(self, namespace: str, key: Hashable, after: float, timeout: float) -> Optional[SharedEntry]:
+        """
+        after 이후에 저장된 신선한 항목이 생길 때까지 최대 timeout초 기다립니다.
+        """
+        self._stats["lease_waits"] += 1
+        deadline = time.monotonic() + timeout
+        while True:
+            entry = self.get(namespace, key)
+            if entry is not None and entry.stored_at >= after and entry.is_fresh(time.time()):
+                return entry
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(_POLL_INTERVAL)
+
+    def invalidate(self, namespace: str, key: Any = None) -> None:
+        conn = self._connect()
+        if key is None:
+            conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        else:
+            conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key_text(key)))
+
+    def purge(self) -> int:
+        """
+        보존 기간(retention) 전에 만료된 항목과 만료된 lease를 지웁니다. 지운 항목 수를 반환합니다.
+        """
+        now = time.time()
+        conn = self._connect()
+        removed = conn.execute(
+            "DELETE FROM entries WHERE COALESCE(stale_until, expires_at) < ?", (now - self.retention,)
+        ).rowcount
+        conn.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+        if removed:
+            logger.info("Purged expired shared cache entries", extra={"removed": removed})
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        return {"path": str(self.path), "entries": entries, "bytes": size, **self._stats}
+
+
+def shared_cache_enabled() -> bool:
+    return os.getenv("GIFT_SHARED_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+_SHARED: Optional[SharedCache] = SharedCache(DEFAULT_PATH) if shared_cache_enabled() else None
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    프로세스 간 공유 캐시를 반환합니다. GIFT_SHARED_CACHE=0이면 None입니다.
+    """
+    return _SHARED
+
+
+__all__ = [
+    "SharedCache",
+    "SharedEntry",
+    "encode_value",
+    "decode_value",
+    "get_shared_cache",
+    "shared_cache_enabled",
+]
@@ -0,0 +1,235 @@
+"""종목명 검색 인덱스 (접두어, 부분 문자열, 초성, 티커, 영문 별칭, 오타 허용)."""
+
+import bisect
+import heapq
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# 자주 검색되는 종목의 영문 별칭 (티커 기준)
+DEFAULT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "005930": ("Samsung Electronics", "Samsung"),
+    "000660": ("SK hynix", "Hynix"),
+    "373220": ("LG Energy Solution", "LGES"),
+    "207940": ("Samsung Biologics",),
+    "005380": ("Hyundai Motor", "Hyundai"),
+    "000270": ("Kia",),
+    "068270": ("Celltrion",),
+    "035420": ("NAVER",),
+    "035720": ("Kakao",),
+    "005490": ("POSCO Holdings", "POSCO"),
+    "051910": ("LG Chem",),
+    "006400": ("Samsung SDI",),
+    "105560": ("KB Financial",),
+    "055550": ("Shinhan Financial",),
+    "012330": ("Hyundai Mobis",),
+    "066570": ("LG Electronics",),
+    "003550": ("LG Corp",),
+    "028260": ("Samsung C&T",),
+    "017670": ("SK Telecom", "SKT"),
+    "030200": ("KT",),
+    "034730": ("SK Inc",),
+    "015760": ("KEPCO", "Korea Electric Power"),
+    "086520": ("Ecopro",),
+    "247540": ("Ecopro BM",),
+    "352820": ("HYBE",),
+}
+
+# 일치 유형별 기본 점수 (낮을수록 상위)
+_RANK_EXACT = 0.0
+_RANK_TICKER = 0.5
+_RANK_PREFIX = 1.0
+_RANK_ALIAS_PREFIX = 1.5
+_RANK_SUBSTRING = 2.0
+_RANK_CHOSEONG_PREFIX = 3.0
+_RANK_CHOSEONG_SUBSTRING = 4.0
+_RANK_FUZZY = 5.0
+
+_FUZZY_THRESHOLD = 0.6
+
+
+class SearchHit(NamedTuple):
+    name: str
+    ticker: str
+    score: float
+    match: str
+
+
+def normalize(text: str) -> str:
+    return "".join((text or "").lower().split())
+
+
+def to_choseong(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꾼 문자열을 반환합니다. (예: "삼성전자" → "ㅅㅅㅈㅈ")
+    """
+    chars = []
+    for char in normalize(text):
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def _ngrams(text: str, size: int = 2) -> Set[str]:
+    if len(text) < size:
+        return {text} if text else set()
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+class StockSearchIndex:
+    """
+    카탈로그로부터 한 번 만들어 두고 키 입력마다 재사용하는 검색 인덱스입니다.
+
+    - 접두어: 정렬된 키 배열에 대한 이분 탐색
+    - 부분 문자열: 바이그램 역색인 교집합 후 검증
+    - 초성/티커/영문 별칭: 별도 키로 같은 방식 적용
+    - 오타: 바이그램을 공유하는 후보에 한해 유사도 계산
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], aliases: Optional[Mapping[str, Iterable[str]]] = None):
+        aliases = aliases if aliases is not None else DEFAULT_ALIASES
+        self._names: List[str] = []
+        self._tickers: List[str] = []
+        self._keys: List[str] = []
+        self._choseong: List[str] = []
+        self._alias_keys: List[Tuple[str, ...]] = []
+
+        for name, ticker in entries:
+            self._names.append(name)
+            self._tickers.append(ticker)
+            self._keys.append(normalize(name))
+            self._choseong.append(to_choseong(name))
+            self._alias_keys.append(tuple(normalize(alias) for alias in aliases.get(ticker, ())))
+
+        self._ticker_lookup: Dict[str, int] = {ticker: doc for doc, ticker in enumerate(self._tickers)}
+        self._name_prefix = sorted((key, doc) for doc, key in enumerate(self._keys))
+        self._choseong_prefix = sorted((key, doc) for doc, key in enumerate(self._choseong))
+        self._alias_prefix = sorted(
+            (alias, doc) for doc, alias_keys in enumerate(self._alias_keys) for alias in alias_keys
+        )
+        self._ticker_prefix = sorted((ticker, doc) for doc, ticker in enumerate(self._tickers))
+
+        self._gram_index: Dict[str, Set[int]] = defaultdict(set)
+        self._choseong_gram_index: Dict[str, Set[int]] = defaultdict(set)
+        for doc in range(len(self._names)):
+            for text in (self._keys[doc], *self._alias_keys[doc]):
+                for gram in _ngrams(text, 1) | _ngrams(text, 2):
+                    self._gram_index[gram].add(doc)
+            for gram in _ngrams(self._choseong[doc], 1) | _ngrams(self._choseong[doc], 2):
+                self._choseong_gram_index[gram].add(doc)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @staticmethod
+    def _prefix_range(sorted_keys: List[Tuple[str, int]], prefix: str) -> Iterable[int]:
+        start = bisect.bisect_left(sorted_keys, (prefix, -1))
+        for key, doc in sorted_keys[start:]:
+            if not key.startswith(prefix):
+                break
+            yield doc
+
+    @staticmethod
+    def _candidates(gram_index: Dict[str, Set[int]], query: str) -> Set[int]:
+        grams = _ngrams(query, 2) if len(query) > 1 else _ngrams(query, 1)
+        postings = sorted((gram_index.get(gram, set()) for gram in grams), key=len)
+        if not postings:
+            return set()
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def _fuzzy(self, query: str, exclude: Set[int]) -> Dict[int, float]:
+        grams = _ngrams(query, 2)
+        if len(query) < 2 or not grams:
+            return {}
+        overlap: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for doc in self._gram_index.get(gram, ()):
+                if doc not in exclude:
+                    overlap[doc] += 1
+        needed = max(1, len(grams) // 2)
+        scores: Dict[int, float] = {}
+        for doc, shared in overlap.items():
+            if shared < needed:
+                continue
+            ratio = max(
+                SequenceMatcher(None, query, text).ratio()
+                for text in (self._keys[doc], *self._alias_keys[doc])
+            )
+            if ratio >= _FUZZY_THRESHOLD:
+                scores[doc] = _RANK_FUZZY + (1 - ratio)
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        순위가 매겨진 검색 결과를 반환합니다. limit을 주면 상위 limit개만 반환합니다.
+        """
+        key = normalize(query)
+        if not key:
+            return []
+
+        best: Dict[int, Tuple[float, str]] = {}
+
+        def _offer(doc: int, score: float, match: str) -> None:
+            current = best.get(doc)
+            if current is None or score < current[0]:
+                best[doc] = (score, match)
+
+        exact_ticker = self._ticker_lookup.get(key)
+        if exact_ticker is not None:
+            _offer(exact_ticker, _RANK_TICKER, "ticker")
+        if key.isdigit():
+            for doc in self._prefix_range(self._ticker_prefix, key):
+                _offer(doc, _RANK_TICKER + 0.1, "ticker")
+
+        for doc in self._prefix_range(self._name_prefix, key):
+            _offer(doc, _RANK_EXACT if self._keys[doc] == key else _RANK_PREFIX, "prefix")
+        for doc in self._prefix_range(self._alias_prefix, key):
+            _offer(doc, _RANK_ALIAS_PREFIX, "alias")
+
+        for doc in self._candidates(self._gram_index, key):
+            texts = (self._keys[doc], *self._alias_keys[doc])
+            positions = [text.find(key) for text in texts if key in text]
+            if positions:
+                _offer(doc, _RANK_SUBSTRING + min(positions) / 100, "substring")
+
+        # 초성이 섞인 입력("ㅅㅅ", "삼ㅅ")만 초성 키와 비교합니다.
+        if any(char in _CHOSEONG_SET for char in key):
+            choseong_query = to_choseong(key)
+            for doc in self._prefix_range(self._choseong_prefix, choseong_query):
+                _offer(doc, _RANK_CHOSEONG_PREFIX, "choseong")
+            for doc in self._candidates(self._choseong_gram_index, choseong_query):
+                position = self._choseong[doc].find(choseong_query)
+                if position >= 0:
+                    _offer(doc, _RANK_CHOSEONG_SUBSTRING + position / 100, "choseong")
+
+        if limit is None or len(best) < limit:
+            for doc, score in self._fuzzy(key, set(best)).items():
+                _offer(doc, score, "fuzzy")
+
+        def _rank(item: Tuple[int, Tuple[float, str]]) -> Tuple[float, int, str]:
+            return item[1][0], len(self._names[item[0]]), self._names[item[0]]
+
+        if limit is not None:
+            ranked = heapq.nsmallest(max(limit, 0), best.items(), key=_rank)
+        else:
+            ranked = sorted(best.items(), key=_rank)
+        return [
+            SearchHit(self._names[doc], self._tickers[doc], score, match)
+            for doc, (score, match) in ranked
+        ]
+
+
+__all__ = ["StockSearchIndex", "SearchHit", "DEFAULT_ALIASES", "normalize", "to_choseong"]
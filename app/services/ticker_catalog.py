@@ -0,0 +1,145 @@
+"""종목명↔티커 카탈로그를 일괄 생성하고 디스크에 보관하는 모듈."""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .trading_calendar import KST
+
+logger = logging.getLogger(__name__)
+
+
+class TickerCatalog:
+    """
+    특정 거래일 기준 상장 종목의 티커→종목명, 종목명→티커, 시장 소속 정보를 담습니다.
+    """
+
+    def __init__(self, trading_date: str, names: Mapping[str, str], markets: Mapping[str, str], built_at: Optional[float] = None):
+        self.trading_date = trading_date
+        self.built_at = built_at if built_at is not None else time.time()
+        self.ticker_to_name: Mapping[str, str] = MappingProxyType(dict(names))
+        self.ticker_to_market: Mapping[str, str] = MappingProxyType(dict(markets))
+        self.name_to_ticker: Mapping[str, str] = MappingProxyType(
+            {name: ticker for ticker, name in self.ticker_to_name.items()}
+        )
+
+    def __len__(self) -> int:
+        return len(self.ticker_to_name)
+
+    def tickers_in(self, market: str) -> List[str]:
+        return [ticker for ticker, member in self.ticker_to_market.items() if member == market]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trading_date": self.trading_date,
+            "built_at": self.built_at,
+            "names": dict(self.ticker_to_name),
+            "markets": dict(self.ticker_to_market),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "TickerCatalog":
+        return cls(
+            trading_date=str(payload["trading_date"]),
+            names=payload["names"],
+            markets=payload.get("markets", {}),
+            built_at=float(payload.get("built_at", 0)),
+        )
+
+
+class TickerCatalogStore:
+    """
+    카탈로그를 메모리와 JSON 파일에 보관합니다.
+    기동 시에는 디스크에서 즉시 읽고, 날짜가 바뀌면 백그라운드 스레드에서 다시 생성합니다.
+    """
+
+    def __init__(self, path: Path, builder: Callable[[], TickerCatalog], retry_interval: float = 60 * 10):
+        self.path = Path(path)
+        self.builder = builder
+        self.retry_interval = retry_interval
+        self._last_attempt = 0.0
+        self._catalog: Optional[TickerCatalog] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def load(self) -> Optional[TickerCatalog]:
+        if not self.path.exists():
+            return None
+        try:
+            return TickerCatalog.from_dict(json.loads(self.path.read_text(encoding="utf-8")))
+        except Exception as exc:
+            logger.warning("Failed to load ticker catalog", extra={"path": str(self.path), "error": str(exc)})
+            return None
+
+    def save(self, catalog: TickerCatalog) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(catalog.to_dict(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def is_stale(self, catalog: TickerCatalog, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now(KST)
+        built_day = datetime.fromtimestamp(catalog.built_at, KST).date()
+        return built_day < now.date()
+
+    def refresh(self) -> TickerCatalog:
+        """
+        카탈로그를 동기적으로 다시 생성해 저장합니다.
+        """
+        catalog = self.builder()
+        if not len(catalog):
+            raise RuntimeError("Empty ticker catalog")
+        self.save(catalog)
+        with self._lock:
+            self._catalog = catalog
+        logger.info(
+            "Ticker catalog rebuilt",
+            extra={"trading_date": catalog.trading_date, "tickers": len(catalog)},
+        )
+        return catalog
+
+    def refresh_in_background(self) -> bool:
+        with self._lock:
+            # 실패한 갱신이 조회마다 업스트림을 두드리지 않도록 재시도 간격을 둡니다.
+            if self._refreshing or time.time() - self._last_attempt < self.retry_interval:
+                return False
+            self._refreshing = True
+            self._last_attempt = time.time()
+
+        def _run() -> None:
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.warning("Background ticker catalog refresh failed", extra={"error": str(exc)})
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=_run, name="ticker-catalog-refresh", daemon=True).start()
+        return True
+
+    def get(self) -> TickerCatalog:
+        """
+        메모리 → 디스크 순으로 카탈로그를 찾고, 둘 다 없을 때만 동기 생성합니다.
+        오래된 카탈로그는 그대로 반환하되 백그라운드 갱신을 예약합니다.
+        """
+        with self._lock:
+            catalog = self._catalog
+        if catalog is None:
+            catalog = self.load()
+            if catalog is None:
+                return self.refresh()
+            with self._lock:
+                self._catalog = catalog
+        if self.is_stale(catalog):
+            self.refresh_in_background()
+        return catalog
+
+
+__all__ = ["TickerCatalog", "TickerCatalogStore"]
@@ -0,0 +1,251 @@
+"""KRX 거래일 달력 (세션, 휴장일, 개장·마감 시각)과 달력 기반 캐시 만료 정책."""
+
+import logging
+import os
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 정규장 시간 (KST)
+MARKET_OPEN_TIME = (9, 0)
+MARKET_CLOSE_TIME = (15, 30)
+
+# 연초 첫 거래일은 1시간 늦게 개장합니다.
+_NEW_YEAR_OPEN_TIME = (10, 0)
+
+DayLike = Union[str, date, datetime, pd.Timestamp]
+
+# 알려진 KRX 휴장일 (주말 제외). 수집 중 관측된 휴장일은 add_holidays로 보강하고,
+# 임시 휴장일은 GIFT_KRX_HOLIDAYS="YYYYMMDD,YYYYMMDD"로 추가할 수 있습니다.
+_KNOWN_HOLIDAYS = (
+    # 2024
+    "20240101", "20240209", "20240212", "20240301", "20240410", "20240501", "20240506",
+    "20240515", "20240606", "20240815", "20240916", "20240917", "20240918", "20241001",
+    "20241003", "20241009", "20241225", "20241231",
+    # 2025
+    "20250101", "20250127", "20250128", "20250129", "20250130", "20250303", "20250501",
+    "20250505", "20250506", "20250603", "20250606", "20250815", "20251003", "20251006",
+    "20251007", "20251008", "20251009", "20251225", "20251231",
+    # 2026
+    "20260101", "20260216", "20260217", "20260218", "20260302", "20260501", "20260505",
+    "20260525", "20260603", "20260817", "20260924", "20260925", "20260928", "20261005",
+    "20261009", "20261225", "20261231",
+    # 2027
+    "20270101", "20270208", "20270209", "20270301", "20270505", "20270513", "20270816",
+    "20270914", "20270915", "20270916", "20271004", "20271011", "20271227", "20271231",
+)
+# 휴장일 표가 채워진 마지막 해. 이후 날짜는 주말만 빼고 거래일로 간주하므로 조회 시 경고를 남깁니다.
+KNOWN_HOLIDAYS_LAST_YEAR = max(int(day[:4]) for day in _KNOWN_HOLIDAYS)
+
+# 수능일 등 개장·마감 시각이 바뀌는 날
+_SPECIAL_HOURS: Dict[str, Tuple[Tuple[int, int], Tuple[int, int]]] = {
+    "20241114": ((10, 0), (16, 30)),
+    "20251113": ((10, 0), (16, 30)),
+    "20261119": ((10, 0), (16, 30)),
+}
+
+
+def to_kst(moment: Optional[datetime] = None) -> datetime:
+    """
+    시각을 KST로 맞춥니다. None이면 현재 시각, tz가 없으면 KST로 간주합니다.
+    """
+    if moment is None:
+        return datetime.now(KST)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=KST)
+    return moment.astimezone(KST)
+
+
+def _to_date(day: DayLike) -> date:
+    if isinstance(day, datetime):
+        return to_kst(day).date() if day.tzinfo is not None else day.date()
+    if isinstance(day, date):
+        return day
+    return pd.Timestamp(day).date()
+
+
+class TradingCalendar:
+    """
+    평일 중 휴장일을 뺀 날을 거래일(세션)로 보는 거래소 달력입니다.
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[DayLike] = (),
+        open_time: Tuple[int, int] = MARKET_OPEN_TIME,
+        close_time: Tuple[int, int] = MARKET_CLOSE_TIME,
+        special_hours: Optional[Dict[DayLike, Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+        holidays_known_through: Optional[int] = None,
+    ):
+        self.open_time = time(*open_time)
+        self.close_time = time(*close_time)
+        self._holidays: Set[date] = {_to_date(day) for day in holidays}
+        self._special: Dict[date, Tuple[time, time]] = {
+            _to_date(day): (time(*hours[0]), time(*hours[1])) for day, hours in (special_hours or {}).items()
+        }
+        self._lock = threading.Lock()
+        self.holidays_known_through = holidays_known_through
+        self._warned_years: Set[int] = set()
+
+    def _check_coverage(self, day: date) -> None:
+        # 휴장일 표가 없는 해는 연도마다 한 번만 경고합니다.
+        if self.holidays_known_through is None or day.year <= self.holidays_known_through:
+            return
+        with self._lock:
+            if day.year in self._warned_years:
+                return
+            self._warned_years.add(day.year)
+        logger.warning(
+            "Trading calendar has no holiday table for this year; treating every weekday as a session",
+            extra={"year": day.year, "known_through": self.holidays_known_through},
+        )
+
+    def add_holidays(self, days: Iterable[DayLike]) -> None:
+        parsed = {_to_date(day) for day in days}
+        with self._lock:
+            self._holidays |= parsed
+
+    def holidays(self) -> Set[date]:
+        with self._lock:
+            return set(self._holidays)
+
+    def is_session(self, day: DayLike) -> bool:
+        day = _to_date(day)
+        self._check_coverage(day)
+        return day.weekday() < 5 and day not in self._holidays
+
+    def next_session(self, day: DayLike, inclusive: bool = True) -> date:
+        day = _to_date(day)
+        if not inclusive:
+            day += timedelta(days=1)
+        while not self.is_session(day):
+            day += timedelta(days=1)
+        return day
+
+    def previous_session(self, day: DayLike, inclusive: bool = True) -> date:
+        day = _to_date(day)
+        if not inclusive:
+            day -= timedelta(days=1)
+        while not self.is_session(day):
+            day -= timedelta(days=1)
+        return day
+
+    def sessions(self, start: DayLike, end: DayLike) -> pd.DatetimeIndex:
+        """
+        [start, end] 구간의 거래일 목록을 반환합니다.
+        """
+        days = pd.bdate_range(_to_date(start), _to_date(end))
+        return days[[self.is_session(day) for day in days]] if len(days) else days
+
+    def session_hours(self, day: DayLike) -> Tuple[datetime, datetime]:
+        """
+        거래일의 (개장, 마감) 시각을 KST로 반환합니다.
+        """
+        day = _to_date(day)
+        opened, closed = self._special.get(day, (self.open_time, self.close_time))
+        if day not in self._special and self.previous_session(day, inclusive=False).year < day.year:
+            opened = time(*_NEW_YEAR_OPEN_TIME)
+        return datetime.combine(day, opened, KST), datetime.combine(day, closed, KST)
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        now = to_kst(now)
+        if not self.is_session(now.date()):
+            return False
+        opened, closed = self.session_hours(now.date())
+        return opened <= now < closed
+
+    def next_open(self, now: Optional[datetime] = None) -> datetime:
+        """
+        now 이후 가장 가까운 개장 시각을 반환합니다. (장중이면 다음 거래일 개장)
+        """
+        now = to_kst(now)
+        day = self.next_session(now.date())
+        opened, _closed = self.session_hours(day)
+        if opened <= now:
+            opened, _closed = self.session_hours(self.next_session(day, inclusive=False))
+        return opened
+
+    def last_close(self, now: Optional[datetime] = None) -> datetime:
+        """
+        now 이전(이하)의 가장 최근 장 마감 시각을 반환합니다.
+        """
+        now = to_kst(now)
+        day = self.previous_session(now.date())
+        _opened, closed = self.session_hours(day)
+        if closed > now:
+            _opened, closed = self.session_hours(self.previous_session(day, inclusive=False))
+        return closed
+
+
+def _default_holidays() -> Set[str]:
+    extra = os.getenv("GIFT_KRX_HOLIDAYS", "")
+    return set(_KNOWN_HOLIDAYS) | {day.strip() for day in extra.split(",") if day.strip()}
+
+
+KRX_CALENDAR = TradingCalendar(
+    _default_holidays(), special_hours=_SPECIAL_HOURS, holidays_known_through=KNOWN_HOLIDAYS_LAST_YEAR
+)
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """
+    KRX 정규장 시간대인지 여부를 반환합니다. (휴장일과 개장 시각 변경일 포함)
+    """
+    return KRX_CALENDAR.is_open(now)
+
+
+def last_market_close(now: Optional[datetime] = None) -> datetime:
+    """
+    now 이전의 가장 최근 KRX 장 마감 시각을 반환합니다.
+    """
+    return KRX_CALENDAR.last_close(now)
+
+
+class MarketHoursTTL:
+    """
+    cached(ttl=...)에 넘기는 달력 기반 TTL 정책입니다. 값을 저장하는 시점에 호출되어 TTL(초)을 계산합니다.
+
+    - 장중: intraday초, 단 마감 시각을 넘기지 않습니다.
+    - 마감 직후 settle초 동안: 종가 확정을 반영하도록 intraday 주기를 유지합니다.
+    - 그 밖의 휴장 시간: 다음 개장 시각까지 유지합니다.
+    """
+
+    def __init__(self, intraday: float, settle: float = 30 * 60, calendar: Optional[TradingCalendar] = None):
+        self.intraday = intraday
+        self.settle = settle
+        self.calendar = calendar
+
+    def __call__(self, now: Optional[datetime] = None) -> float:
+        calendar = self.calendar or KRX_CALENDAR
+        now = to_kst(now)
+        if calendar.is_open(now):
+            _opened, closed = calendar.session_hours(now.date())
+            return max(1.0, min(self.intraday, (closed - now).total_seconds()))
+        settled = calendar.last_close(now) + timedelta(seconds=self.settle)
+        if now < settled:
+            return max(1.0, min(self.intraday, (settled - now).total_seconds()))
+        return max(1.0, (calendar.next_open(now) - now).total_seconds())
+
+    def __repr__(self) -> str:
+        return f"MarketHoursTTL(intraday={self.intraday}, settle={self.settle})"
+
+
+__all__ = [
+    "KST",
+    "MARKET_OPEN_TIME",
+    "MARKET_CLOSE_TIME",
+    "TradingCalendar",
+    "KRX_CALENDAR",
+    "KNOWN_HOLIDAYS_LAST_YEAR",
+    "MarketHoursTTL",
+    "is_market_hours",
+    "last_market_close",
+    "to_kst",
+]
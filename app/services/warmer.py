@@ -0,0 +1,318 @@
+"""대시보드 데이터를 주기적으로 미리 불러와 공유 캐시에 채워 두는 스케줄러.
+
+FastAPI 프로세스 안에서 실행하거나(GIFT_WARMER_ENABLED=1), 단독 프로세스로 실행합니다.
+
+    python -m app.services.warmer
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import data_fetcher
+from .cache import TTLSpec
+
+logger = logging.getLogger(__name__)
+
+# 소스별 동시 실행 한도 (실제 요청 속도는 rate_limit 버킷이 제한)
+DEFAULT_SOURCE_LIMITS = {"krx": 2, "yahoo": 1, "ddg": 1}
+
+# 캐시 만료 이 시간(초) 전에 미리 갱신합니다.
+DEFAULT_LEAD = 30.0
+MIN_INTERVAL = 30.0
+
+
+@dataclass
+class WarmJob:
+    """
+    name: 상태 표시용 이름, source: 동시 실행 한도를 나눠 쓰는 데이터 소스,
+    run: 갱신 함수(실패 시 예외), interval: 다음 실행까지의 간격(초 또는 호출 가능한 정책)
+    """
+
+    name: str
+    source: str
+    run: Callable[[], Any]
+    interval: TTLSpec
+    lead: float = DEFAULT_LEAD
+
+
+@dataclass
+class JobStatus:
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    running: bool = False
+    last_started: Optional[float] = None
+    last_finished: Optional[float] = None
+    last_success: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+    next_run: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+@dataclass
+class _JobState:
+    job: WarmJob
+    status: JobStatus = field(default_factory=JobStatus)
+
+
+class MarketDataWarmer:
+    """
+    등록된 작업을 만료 전에 다시 실행해 캐시를 따뜻하게 유지합니다.
+    작업은 스레드 풀에서 병렬로 실행하되, 데이터 소스별 세마포어로 동시 실행 수를 제한합니다.
+    실패한 작업은 지수적으로 간격을 늘려 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[WarmJob],
+        source_limits: Optional[Dict[str, int]] = None,
+        max_workers: int = 4,
+        tick: float = 1.0,
+    ):
+        self._states: Dict[str, _JobState] = {job.name: _JobState(job) for job in jobs}
+        limits = {**DEFAULT_SOURCE_LIMITS, **(source_limits or {})}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {
+            state.job.source: threading.BoundedSemaphore(limits.get(state.job.source, 1))
+            for state in self._states.values()
+        }
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="market-warmer")
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.tick = tick
+
+    @staticmethod
+    def _interval(job: WarmJob) -> float:
+        interval = job.interval() if callable(job.interval) else job.interval
+        return max(MIN_INTERVAL, float(interval or 0) - job.lead)
+
+    def _run_job(self, state: _JobState) -> None:
+        job, status = state.job, state.status
+        with self._semaphores[job.source]:
+            started = time.time()
+            with self._lock:
+                status.last_started = started
+            error: Optional[str] = None
+            try:
+                job.run()
+            except Exception as exc:
+                error = str(exc) or type(exc).__name__
+                logger.warning("Warm-up job failed", extra={"job": job.name, "error": error})
+            finished = time.time()
+
+        with self._lock:
+            status.runs += 1
+            status.running = False
+            status.last_finished = finished
+            status.last_duration = round(finished - started, 3)
+            if error is None:
+                status.last_success = finished
+                status.last_error = None
+                status.consecutive_failures = 0
+                status.next_run = finished + self._interval(job)
+            else:
+                status.failures += 1
+                status.consecutive_failures += 1
+                status.last_error = error
+                backoff = MIN_INTERVAL * 2 ** min(status.consecutive_failures - 1, 5)
+                status.next_run = finished + min(backoff, self._interval(job))
+
+    def _submit_due(self, now: float, names: Optional[Iterable[str]] = None) -> List[Any]:
+        wanted = set(names) if names is not None else None
+        futures = []
+        with self._lock:
+            for name, state in self._states.items():
+                if state.status.running:
+                    continue
+                if wanted is not None:
+                    if name not in wanted:
+                        continue
+                elif state.status.next_run > now:
+                    continue
+                state.status.running = True
+                futures.append(self._executor.submit(self._run_job, state))
+        return futures
+
+    def run_once(self, names: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        지정한 작업(기본: 전체)을 즉시 병렬 실행하고 끝날 때까지 기다린 뒤 상태를 반환합니다.
+        """
+        futures = self._submit_due(time.time(), names=names if names is not None else list(self._states))
+        for future in futures:
+            future.result(timeout=timeout)
+        return self.status()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._submit_due(time.time())
+            except RuntimeError:  # 종료 중 executor가 닫힌 경우
+                break
+            self._stop.wait(self.tick)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="market-warmer", daemon=True)
+        self._thread.start()
+        logger.info("Market data warmer started", extra={"jobs": sorted(self._states)})
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None and wait:
+            self._thread.join(timeout=5)
+        self._thread = None
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs = {name: {"source": state.job.source, **state.status.to_dict()} for name, state in self._states.items()}
+        return {
+            "running": self.running,
+            "healthy": all(job["last_error"] is None for job in jobs.values()),
+            "jobs": jobs,
+        }
+
+
+def _check(key: str, result: Any = None) -> Any:
+    # data_fetcher 함수는 실패해도 대체값을 반환하므로 기록된 오류로 실패를 판단합니다.
+    error = data_fetcher.get_last_data_error(key)
+    if error:
+        raise RuntimeError(error)
+    return result
+
+
+def _refresh_top_100() -> Any:
+    # Top 100은 캐시된 전 종목 프레임으로 만들어지므로, 프레임을 먼저 새로 받아야 오래된 값이 새 TTL로 다시 저장되지 않습니다.
+    data_fetcher.refresh_market_frame()
+    return _check("top_100", data_fetcher.get_top_100_market_cap_stocks.refresh())
+
+
+def _refresh_sectors() -> Any:
+    # 주도 섹터와 섹터 표는 같은 당일 지수 단면을 쓰므로, 단면을 한 번 새로 받은 뒤 두 캐시를 함께 갱신합니다.
+    data_fetcher.refresh_index_day()
+    performance = data_fetcher.get_sector_performance.refresh()
+    table = data_fetcher.get_sector_table.refresh()
+    _check("sector_performance::5", performance)
+    return _check("sector_table", table)
+
+
+def default_jobs() -> List[WarmJob]:
+    return [
+        WarmJob(
+            "market_indices",
+            "krx",
+            lambda: _check("market_indices", data_fetcher.get_market_indices.refresh()),
+            data_fetcher.KRX_INTRADAY_TTL,
+        ),
+        WarmJob("sectors", "krx", _refresh_sectors, data_fetcher.KRX_INTRADAY_TTL),
+        WarmJob(
+            "top_100",
+            "krx",
+            _refresh_top_100,
+            data_fetcher.KRX_INTRADAY_TTL,
+        ),
+        WarmJob(
+            "global_market_snapshot",
+            "yahoo",
+            lambda: _check("global_market_snapshot", data_fetcher.get_global_market_snapshot.refresh()),
+            data_fetcher.GLOBAL_SNAPSHOT_TTL,
+        ),
+        WarmJob(
+            "global_quotes",
+            "yahoo",
+            lambda: _check("global_quotes", data_fetcher._global_quote_table.refresh()),
+            data_fetcher.GLOBAL_SNAPSHOT_TTL,
+        ),
+        WarmJob("ticker_catalog", "krx", data_fetcher.refresh_ticker_catalog, 60 * 60),
+        WarmJob(
+            "market_panel",
+            "krx",
+            lambda: _check("market_panel", data_fetcher.backfill_market_panel()),
+            60 * 60,
+        ),
+        WarmJob(
+            "screener_table",
+            "krx",
+            lambda: _check("screener_table", data_fetcher.refresh_screener_table()),
+            data_fetcher.KRX_INTRADAY_TTL,
+        ),
+    ]
+
+
+def warmer_enabled() -> bool:
+    return os.getenv("GIFT_WARMER_ENABLED", "0").lower() in ("1", "true", "yes", "on")
+
+
+_WARMER: Optional[MarketDataWarmer] = None
+_WARMER_LOCK = threading.Lock()
+
+
+def get_warmer() -> MarketDataWarmer:
+    global _WARMER
+    with _WARMER_LOCK:
+        if _WARMER is None:
+            _WARMER = MarketDataWarmer(default_jobs())
+        return _WARMER
+
+
+def start_warmer() -> MarketDataWarmer:
+    warmer = get_warmer()
+    warmer.start()
+    return warmer
+
+
+def stop_warmer() -> None:
+    global _WARMER
+    with _WARMER_LOCK:
+        warmer, _WARMER = _WARMER, None
+    if warmer is not None:
+        warmer.stop(wait=False)
+
+
+def get_warmer_status() -> Dict[str, Any]:
+    with _WARMER_LOCK:
+        warmer = _WARMER
+    if warmer is None:
+        return {"running": False, "enabled": warmer_enabled(), "healthy": None, "jobs": {}}
+    return {"enabled": warmer_enabled(), **warmer.status()}
+
+
+def main() -> None:  # pragma: no cover - 단독 실행 진입점
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    warmer = start_warmer()
+    try:
+        while True:
+            time.sleep(60)
+            logger.info("Market data warmer status", extra={"status": warmer.status()})
+    except KeyboardInterrupt:
+        stop_warmer()
+
+
+__all__ = [
+    "WarmJob",
+    "MarketDataWarmer",
+    "default_jobs",
+    "get_warmer",
+    "start_warmer",
+    "stop_warmer",
+    "get_warmer_status",
+    "warmer_enabled",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,139 @@
+"""글로벌 관심 종목(지수·환율·금리·원자재·선물) 목록 정의와 설정 파일 로딩."""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# 관심 종목 설정 파일 경로. 없으면 DEFAULT_WATCHLIST를 사용합니다.
+WATCHLIST_FILE_ENV = "GIFT_WATCHLIST_FILE"
+
+
+@dataclass(frozen=True)
+class WatchSymbol:
+    """
+    label: 화면 표시 이름, symbol: 야후 파이낸스 심볼, group: 패널 구분(indices/fx/rates/commodities/futures 등)
+    """
+
+    label: str
+    symbol: str
+    group: str
+
+
+# 기본 관심 종목 (group, label, symbol)
+_DEFAULT_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    # 지수 선물
+    ("futures", "S&P 500 Futures", "ES=F"),
+    ("futures", "Nasdaq 100 Futures", "NQ=F"),
+    ("futures", "Dow Futures", "YM=F"),
+    ("futures", "Russell 2000 Futures", "RTY=F"),
+    ("futures", "Nikkei 225 Futures", "NIY=F"),
+    # 해외 지수
+    ("indices", "S&P 500", "^GSPC"),
+    ("indices", "Nasdaq Composite", "^IXIC"),
+    ("indices", "Dow Jones", "^DJI"),
+    ("indices", "Russell 2000", "^RUT"),
+    ("indices", "VIX", "^VIX"),
+    ("indices", "Philadelphia Semiconductor", "^SOX"),
+    ("indices", "Euro Stoxx 50", "^STOXX50E"),
+    ("indices", "DAX", "^GDAXI"),
+    ("indices", "FTSE 100", "^FTSE"),
+    ("indices", "CAC 40", "^FCHI"),
+    ("indices", "Nikkei 225", "^N225"),
+    ("indices", "Hang Seng", "^HSI"),
+    ("indices", "Shanghai Composite", "000001.SS"),
+    ("indices", "TAIEX", "^TWII"),
+    ("indices", "Nifty 50", "^NSEI"),
+    ("indices", "KOSPI", "^KS11"),
+    ("indices", "KOSDAQ", "^KQ11"),
+    # 환율
+    ("fx", "USD/KRW", "KRW=X"),
+    ("fx", "JPY/KRW", "JPYKRW=X"),
+    ("fx", "EUR/KRW", "EURKRW=X"),
+    ("fx", "CNY/KRW", "CNYKRW=X"),
+    ("fx", "EUR/USD", "EURUSD=X"),
+    ("fx", "USD/JPY", "JPY=X"),
+    ("fx", "GBP/USD", "GBPUSD=X"),
+    ("fx", "USD/CNY", "CNY=X"),
+    ("fx", "Dollar Index", "DX-Y.NYB"),
+    # 금리
+    ("rates", "US 13W T-Bill", "^IRX"),
+    ("rates", "US 5Y Treasury", "^FVX"),
+    ("rates", "US 10Y Treasury", "^TNX"),
+    ("rates", "US 30Y Treasury", "^TYX"),
+    ("rates", "10Y T-Note Futures", "ZN=F"),
+    # 원자재
+    ("commodities", "WTI Crude Oil", "CL=F"),
+    ("commodities", "Brent Crude Oil", "BZ=F"),
+    ("commodities", "Natural Gas", "NG=F"),
+    ("commodities", "Gold", "GC=F"),
+    ("commodities", "Silver", "SI=F"),
+    ("commodities", "Copper", "HG=F"),
+    ("commodities", "Corn", "ZC=F"),
+    ("commodities", "Wheat", "ZW=F"),
+    # 가상자산
+    ("crypto", "Bitcoin", "BTC-USD"),
+    ("crypto", "Ethereum", "ETH-USD"),
+)
+
+DEFAULT_WATCHLIST: Tuple[WatchSymbol, ...] = tuple(
+    WatchSymbol(label=label, symbol=symbol, group=group) for group, label, symbol in _DEFAULT_ROWS
+)
+
+
+def parse_watchlist(rows: Iterable[dict]) -> Tuple[WatchSymbol, ...]:
+    """
+    {"label", "symbol", "group"} 목록을 WatchSymbol 튜플로 바꿉니다. 같은 심볼은 처음 것만 남깁니다.
+    """
+    seen = set()
+    parsed: List[WatchSymbol] = []
+    for row in rows:
+        symbol = str(row.get("symbol") or "").strip()
+        if not symbol or symbol in seen:
+            continue
+        seen.add(symbol)
+        parsed.append(
+            WatchSymbol(
+                label=str(row.get("label") or symbol).strip(),
+                symbol=symbol,
+                group=str(row.get("group") or "other").strip(),
+            )
+        )
+    return tuple(parsed)
+
+
+def load_watchlist(path: Optional[Union[str, Path]] = None) -> Tuple[WatchSymbol, ...]:
+    """
+    JSON 설정 파일(목록 또는 {"symbols": [...]})에서 관심 종목을 읽습니다.
+    path를 생략하면 GIFT_WATCHLIST_FILE을 보고, 지정되지 않았거나 읽을 수 없으면 기본 목록을 반환합니다.
+    """
+    path = path or os.getenv(WATCHLIST_FILE_ENV)
+    if not path:
+        return DEFAULT_WATCHLIST
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        rows = raw.get("symbols", []) if isinstance(raw, dict) else raw
+        watchlist = parse_watchlist(rows)
+    except Exception as exc:
+        logger.warning("Failed to load watchlist; using defaults", extra={"path": str(path), "error": str(exc)})
+        return DEFAULT_WATCHLIST
+    return watchlist or DEFAULT_WATCHLIST
+
+
+def chunked(items: Sequence, size: int) -> List[Sequence]:
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+__all__ = [
+    "WatchSymbol",
+    "DEFAULT_WATCHLIST",
+    "load_watchlist",
+    "parse_watchlist",
+    "chunked",
+]
@@ -1,16 +1,21 @@
 """FastAPI 서버: Swagger 기반 API 문서 제공."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import pandas as pd
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 
+from analytics.screener import FilterSyntaxError
 from app.agents import MultiAgentResult, run_multi_agent_analysis
 from app.services import data_fetcher
+from app.services import warmer
+from app.services.async_http import aclose_async_client
 
 
 def _frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -19,6 +24,10 @@ def _frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
     return df.reset_index().rename(columns={"index": "date"}).to_dict(orient="records")
 
 
+def _clean_number(value: Any) -> Any:
+    return None if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+
 class NewsItemModel(BaseModel):
     title: str = ""
     snippet: str = ""
@@ -29,6 +38,7 @@ class MultiAgentResponseModel(BaseModel):
     stock_name: str
     ticker: Optional[str] = None
     ratios: Dict[str, float] = Field(default_factory=dict)
+    technicals: Dict[str, Optional[float]] = Field(default_factory=dict)
     fundamentals: str
     news_summary: str
     risk_analysis: str
@@ -41,13 +51,48 @@ class MultiAgentRequestModel(BaseModel):
     ticker: Optional[str] = Field(None, description="종목 코드 (선택)")
 
 
+class StockSearchHitModel(BaseModel):
+    name: str
+    ticker: str
+    score: float
+    match: str
+
+
+class GlobalQuoteModel(BaseModel):
+    symbol: str
+    label: str
+    group: str
+    price: Optional[float] = None
+    change: Optional[float] = None
+    change_pct: Optional[float] = None
+    currency: Optional[str] = None
+    market_state: Optional[str] = None
+    timestamp: Optional[int] = None
+    sparkline: List[float] = Field(default_factory=list, description="당일 5분봉 종가")
+
+
 class MarketOverviewModel(BaseModel):
     indices: List[Dict[str, Any]]
     sectors: List[Dict[str, Any]]
     globals: List[Dict[str, Any]]
+    data_age_seconds: Dict[str, Optional[float]] = Field(
+        default_factory=dict, description="데이터셋별 마지막 정상 수집 후 경과 시간(초)"
+    )
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # GIFT_WARMER_ENABLED=1이면 이 프로세스에서 대시보드 데이터를 주기적으로 미리 불러옵니다.
+    if warmer.warmer_enabled():
+        warmer.start_warmer()
+    yield
+    warmer.stop_warmer()
+    # 외부 API용 공유 커넥션 풀을 정리합니다.
+    await aclose_async_client()
 
 
 app = FastAPI(
+    lifespan=_lifespan,
     title="모두의 선물 API",
     description="멀티 에이전트 기반 AI 주식 분석 서비스의 Programmatic API",
     version="1.1.0",
@@ -71,6 +116,24 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/cache", summary="캐시 적중률/제거 통계 조회")
+async def cache_stats() -> Dict[str, Any]:
+    return data_fetcher.get_cache_stats()
+
+
+@app.get("/health/upstreams", summary="업스트림 서킷 상태와 데이터셋별 오류 조회")
+async def upstream_health() -> Dict[str, Any]:
+    return {
+        "upstreams": data_fetcher.get_upstream_health(),
+        "datasets": data_fetcher.get_data_health(),
+    }
+
+
+@app.get("/health/warmer", summary="데이터 사전 적재 작업 상태 조회")
+async def warmer_status() -> Dict[str, Any]:
+    return warmer.get_warmer_status()
+
+
 @app.get(
     "/dashboard/overview",
     response_model=MarketOverviewModel,
@@ -79,9 +142,9 @@ async def health_check() -> Dict[str, str]:
 async def get_dashboard_overview() -> MarketOverviewModel:
     try:
         indices_df, sectors_df, global_snapshot = await asyncio.gather(
-            run_in_threadpool(data_fetcher.get_market_indices),
-            run_in_threadpool(data_fetcher.get_sector_performance),
-            run_in_threadpool(data_fetcher.get_global_market_snapshot),
+            data_fetcher.get_market_indices.aio(),
+            data_fetcher.get_sector_performance.aio(),
+            data_fetcher.get_global_market_snapshot.aio(),
         )
 
         indices = _frame_to_records(indices_df)
@@ -92,7 +155,13 @@ async def get_dashboard_overview() -> MarketOverviewModel:
         )
 
         return MarketOverviewModel(
-            indices=indices, sectors=sectors, globals=global_snapshot
+            indices=indices,
+            sectors=sectors,
+            globals=global_snapshot,
+            data_age_seconds={
+                key: data_fetcher.get_data_age(key)
+                for key in ("market_indices", "sector_performance::5", "global_market_snapshot")
+            },
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -123,7 +192,7 @@ async def analyze_with_multi_agent(
 )
 async def get_top_100() -> List[Dict[str, Any]]:
     try:
-        top_df = await run_in_threadpool(data_fetcher.get_top_100_market_cap_stocks)
+        top_df = await data_fetcher.get_top_100_market_cap_stocks.aio()
         return top_df.reset_index().rename(columns={"index": "rank"}).to_dict(
             orient="records"
         )
@@ -131,6 +200,137 @@ async def get_top_100() -> List[Dict[str, Any]]:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.get(
+    "/market/ranking",
+    summary="전 종목 순위 조회 (시장 필터·정렬 키·페이지)",
+)
+async def get_market_ranking(
+    market: str = Query("ALL", description="시장 필터 (ALL, KOSPI, KOSDAQ)"),
+    sort_by: str = Query("cap", description="정렬 키 (cap, change, volume, turnover)"),
+    ascending: bool = Query(False, description="오름차순 여부"),
+    offset: int = Query(0, ge=0, description="건너뛸 순위 수"),
+    limit: int = Query(100, ge=1, le=1000, description="반환할 종목 수"),
+    top_n: Optional[int] = Query(None, ge=1, description="상위 N개 안에서만 페이지 나누기"),
+) -> List[Dict[str, Any]]:
+    try:
+        frame = await run_in_threadpool(data_fetcher.get_market_frame)
+        ranked = data_fetcher.rank_stocks(market, sort_by, ascending, offset, limit, top_n, frame=frame)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return [
+        {key: _clean_number(value) for key, value in row.items()}
+        for row in ranked.reset_index().rename(columns={"index": "rank"}).to_dict(orient="records")
+    ]
+
+
+@app.get(
+    "/screener",
+    summary="필터 식으로 전 종목 스크리닝 (예: ma_gap_20_pct > 5 and PER < 10)",
+)
+async def run_screener(
+    q: Optional[str] = Query(None, max_length=2000, description="필터 식 (비우면 전체)"),
+    sort_by: Optional[str] = Query("시가총액", description="정렬 컬럼"),
+    ascending: bool = Query(False, description="오름차순 여부"),
+    limit: int = Query(50, ge=1, le=1000, description="최대 결과 수"),
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        results, total = await run_in_threadpool(data_fetcher.run_screener, q, sort_by, ascending, limit)
+    except FilterSyntaxError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return {
+        "total": total,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": [
+            {key: _clean_number(value) for key, value in row.items()} for row in results.to_dict(orient="records")
+        ],
+    }
+
+
+@app.get("/screener/fields", summary="스크리너에서 쓸 수 있는 컬럼 목록")
+async def screener_fields() -> Dict[str, str]:
+    table = await run_in_threadpool(data_fetcher.get_screener_table)
+    return {column: str(dtype) for column, dtype in table.dtypes.items()}
+
+
+@app.get(
+    "/market/indices/history",
+    summary="지수 종가 이력 조회 (임의 지수·기간)",
+)
+async def get_index_history(
+    index: List[str] = Query(["KOSPI", "KOSDAQ", "KOSPI200"], description="지수 라벨 또는 KRX 지수 코드 (예: 1028)"),
+    lookback_days: int = Query(365, ge=1, le=365 * 20, description="조회 기간(일)"),
+) -> List[Dict[str, Any]]:
+    try:
+        history = await run_in_threadpool(data_fetcher.get_index_history, index, lookback_days)
+        return _frame_to_records(history)
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@app.get(
+    "/market/sectors",
+    summary="전체 섹터 지수 순환 표 조회 (1D/1W/1M 수익률)",
+)
+async def get_sector_table(
+    market: Optional[List[str]] = Query(None, description="시장 필터 (KRX, KOSPI, KOSDAQ)"),
+) -> List[Dict[str, Any]]:
+    try:
+        table = await data_fetcher.get_sector_table.aio()
+        if market and not table.empty:
+            table = table[table["시장"].isin([item.upper() for item in market])]
+        return [
+            {key: _clean_number(value) for key, value in row.items()}
+            for row in table.to_dict(orient="records")
+        ]
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@app.get(
+    "/market/global",
+    response_model=List[GlobalQuoteModel],
+    summary="글로벌 관심 종목 시세와 장중 스파크라인 조회",
+)
+async def get_global_panel(
+    group: Optional[List[str]] = Query(None, description="구분 필터 (indices, fx, rates, commodities, futures, crypto)"),
+    sparklines: bool = Query(True, description="장중 스파크라인 포함 여부"),
+) -> List[GlobalQuoteModel]:
+    try:
+        quotes = await data_fetcher.get_global_quotes_async(group)
+        series = await run_in_threadpool(data_fetcher.get_sparklines, list(quotes.index)) if sparklines else {}
+        return [
+            GlobalQuoteModel(
+                symbol=symbol,
+                **{key: _clean_number(value) for key, value in row.items()},
+                sparkline=series[symbol].round(6).tolist() if symbol in series else [],
+            )
+            for symbol, row in quotes.to_dict(orient="index").items()
+        ]
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@app.get(
+    "/stocks/search",
+    response_model=List[StockSearchHitModel],
+    summary="종목 검색 (접두어·초성·티커·영문 별칭)",
+)
+async def search_stocks(
+    q: str = Query(..., min_length=1, description="검색어 (예: 삼성, ㅅㅅㅈㅈ, 005930, samsung)"),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+) -> List[StockSearchHitModel]:
+    try:
+        hits = await run_in_threadpool(data_fetcher.search_stocks, q, limit)
+        return [StockSearchHitModel(**hit._asdict()) for hit in hits]
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,73 @@
+"""
+파라미터 스윕 백테스트 벤치마크.
+
+약 2,500종목 × 10년(2,520거래일) 종가 패널에서 MA 크로스오버 파라미터 조합을
+(1) 종목별 prepare_price_frame + pandas 손익 계산 반복 (일부 종목으로 측정해 전체로 환산)
+(2) sweep(processes=1): 조합마다 2차원 배열 연산 한 번
+(3) sweep(processes=N): 같은 계산을 프로세스 풀에 분산
+으로 돌려 총 소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_backtest.py [종목 수] [프로세스 수]
+"""
+
+from pathlib import Path
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import parameter_grid, prepare_price_frame, sweep  # noqa: E402
+
+GRID = parameter_grid(fast=[5, 10, 20], slow=[60, 120, 200])
+SAMPLE_TICKERS = 50
+
+
+def _close(tickers: int, days: int = 2_520) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2015-01-02", periods=days, name="날짜")
+    columns = [f"{number:06d}" for number in range(tickers)]
+    return pd.DataFrame(10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0)), index=index, columns=columns)
+
+
+def _legacy(close: pd.DataFrame) -> None:
+    for params in GRID:
+        for ticker in close.columns:
+            frame = prepare_price_frame(pd.DataFrame({"종가": close[ticker], "거래량": 0.0}), (params["fast"], params["slow"]))
+            position = (frame[f"MA{params['fast']}"] > frame[f"MA{params['slow']}"]).astype(float)
+            (position.shift(1).fillna(0.0) * frame["종가"].pct_change().fillna(0.0)).add(1).prod()
+
+
+def main(tickers: int = 2_500, processes: int = 0) -> None:
+    close = _close(tickers)
+    processes = processes or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    _legacy(close.iloc[:, :SAMPLE_TICKERS])
+    legacy = (time.perf_counter() - started) * tickers / SAMPLE_TICKERS
+
+    started = time.perf_counter()
+    inline = sweep(close, GRID, processes=1)
+    single = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pooled = sweep(close, GRID, processes=processes)
+    parallel = time.perf_counter() - started
+
+    pd.testing.assert_frame_equal(inline, pooled)
+    print(f"[{close.shape[0]} days x {close.shape[1]} tickers, {len(GRID)} combinations]")
+    print(f"  per-ticker loop (est.) {legacy:>9.2f} s")
+    print(f"  sweep, 1 process       {single:>9.2f} s ({legacy / single:,.0f}x)")
+    print(f"  sweep, {processes} processes{'' if processes > 9 else ' '}    {parallel:>9.2f} s ({legacy / parallel:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 0,
+    )
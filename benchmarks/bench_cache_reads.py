@@ -0,0 +1,112 @@
+"""
+캐시 적중 경로의 복사 비용 비교 벤치마크.
+
+Top 100 / 주요 지수 / 전 종목 데이터셋과 같은 모양의 프레임으로
+(1) 이전 방식: 적중/폴백마다 깊은 복사
+(2) 현재 방식: 읽기 전용으로 고정한 값 공유 + 얕은 뷰
+의 호출당 지연 시간과 할당량을 비교합니다. 두 방식 모두 같은 TTLCache 조회를 거칩니다.
+
+실행: python benchmarks/bench_cache_reads.py [반복 횟수]
+"""
+
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.cache import TTLCache, _share, freeze  # noqa: E402
+
+
+def _top_100_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        {
+            "종목코드": [f"{code:06d}" for code in range(100)],
+            "이름": [f"종목{code}" for code in range(100)],
+            "현재가": rng.integers(1_000, 900_000, 100),
+            "등락률": rng.normal(0, 2, 100),
+            "시가총액": rng.integers(10**11, 5 * 10**14, 100),
+        }
+    )
+    frame.index = frame.index + 1
+    return frame
+
+
+def _indices_frame() -> pd.DataFrame:
+    dates = pd.bdate_range("2024-05-01", periods=22).strftime("%Y-%m-%d")
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {label: rng.normal(2_500, 30, len(dates)) for label in ("KOSPI", "KOSDAQ", "KOSPI200")},
+        index=dates,
+    )
+
+
+def _full_market_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    size = 2_700
+    return pd.DataFrame(
+        {
+            "시가": rng.integers(1_000, 900_000, size),
+            "고가": rng.integers(1_000, 900_000, size),
+            "저가": rng.integers(1_000, 900_000, size),
+            "종가": rng.integers(1_000, 900_000, size),
+            "거래량": rng.integers(0, 10**8, size),
+            "거래대금": rng.integers(0, 10**12, size),
+            "등락률": rng.normal(0, 2, size),
+        },
+        index=pd.Index([f"{code:06d}" for code in range(size)], name="티커"),
+    )
+
+
+def _legacy_copy(value):
+    # 이전 data_fetcher._deep_copy와 같은 동작
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+def _measure(label: str, read, repeat: int) -> None:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        read()
+    elapsed = time.perf_counter() - started
+
+    # 할당량은 지연 시간 측정과 분리해 한 번의 읽기로 잽니다. (tracemalloc 자체가 느리기 때문)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    held = read()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    print(f"{label:<28} {elapsed / repeat * 1e6:>9.1f} us/read {peak / 1024:>9.1f} KiB alloc/read")
+
+
+def main(repeat: int = 2_000) -> None:
+    datasets = {
+        "top_100": _top_100_frame(),
+        "market_indices": _indices_frame(),
+        "full_market": _full_market_frame(),
+    }
+    store = TTLCache()
+    for name, frame in datasets.items():
+        store.set("bench", name, freeze(frame), ttl=600)
+
+        def _legacy_read():
+            # 적중할 때마다 저장본을 깊은 복사해 반환하던 경로
+            return _legacy_copy(store.get("bench", name))
+
+        def _current_read():
+            return _share(store.get("bench", name))
+
+        print(f"[{name}] {frame.shape[0]}x{frame.shape[1]}")
+        _measure("  deep copy per read", _legacy_read, repeat)
+        _measure("  shared read-only view", _current_read, repeat)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,75 @@
+"""
+기술적 지표 라이브러리 처리량 벤치마크.
+
+단일 종목(장기 일봉 시계열)과 전 종목 패널(약 2,500종목 × 1년)에 대해
+지표별·전체 계산의 초당 처리 봉 수(bars/s)를 출력합니다.
+
+실행: python benchmarks/bench_indicators.py [반복 횟수]
+"""
+
+from pathlib import Path
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import indicators  # noqa: E402
+
+
+def _ohlcv(days: int, tickers: int):
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2000-01-03", periods=days)
+    columns = [f"{number:06d}" for number in range(tickers)]
+    close = pd.DataFrame(10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0)), index=index, columns=columns)
+    spread = pd.DataFrame(rng.uniform(0.001, 0.03, (days, tickers)), index=index, columns=columns) * close
+    volume = pd.DataFrame(rng.integers(0, 5_000_000, (days, tickers)).astype(float), index=index, columns=columns)
+    return close + spread, close - spread, close, volume
+
+
+def _measure(label: str, bars: int, fn: Callable[[], object], repeat: int) -> None:
+    fn()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - started) / repeat
+    print(f"  {label:<22} {elapsed * 1e3:>9.2f} ms {bars / elapsed / 1e6:>9.2f} M bars/s")
+
+
+def _suite(high, low, close, volume, repeat: int) -> None:
+    bars = close.size
+    _measure("ema(12)", bars, lambda: indicators.ema(close, 12), repeat)
+    _measure("rsi(14)", bars, lambda: indicators.rsi(close, 14), repeat)
+    _measure("macd(12,26,9)", bars, lambda: indicators.macd(close), repeat)
+    _measure("bollinger(20,2)", bars, lambda: indicators.bollinger_bands(close), repeat)
+    _measure("atr(14)", bars, lambda: indicators.atr(high, low, close, 14), repeat)
+    _measure("obv", bars, lambda: indicators.obv(close, volume), repeat)
+    _measure("stochastic(14,3,3)", bars, lambda: indicators.stochastic(high, low, close), repeat)
+
+
+def main(repeat: int = 5) -> None:
+    high, low, close, volume = _ohlcv(days=5_000, tickers=1)
+    series = [frame.iloc[:, 0] for frame in (high, low, close, volume)]
+    print(f"[series] {len(series[2])} bars")
+    _suite(*series, repeat)
+    frame = pd.DataFrame({"고가": series[0], "저가": series[1], "종가": series[2], "거래량": series[3]})
+    _measure("compute_indicators", len(frame), lambda: indicators.compute_indicators(frame), repeat)
+
+    high, low, close, volume = _ohlcv(days=250, tickers=2_500)
+    print(f"[panel] {close.shape[0]} days x {close.shape[1]} tickers")
+    _suite(high, low, close, volume, repeat)
+    _measure(
+        "compute_panel_indicators",
+        close.size,
+        lambda: indicators.compute_panel_indicators(close, high, low, volume),
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
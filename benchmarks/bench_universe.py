@@ -0,0 +1,58 @@
+"""
+전 종목 지표 스냅샷 계산 벤치마크.
+
+약 2,500종목 × 1년 패널로
+(1) 이전 방식: 종목별 prepare_price_frame + compute_indicator_snapshot 반복
+(2) 현재 방식: compute_universe_snapshot 한 번 (2차원 NumPy 배열 연산)
+의 총 소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_universe.py [종목 수]
+"""
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import compute_indicator_snapshot, compute_universe_snapshot, prepare_price_frame  # noqa: E402
+
+
+def _panels(tickers: int, days: int = 250):
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range("2024-01-02", periods=days, name="날짜")
+    columns = [f"{number:06d}" for number in range(tickers)]
+    close = pd.DataFrame(
+        10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0)), index=index, columns=columns
+    )
+    volume = pd.DataFrame(rng.integers(0, 5_000_000, (days, tickers)).astype(float), index=index, columns=columns)
+    return close, volume
+
+
+def main(tickers: int = 2_500) -> None:
+    close, volume = _panels(tickers)
+
+    started = time.perf_counter()
+    rows = {
+        ticker: compute_indicator_snapshot(prepare_price_frame(pd.DataFrame({"종가": close[ticker], "거래량": volume[ticker]})))
+        for ticker in close.columns
+    }
+    legacy = time.perf_counter() - started
+
+    started = time.perf_counter()
+    snapshot = compute_universe_snapshot(close, volume)
+    vectorized = time.perf_counter() - started
+
+    assert len(snapshot) == len(rows)
+    print(f"[{close.shape[0]} days x {close.shape[1]} tickers]")
+    print(f"  per-ticker loop        {legacy * 1e3:>9.1f} ms")
+    print(f"  universe snapshot      {vectorized * 1e3:>9.1f} ms ({legacy / vectorized:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_500)
@@ -30,9 +30,22 @@ st.markdown(
 st.title("시가총액 Top 100 🏆")
 st.write("---")
 
-# 데이터 로딩 중에 스피너를 표시
+_SORT_LABELS = {"cap": "시가총액", "change": "등락률", "volume": "거래량", "turnover": "거래대금"}
+_PAGE_SIZE = 100
+
+col_market, col_sort, col_top = st.columns(3)
+market = col_market.selectbox("시장", ["ALL", "KOSPI", "KOSDAQ"])
+sort_by = col_sort.selectbox("정렬 기준", list(_SORT_LABELS), format_func=_SORT_LABELS.get)
+top_n = col_top.selectbox("상위 종목 수", [100, 300, 500, 1000])
+page_count = max(1, -(-top_n // _PAGE_SIZE))
+page = st.number_input("페이지", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+
+# 데이터 로딩 중에 스피너를 표시 (같은 거래일의 전 종목 프레임을 재사용하므로 조건을 바꿔도 추가 조회가 없습니다)
 with st.spinner('데이터를 불러오는 중입니다...'):
-    top_100_df = data_fetcher.get_top_100_market_cap_stocks()
+    # 기본 보기도 같은 함수로 불러와 모든 조건에서 같은 컬럼(RANKING_COLUMNS)을 보여 줍니다.
+    top_100_df = data_fetcher.rank_stocks(
+        market=market, sort_by=sort_by, offset=(page - 1) * _PAGE_SIZE, limit=_PAGE_SIZE, top_n=top_n
+    )
 
 if not top_100_df.empty:
     st.dataframe(top_100_df, use_container_width=True, height=35 * (len(top_100_df) + 1))
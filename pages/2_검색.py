@@ -3,7 +3,6 @@
 import pandas as pd
 import streamlit as st
 
-from analytics import compute_indicator_snapshot, prepare_price_frame
 from app.agents import langgraph
 from app.services import data_fetcher
 
@@ -38,7 +37,7 @@ st.write("---")
 search_term = st.text_input("종목명 또는 키워드를 입력하세요 (예: 삼성)")
 
 if search_term:
-    matching_stocks = data_fetcher.search_stocks_by_keyword(search_term)
+    matching_stocks = data_fetcher.search_stocks_by_keyword(search_term, limit=50)
     stock_to_display = None
 
     if not matching_stocks:
@@ -51,17 +50,18 @@ if search_term:
             stock_to_display = selection
 
     if stock_to_display:
-        stock_df, ticker = data_fetcher.get_stock_info_by_name(stock_to_display)
-        
-        if stock_df is not None:
+        # 지표가 붙은 일봉과 요약은 종목별로 캐시되므로 다시 그릴 때 재계산하지 않습니다.
+        enriched_df = data_fetcher.get_stock_indicators(stock_to_display)
+        ticker = data_fetcher.get_stock_name_ticker_map().get(stock_to_display)
+
+        if not enriched_df.empty:
             st.success(f"'{stock_to_display}' (종목코드: {ticker}) 기본 정보")
 
-            enriched_df = prepare_price_frame(stock_df)
-            snapshot = compute_indicator_snapshot(enriched_df)
+            snapshot = data_fetcher.get_technical_summary(stock_to_display)
 
             col1, col2 = st.columns([1, 1])
             with col1:
-                latest_info = stock_df.iloc[-1]
+                latest_info = enriched_df.iloc[-1]
                 st.metric("현재가", f"{latest_info['종가']:,} 원")
                 st.metric("시가", f"{latest_info['시가']:,} 원")
                 st.metric("고가", f"{latest_info['고가']:,} 원")
@@ -95,7 +95,7 @@ if search_term:
                     delta=f"{volume_delta:+.2f}%",
                 )
 
-            price_tab, indicator_tab = st.tabs(["가격/거래량 차트", "세부 지표"])
+            price_tab, indicator_tab, momentum_tab = st.tabs(["가격/거래량 차트", "세부 지표", "모멘텀 지표"])
             with price_tab:
                 moving_avg_columns = [col for col in ["MA5", "MA20", "MA60"] if col in enriched_df.columns]
                 chart_data = enriched_df[["종가", *moving_avg_columns]].dropna()
@@ -157,6 +157,33 @@ if search_term:
                     use_container_width=True,
                 )
 
+            with momentum_tab:
+                recent = enriched_df.tail(120)
+                band_columns = [col for col in ["종가", "BB_upper", "BB_mid", "BB_lower"] if col in recent.columns]
+                st.caption("볼린저 밴드 (20일, 2σ)")
+                st.line_chart(recent[band_columns].dropna())
+                col_rsi, col_macd = st.columns(2)
+                with col_rsi:
+                    st.caption("RSI (14)")
+                    st.line_chart(recent["RSI14"].dropna())
+                with col_macd:
+                    st.caption("MACD (12, 26, 9)")
+                    st.line_chart(recent[["MACD", "MACD_signal"]].dropna())
+                momentum_data = [
+                    {"지표": "RSI (14)", "현재": snapshot.get("rsi_14")},
+                    {"지표": "MACD 히스토그램", "현재": snapshot.get("macd_hist")},
+                    {"지표": "볼린저 %B", "현재": snapshot.get("bb_pctb")},
+                    {"지표": "ATR (14)", "현재": snapshot.get("atr_14")},
+                    {"지표": "스토캐스틱 %K", "현재": snapshot.get("stoch_k")},
+                    {"지표": "스토캐스틱 %D", "현재": snapshot.get("stoch_d")},
+                    {"지표": "OBV", "현재": snapshot.get("obv")},
+                ]
+                st.dataframe(
+                    pd.DataFrame(momentum_data).style.format({"현재": "{:,.2f}"}, na_rep="-"),
+                    hide_index=True,
+                    use_container_width=True,
+                )
+
             st.write("---")
             st.subheader("🤖 AI 종합 분석 (LangGraph)")
             if st.button("AI 종합 분석 시작하기"):
@@ -164,7 +191,7 @@ if search_term:
                     ratios = data_fetcher.get_financial_ratios(ticker)
                     if ratios:
                         final_report = langgraph.run_analysis_agent(
-                            stock_to_display, ticker, ratios
+                            stock_to_display, ticker, ratios, technicals=snapshot
                         )
                         st.markdown(final_report)
                     else:
@@ -0,0 +1,84 @@
+# pages/4_스크리너.py : 필터 식 기반 전 종목 스크리너 메뉴
+
+import time
+
+import streamlit as st
+
+from analytics.screener import FilterSyntaxError
+from app.services import data_fetcher
+
+# 메뉴 순서 지정을 위한 CSS 코드
+st.markdown(
+    """
+    <style>
+    /* 사이드바 전체를 대상으로 Flexbox 레이아웃을 명시적으로 지정 */
+    section[data-testid="stSidebar"] > div:first-child {
+        display: flex;
+        flex-direction: column;
+    }
+    
+    /* 메뉴(페이지 네비게이션)의 순서를 '1'번으로, 맨 위로 설정 */
+    [data-testid="stSidebarNav"] {
+        order: 1;
+    }
+
+    /* 직접 작성한 사이드바 내용 컨테이너의 순서를 '2'번으로, 메뉴 아래로 설정 */
+    section[data-testid="stSidebar"] > div:first-child > div:first-child {
+        order: 2;
+    }
+    </style>
+    """,
+    unsafe_allow_html=True,
+)
+
+st.title("종목 스크리너 🧮")
+st.write("---")
+
+_EXAMPLES = {
+    "직접 입력": "",
+    "20일선 돌파 + 거래량 급증 + 저PER": "ma_gap_20_pct > 5 and volume_gap_pct > 100 and PER < 10",
+    "과매도 (RSI < 30)": "rsi_14 < 30 and 시가총액 > 1e11",
+    "52주 신고가 근접": "distance_high_pct > -3 and return_20_pct > 0",
+    "고배당 저PBR (KOSPI)": '시장 == "KOSPI" and DIV > 4 and PBR < 1',
+}
+
+with st.spinner("전 종목 데이터를 준비하는 중입니다..."):
+    table = data_fetcher.get_screener_table()
+
+if table.empty:
+    st.error("스크리너 데이터를 불러오지 못했습니다. 전 종목 패널이 채워졌는지 확인해주세요.")
+    table_error = data_fetcher.get_last_data_error("screener_table")
+    if table_error:
+        st.caption(f"⚠️ 조회 오류: {table_error}")
+    st.stop()
+
+example = st.selectbox("예시 조건", list(_EXAMPLES))
+expression = st.text_input(
+    "필터 식 (and/or/not, 비교 연산자, 산술 연산 사용 가능)",
+    value=_EXAMPLES[example],
+    placeholder="예: ma_gap_20_pct > 5 and volume_gap_pct > 100 and PER < 10",
+)
+numeric_columns = [column for column in table.columns if table[column].dtype.kind in "fiu"]
+col_sort, col_order, col_limit = st.columns([2, 1, 1])
+sort_by = col_sort.selectbox(
+    "정렬 기준", numeric_columns, index=numeric_columns.index("시가총액") if "시가총액" in numeric_columns else 0
+)
+ascending = col_order.radio("순서", ["내림차순", "오름차순"], horizontal=True) == "오름차순"
+limit = col_limit.number_input("결과 수", min_value=10, max_value=500, value=50, step=10)
+
+with st.expander("사용 가능한 컬럼"):
+    st.write(", ".join(f"`{column}`" for column in table.columns))
+
+started = time.perf_counter()
+try:
+    results, total = data_fetcher.run_screener(expression, sort_by, ascending, int(limit))
+except FilterSyntaxError as exc:
+    st.error(f"필터 식 오류: {exc}")
+    st.stop()
+elapsed_ms = (time.perf_counter() - started) * 1000
+
+st.caption(f"전체 {len(table):,}종목 중 {total:,}종목 일치 · {elapsed_ms:.1f} ms")
+if results.empty:
+    st.info("조건에 맞는 종목이 없습니다.")
+else:
+    st.dataframe(results, hide_index=True, use_container_width=True)
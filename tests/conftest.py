@@ -0,0 +1,18 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_cache(tmp_path, monkeypatch):
+    # 테스트가 실제 .cache/shared_cache.sqlite3를 읽거나 쓰지 않도록 테스트마다 새 파일을 씁니다.
+    from app.services import shared_cache
+
+    store = shared_cache.SharedCache(tmp_path / "shared_cache.sqlite3")
+    monkeypatch.setattr(shared_cache, "_SHARED", store)
+    return store
@@ -0,0 +1,54 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_request_json_retries_rate_limits_without_blocking(monkeypatch):
+    import asyncio
+
+    import httpx
+
+    from app.services import async_http
+
+    responses = [httpx.Response(429), httpx.Response(200, json={"ok": True})]
+    sleeps = []
+
+    def _handler(request):
+        assert request.url.params["symbols"] == "ES=F"
+        return responses.pop(0)
+
+    async def _fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    async def _run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        monkeypatch.setattr(async_http, "get_async_client", lambda: client)
+        try:
+            return await async_http.request_json_with_retry(
+                "https://example.test/quote", params={"symbols": "ES=F"}
+            )
+        finally:
+            await client.aclose()
+
+    monkeypatch.setattr(async_http.asyncio, "sleep", _fake_sleep)
+    assert asyncio.run(_run()) == {"ok": True}
+    assert sleeps == [1.0]
+
+
+def test_shared_client_is_reused_within_a_loop():
+    import asyncio
+
+    from app.services import async_http
+
+    async def _run():
+        first = async_http.get_async_client()
+        second = async_http.get_async_client()
+        await async_http.aclose_async_client()
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first is second
+    assert first.is_closed
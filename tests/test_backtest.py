@@ -0,0 +1,140 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import prepare_price_frame  # noqa: E402
+from analytics.backtest import parameter_grid, run_backtest, strategy_positions, sweep  # noqa: E402
+
+
+def _close(tickers: int = 6, days: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    index = pd.bdate_range("2023-01-02", periods=days, name="날짜")
+    close = pd.DataFrame(
+        10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0)),
+        index=index,
+        columns=[f"{number:06d}" for number in range(tickers)],
+    )
+    close.iloc[:40, 1] = np.nan  # 늦게 상장한 종목
+    close.iloc[150:155, 2] = np.nan  # 거래정지
+    return close
+
+
+def _reference_daily_returns(close: pd.DataFrame, fast: int, slow: int, cost_bps: float) -> pd.Series:
+    # 종목별 prepare_price_frame 이동평균으로 신호를 만들고 하루씩 손익을 더하는 기준 구현
+    ticker_returns = {}
+    for ticker in close.columns:
+        frame = prepare_price_frame(pd.DataFrame({"종가": close[ticker], "거래량": 0.0}), ma_windows=(fast, slow))
+        position = (frame[f"MA{fast}"] > frame[f"MA{slow}"]).astype(float).where(close[ticker].notna(), 0.0)
+        daily = (close[ticker] / close[ticker].shift(1) - 1).fillna(0.0)
+        trades = position.diff().fillna(position).abs()
+        ticker_returns[ticker] = position.shift(1).fillna(0.0) * daily - trades * cost_bps / 10_000
+    return pd.DataFrame(ticker_returns).sum(axis=1) / close.notna().sum(axis=1)
+
+
+def test_ma_crossover_matches_per_ticker_reference():
+    close = _close()
+    result = run_backtest(close, "ma_crossover", {"fast": 5, "slow": 20}, cost_bps=10)
+
+    expected = _reference_daily_returns(close, 5, 20, 10)
+    np.testing.assert_allclose(result.daily_returns.to_numpy(), expected.to_numpy(), atol=1e-12)
+    np.testing.assert_allclose(result.equity.iloc[-1], (1 + expected).prod())
+    assert result.stats["total_return_pct"] == pytest.approx(((1 + expected).prod() - 1) * 100)
+    assert result.per_ticker.loc["000001", "trades"] >= 1
+    assert result.per_ticker.loc["000001", "exposure_pct"] < 100
+
+    positions = strategy_positions(close, "ma_crossover", fast=5, slow=20)
+    assert not positions.iloc[:19].to_numpy().any()
+    assert not positions.iloc[:59, 1].any()
+
+
+def test_signals_do_not_look_ahead_and_returns_panel_fixes_splits():
+    close = _close()
+    base = run_backtest(close, "momentum", {"lookback": 20})
+    shocked = close.copy()
+    shocked.iloc[-1] *= 3
+    changed = run_backtest(shocked, "momentum", {"lookback": 20})
+    pd.testing.assert_series_equal(base.daily_returns.iloc[:-1], changed.daily_returns.iloc[:-1])
+
+    flat = pd.DataFrame({"000001": [100.0] * 30 + [50.0] * 30}, index=pd.bdate_range("2024-01-02", periods=60))
+    always_long = {"lookback": 1, "threshold_pct": -100}
+    assert run_backtest(flat, "momentum", always_long, cost_bps=0).stats["total_return_pct"] == pytest.approx(-50)
+    reported = pd.DataFrame(0.0, index=flat.index, columns=flat.columns)
+    adjusted = run_backtest(flat, "momentum", always_long, returns=reported, cost_bps=0)
+    assert adjusted.stats["total_return_pct"] == pytest.approx(0)
+
+
+def _split_panels():
+    # 000000 종목은 150번째 거래일에 1:2 액면분할(수정 전 종가가 절반으로) — 등락률은 실제 변동만 반영합니다.
+    adjusted = _close(tickers=3)
+    raw = adjusted.copy()
+    raw.iloc[:150, 0] *= 2
+    returns = adjusted.pct_change(fill_method=None)
+    return raw, adjusted, returns
+
+
+def test_split_in_panel_does_not_fire_signals_when_returns_are_given():
+    raw, adjusted, returns = _split_panels()
+    for strategy, params in (("ma_crossover", {"fast": 5, "slow": 20}), ("momentum", {"lookback": 20})):
+        expected = strategy_positions(adjusted, strategy, **params)
+        pd.testing.assert_frame_equal(strategy_positions(raw, strategy, returns=returns, **params), expected)
+        corrected = run_backtest(raw, strategy, params, returns=returns)
+        reference = run_backtest(adjusted, strategy, params)
+        np.testing.assert_allclose(corrected.daily_returns, reference.daily_returns, atol=1e-12)
+        assert corrected.per_ticker["trades"].tolist() == reference.per_ticker["trades"].tolist()
+
+    naive = strategy_positions(raw, "momentum", lookback=20)
+    assert not naive.iloc[150:170, 0].any() and strategy_positions(adjusted, "momentum", lookback=20).iloc[150:170, 0].any()
+
+
+def test_sweep_in_process_pool_matches_inline_and_skips_invalid_combinations():
+    close = _close()
+    grid = parameter_grid(fast=[5, 10, 20], slow=[10, 20, 60])
+    inline = sweep(close, grid, processes=1)
+    pooled = sweep(close, grid, processes=2)
+
+    assert len(inline) == 6
+    assert set(map(tuple, inline[["fast", "slow"]].to_numpy())) == {(5, 10), (5, 20), (5, 60), (10, 20), (10, 60), (20, 60)}
+    assert inline["sharpe"].is_monotonic_decreasing
+    pd.testing.assert_frame_equal(inline, pooled)
+
+    best = inline.iloc[0]
+    single = run_backtest(close, "ma_crossover", {"fast": int(best["fast"]), "slow": int(best["slow"])})
+    assert single.stats["sharpe"] == pytest.approx(best["sharpe"])
+
+    with pytest.raises(ValueError):
+        sweep(close, grid, strategy="unknown")
+
+
+def test_strategy_sweep_reads_only_the_local_panel(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    raw, adjusted, returns = _split_panels()
+    store = MarketPanelStore(tmp_path / "panel")
+    for day in raw.index:
+        store.write_day(day, pd.DataFrame({"종가": raw.loc[day], "거래량": 1.0, "등락률": returns.loc[day] * 100}))
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", store)
+    monkeypatch.setattr(
+        data_fetcher, "get_market_panel", lambda field="종가", lookback_days=0: store.load_panel(field)
+    )
+
+    def _no_network(*_args, **_kwargs):
+        raise AssertionError("backtests must not call pykrx")
+
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ohlcv", _no_network)
+
+    results = data_fetcher.run_strategy_sweep(parameter_grid(fast=[5], slow=[20]), processes=1, cost_bps=0)
+    reference = run_backtest(adjusted, "ma_crossover", {"fast": 5, "slow": 20}, cost_bps=0)
+    assert results.loc[0, "total_return_pct"] == pytest.approx(reference.stats["total_return_pct"])
+    assert results.loc[0, "trades"] == reference.stats["trades"]
+    single = data_fetcher.run_strategy_backtest("ma_crossover", {"fast": 5, "slow": 20}, tickers=["000000"])
+    assert list(single.per_ticker.index) == ["000000"]
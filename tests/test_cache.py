@@ -0,0 +1,243 @@
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+class _Clock:
+    def __init__(self, start: float = 1_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    from app.services import cache as cache_module
+
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    store = cache_module.TTLCache()
+
+    store.set("ns", "key", "value", ttl=10)
+    assert store.get("ns", "key") == "value"
+
+    clock.now += 11
+    assert store.get("ns", "key", None) is None
+    stats = store.stats()["namespaces"]["ns"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["expirations"] == 1
+
+
+def test_lru_eviction_by_count_and_bytes():
+    from app.services.cache import TTLCache, estimate_size
+
+    by_count = TTLCache(max_entries=2)
+    by_count.set("ns", 1, "a")
+    by_count.set("ns", 2, "b")
+    by_count.get("ns", 1)
+    by_count.set("ns", 3, "c")
+    assert by_count.get("ns", 2, None) is None
+    assert by_count.get("ns", 1) == "a"
+    assert by_count.stats()["evictions"] == 1
+
+    frame = pd.DataFrame({"value": range(1_000)})
+    budget = estimate_size(frame) * 2 + 1
+    by_bytes = TTLCache(max_bytes=budget)
+    for key in range(3):
+        by_bytes.set("frames", key, frame.copy())
+    stats = by_bytes.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= budget
+    assert by_bytes.get("frames", 0, None) is None
+
+
+def test_cached_decorator_honours_ttl_and_skips_exceptions(monkeypatch):
+    from app.services import cache as cache_module
+
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    store = cache_module.TTLCache()
+    calls = []
+
+    @cache_module.cached(ttl=60, cache=store, show_spinner=False)
+    def _load(top_n: int = 5):
+        calls.append(top_n)
+        if top_n < 0:
+            raise RuntimeError("boom")
+        return [top_n]
+
+    # 캐시된 list는 읽기 전용 tuple로 고정되어 반환됩니다.
+    assert _load() == (5,)
+    assert _load(top_n=5) == (5,)
+    assert calls == [5]
+
+    clock.now += 61
+    assert _load(5) == (5,)
+    assert calls == [5, 5]
+
+    for _ in range(2):
+        try:
+            _load(-1)
+        except RuntimeError:
+            pass
+    assert calls == [5, 5, -1, -1]
+
+    stats = store.stats()["namespaces"][_load.cache_namespace]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+
+
+def test_stale_value_is_served_while_refreshing_in_background(monkeypatch):
+    import threading
+
+    from app.services import cache as cache_module
+
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    store = cache_module.TTLCache()
+    release = threading.Event()
+    calls = []
+
+    @cache_module.cached(ttl=60, stale_ttl=600, cache=store)
+    def _load():
+        calls.append(len(calls))
+        if len(calls) > 1:
+            release.wait(timeout=5)
+        return len(calls)
+
+    assert _load() == 1
+
+    clock.now += 61
+    # 만료된 값을 즉시 반환하고, 중복 호출이 있어도 갱신은 한 번만 예약됩니다.
+    assert _load() == 1
+    assert _load() == 1
+    release.set()
+    cache_module.wait_for_refreshes(timeout=5)
+    assert calls == [0, 1]
+    assert _load() == 2
+    assert store.stats()["stale_hits"] == 2
+
+    # stale 허용 구간까지 지나면 호출자가 직접 다시 불러옵니다.
+    clock.now += 61 + 600
+    assert _load() == 3
+
+
+def test_concurrent_misses_share_one_upstream_call():
+    import asyncio
+    import time as real_time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.services import cache as cache_module
+
+    store = cache_module.TTLCache()
+    calls = []
+
+    @cache_module.cached(ttl=60, cache=store)
+    def _fetch(symbol: str):
+        calls.append(symbol)
+        real_time.sleep(0.2)
+        return {"symbol": symbol}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: _fetch("ES=F"), range(8)))
+    assert calls == ["ES=F"]
+    assert all(result == {"symbol": "ES=F"} for result in results)
+
+    async def _burst():
+        return await asyncio.gather(*(_fetch.aio("NQ=F") for _ in range(8)))
+
+    results = asyncio.run(_burst())
+    assert calls == ["ES=F", "NQ=F"]
+    assert all(result == {"symbol": "NQ=F"} for result in results)
+    assert cache_module.SINGLE_FLIGHT.in_flight() == 0
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    import threading
+    import time as real_time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.services.cache import SingleFlight
+
+    flight = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def _fail():
+        calls.append(1)
+        gate.wait(timeout=5)
+        raise RuntimeError("upstream 429")
+
+    def _call(_):
+        try:
+            flight.do("quote", _fail)
+        except RuntimeError as exc:
+            return str(exc)
+        return None
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_call, i) for i in range(4)]
+        real_time.sleep(0.1)
+        gate.set()
+        errors = [future.result() for future in futures]
+
+    assert calls == [1]
+    assert errors == ["upstream 429"] * 4
+
+
+def test_cache_hits_share_data_without_copying():
+    import numpy as np
+
+    from app.services import cache as cache_module
+
+    store = cache_module.TTLCache()
+
+    @cache_module.cached(ttl=60, cache=store)
+    def _load():
+        return pd.DataFrame({"종가": [100.0, 101.0, 102.0]}, index=["a", "b", "c"])
+
+    first = _load()
+    second = _load()
+    assert first is not second
+    assert np.shares_memory(first["종가"].to_numpy(), second["종가"].to_numpy())
+
+    # 값을 제자리에서 고치면 캐시 원본을 바꾸는 대신 실패하고, 열 추가·인덱스 교체는 받은 뷰에만 반영됩니다.
+    try:
+        first.loc["a", "종가"] = -1.0
+    except ValueError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("cached frames should be read-only")
+    first["신규"] = 1
+    first.index = ["x", "y", "z"]
+    third = _load()
+    assert third.loc["a", "종가"] == 100.0
+    assert list(third.index) == ["a", "b", "c"]
+    assert "신규" not in third.columns
+    mutable = third.copy()
+    mutable.loc["a", "종가"] = -1.0
+    assert _load().loc["a", "종가"] == 100.0
+
+    # pandas 전역 옵션은 바꾸지 않습니다.
+    assert not pd.get_option("mode.copy_on_write")
+
+
+def test_freeze_makes_nested_containers_read_only():
+    from app.services.cache import freeze
+
+    frozen = freeze([{"label": "USD/KRW", "tags": ["fx"]}])
+    assert isinstance(frozen, tuple)
+    assert frozen[0]["tags"] == ("fx",)
+    try:
+        frozen[0]["label"] = "changed"
+    except TypeError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("frozen mapping should reject writes")
+    assert freeze(frozen) == frozen
@@ -0,0 +1,157 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+class _Clock:
+    def __init__(self, start: float = 100.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fail(breaker, message="connection refused"):
+    try:
+        breaker.call(_raise, RuntimeError(message))
+    except RuntimeError:
+        pass
+
+
+def _raise(exc):
+    raise exc
+
+
+def test_breaker_opens_probes_and_closes(monkeypatch):
+    from app.services import circuit_breaker
+    from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+    clock = _Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=10)
+
+    _fail(breaker)
+    assert breaker.state == circuit_breaker.CLOSED
+    _fail(breaker)
+    assert breaker.state == circuit_breaker.OPEN
+
+    calls = []
+    try:
+        breaker.call(calls.append, "blocked")
+    except CircuitOpenError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected CircuitOpenError")
+    assert calls == []
+
+    # 대기 시간이 지나면 탐색 호출 하나만 통과시키고, 실패하면 두 배로 기다립니다.
+    clock.now += 10
+    assert breaker.state == circuit_breaker.HALF_OPEN
+    _fail(breaker)
+    assert breaker.state == circuit_breaker.OPEN
+    clock.now += 10
+    assert breaker.state == circuit_breaker.OPEN
+    clock.now += 10
+
+    breaker.allow()
+    try:
+        breaker.allow()
+    except CircuitOpenError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("only one probe may run while half-open")
+    breaker.record_success(0.05)
+    assert breaker.state == circuit_breaker.CLOSED
+
+    snapshot = breaker.snapshot()
+    assert snapshot["opened"] == 2
+    assert snapshot["rejected"] == 2
+    assert snapshot["failure_rate"] == 0.75
+    assert snapshot["last_error"] == "connection refused"
+
+
+def test_rate_limited_errors_do_not_open_the_circuit():
+    import requests
+
+    from app.services.circuit_breaker import CLOSED, OPEN, CircuitBreaker
+
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    response = requests.Response()
+    response.status_code = 429
+    try:
+        breaker.call(_raise, requests.exceptions.HTTPError("Too Many Requests", response=response))
+    except requests.exceptions.HTTPError:
+        pass
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["failures"] == 0
+
+    # 상태 코드가 아니라 메시지에 "429"가 들어간 일반 오류는 실패로 셉니다.
+    _fail(breaker, "invalid ticker 429")
+    assert breaker.state == OPEN
+
+
+def test_empty_krx_results_count_as_failures(monkeypatch):
+    import importlib
+
+    import pandas as pd
+
+    from app.services import circuit_breaker, data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    breaker = circuit_breaker.CircuitBreaker("krx", failure_threshold=2)
+    monkeypatch.setattr(circuit_breaker, "KRX", breaker)
+    # pykrx는 내부 오류를 삼키고 빈 프레임을 돌려줍니다.
+    monkeypatch.setattr(data_fetcher.stock, "get_market_fundamental_by_ticker", lambda *_args, **_kwargs: pd.DataFrame())
+
+    for _ in range(2):
+        try:
+            data_fetcher._load_market_fundamentals.__wrapped__("20240614")
+        except circuit_breaker.EmptyResultError:
+            pass
+        else:  # pragma: no cover
+            raise AssertionError("expected EmptyResultError")
+    assert breaker.state == circuit_breaker.OPEN
+    assert "returned no data" in breaker.snapshot()["last_error"]
+
+    # 빈 결과가 정상인 호출(휴장일 단면 등)은 실패로 세지 않습니다.
+    healthy = circuit_breaker.CircuitBreaker("krx", failure_threshold=1)
+    monkeypatch.setattr(circuit_breaker, "KRX", healthy)
+    assert data_fetcher._krx_call(pd.DataFrame, expect_data=False).empty
+    assert healthy.state == circuit_breaker.CLOSED
+
+
+def test_open_yahoo_circuit_skips_retries_and_serves_fallback(monkeypatch):
+    import importlib
+
+    import requests
+
+    from app.services import circuit_breaker, data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    breaker = circuit_breaker.CircuitBreaker("yahoo", failure_threshold=3)
+    monkeypatch.setattr(circuit_breaker, "YAHOO", breaker)
+    monkeypatch.setitem(circuit_breaker.BREAKERS, "yahoo", breaker)
+    monkeypatch.setattr(data_fetcher.time, "sleep", lambda _seconds: None)
+    requests_made = []
+
+    def _down(url, params=None, timeout=None):
+        requests_made.append(url)
+        raise requests.exceptions.ConnectionError("upstream down")
+
+    monkeypatch.setattr(data_fetcher._REQUEST_SESSION, "get", _down)
+
+    first = data_fetcher.get_global_market_snapshot.__wrapped__()
+    assert len(requests_made) == 3
+    second = data_fetcher.get_global_market_snapshot.__wrapped__()
+    assert len(requests_made) == 3
+    assert [item["label"] for item in first] == [item["label"] for item in second]
+    assert "circuit open" in data_fetcher.get_last_data_error("global_market_snapshot")
+
+    health = data_fetcher.get_upstream_health()["yahoo"]
+    assert health["state"] == circuit_breaker.OPEN
+    assert health["failure_rate"] == 1.0
+    assert "rate_limit" in health
+    assert data_fetcher.get_data_health()["global_market_snapshot"]["status"] == "failing"
@@ -13,10 +13,6 @@ def test_global_snapshot_returns_placeholder_on_failure(monkeypatch):
 
     data_fetcher = importlib.reload(data_fetcher)
 
-    # ensure no persistent cache exists
-    if data_fetcher.GLOBAL_SNAPSHOT_CACHE_FILE.exists():
-        data_fetcher.GLOBAL_SNAPSHOT_CACHE_FILE.unlink()
-
     def _fail_request(url, params):
         raise requests.exceptions.HTTPError("forced failure")
 
@@ -30,6 +26,8 @@ def test_global_snapshot_returns_placeholder_on_failure(monkeypatch):
 
 def test_sector_performance_fallback(monkeypatch):
     import importlib
+    import pandas as pd
+    import pytest
     from app.services import data_fetcher
 
     data_fetcher = importlib.reload(data_fetcher)
@@ -37,34 +35,42 @@ def test_sector_performance_fallback(monkeypatch):
     monkeypatch.setattr(
         data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240614"
     )
+    catalog = pd.DataFrame(
+        {"지수명": ["KRX 반도체", "KRX 바이오", "코스피"], "시장": ["KRX", "KRX", "KOSPI"]},
+        index=["5356", "5352", "1001"],
+    )
+    monkeypatch.setattr(data_fetcher, "get_index_catalog", lambda: catalog)
+    cross_section = pd.DataFrame(
+        {"종가": [110.0, 99.0, 2500.0], "등락률": [10.0, -1.0, 0.5]}, index=["5356", "5352", "1001"]
+    )
+    monkeypatch.setattr(data_fetcher, "_index_day", lambda _day: cross_section)
+    # 주도 섹터는 당일 지수 단면에서 고르므로 섹터별 이력 조회가 없습니다.
+    monkeypatch.setattr(
+        data_fetcher.stock, "get_index_ohlcv_by_date", lambda *_args: pytest.fail("unexpected per-sector call")
+    )
 
-    def _snapshot(sector_name, *_args, **_kwargs):
-        return {
-            "섹터": sector_name,
-            "현재가": 100.0,
-            "전일대비": 1.0,
-            "등락률(%)": 1.0,
-        }
-
-    monkeypatch.setattr(data_fetcher, "_load_sector_snapshot", _snapshot)
     success_df = data_fetcher.get_sector_performance()
-    assert not success_df.empty
+    assert list(success_df["섹터"]) == ["KRX 반도체", "KRX 바이오"]
+    assert success_df.loc[0, "전일대비"] == pytest.approx(10.0)
+    assert success_df.loc[1, "등락률(%)"] == -1.0
 
-    def _raise_snapshot(*_args, **_kwargs):
+    def _raise_day(_day):
         raise RuntimeError("forced failure")
 
-    monkeypatch.setattr(data_fetcher, "_load_sector_snapshot", _raise_snapshot)
+    monkeypatch.setattr(data_fetcher, "_index_day", _raise_day)
 
     fallback_df = data_fetcher.get_sector_performance.__wrapped__(top_n=5)
     assert not fallback_df.empty
     assert data_fetcher.get_last_data_error("sector_performance::5")
 
 
-def test_search_news_handles_exception(monkeypatch):
+def test_search_news_handles_exception(monkeypatch, tmp_path):
     import importlib
     from app.services import data_fetcher
+    from app.services.news_store import NewsStore
 
     data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_NEWS_STORE", NewsStore(tmp_path / "news.sqlite3"))
 
     class _FailingDDGS:
         def __enter__(self):
@@ -76,4 +82,359 @@ def test_search_news_handles_exception(monkeypatch):
     monkeypatch.setattr(data_fetcher, "DDGS", lambda: _FailingDDGS())
 
     results = data_fetcher.search_news("삼성전자")
-    assert results == []
+    assert results == ()
+
+    # 정상 결과도 캐시와 공유되는 읽기 전용 시퀀스로 반환됩니다.
+    monkeypatch.setattr(
+        data_fetcher, "_fetch_and_store_news", lambda _name: [{"title": "제목", "snippet": "", "link": "https://a"}]
+    )
+    news = data_fetcher.search_news("SK하이닉스")
+    assert news is data_fetcher.search_news("SK하이닉스")
+    assert isinstance(news, tuple)
+    try:
+        news[0]["title"] = "changed"
+    except TypeError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("cached news items should be read-only")
+
+
+def test_financial_ratios_batch_downloads_fundamentals_once_per_day(monkeypatch):
+    import importlib
+    import pandas as pd
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+
+    monkeypatch.setattr(
+        data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240614"
+    )
+    calls = []
+
+    def _fundamentals(date, market="KOSPI"):
+        calls.append((date, market))
+        return pd.DataFrame(
+            {"PER": [10.5, 22.0], "PBR": [1.2, 3.4]},
+            index=pd.Index(["005930", "247540"], name="티커"),
+        )
+
+    monkeypatch.setattr(data_fetcher.stock, "get_market_fundamental_by_ticker", _fundamentals)
+
+    batch = data_fetcher.get_financial_ratios_batch(["005930", "247540", "999999"])
+    assert batch["005930"]["PER"] == 10.5
+    assert batch["247540"]["PBR"] == 3.4
+    assert batch["999999"] == {}
+    assert data_fetcher.get_financial_ratios("247540")["PER"] == 22.0
+    fundamentals = data_fetcher.get_market_fundamentals()
+    assert len(fundamentals) == 2
+    # 복사 없이 공유하는 뷰이므로 값 배열은 쓰기 금지이고, 컬럼을 바꿔도 캐시 원본은 그대로입니다.
+    assert not fundamentals["PER"].to_numpy().flags.writeable
+    fundamentals["PER"] = 0.0
+    assert data_fetcher.get_market_fundamentals()["PER"].tolist() == [10.5, 22.0]
+    assert calls == [("20240614", "ALL")]
+
+
+def test_global_snapshot_aio_uses_native_async_loader(monkeypatch):
+    import asyncio
+    import importlib
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+
+    def _blocking_request(*_args, **_kwargs):
+        raise AssertionError("the async path should not use the blocking session")
+
+    calls = []
+
+    async def _async_request(url, params, **_kwargs):
+        calls.append(params["symbols"])
+        return {
+            "quoteResponse": {
+                "result": [{"symbol": "KRW=X", "regularMarketPrice": 1380.5, "regularMarketChange": 2.0}]
+            }
+        }
+
+    monkeypatch.setattr(data_fetcher, "_request_with_retry", _blocking_request)
+    monkeypatch.setattr(data_fetcher, "request_json_with_retry", _async_request)
+
+    async def _burst():
+        return await asyncio.gather(*(data_fetcher.get_global_market_snapshot.aio() for _ in range(5)))
+
+    results = asyncio.run(_burst())
+    assert len(calls) == 1
+    assert all(result[0]["label"] == "USD/KRW" for result in results)
+    assert data_fetcher.get_global_market_snapshot()[0]["price"] == 1380.5
+
+
+def test_global_quotes_are_fetched_in_parallel_chunks(monkeypatch):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.watchlist import WatchSymbol
+
+    data_fetcher = importlib.reload(data_fetcher)
+    universe = tuple(WatchSymbol(f"Symbol {i}", f"S{i}", "fx" if i % 2 else "indices") for i in range(120))
+    monkeypatch.setattr(data_fetcher, "WATCHLIST", universe)
+    requested = []
+
+    def _quotes(url, params):
+        symbols = params["symbols"].split(",")
+        requested.append(len(symbols))
+        if "S100" in symbols:
+            raise RuntimeError("chunk failed")
+        return {
+            "quoteResponse": {
+                "result": [{"symbol": symbol, "regularMarketPrice": float(symbol[1:])} for symbol in symbols]
+            }
+        }
+
+    monkeypatch.setattr(data_fetcher, "_request_with_retry", _quotes)
+
+    quotes = data_fetcher.get_global_quotes()
+    assert sorted(requested) == [20, 50, 50]
+    assert len(quotes) == 100
+    assert quotes.loc["S42", "price"] == 42.0
+    assert "20 symbols unavailable" in data_fetcher.get_last_data_error("global_quotes")
+    assert set(data_fetcher.get_global_quotes(["fx"])["group"]) == {"fx"}
+
+
+def test_sparklines_are_cached_per_series(monkeypatch):
+    import importlib
+    import time as time_module
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    data_fetcher.DEFAULT_CACHE.invalidate(data_fetcher._SPARKLINE_NAMESPACE)
+    now = int(time_module.time())
+    requested = []
+
+    def _spark(url, params):
+        symbols = params["symbols"].split(",")
+        requested.append(symbols)
+        payload = {}
+        for symbol in symbols:
+            # ES=F는 거래 중(최근 봉), ^N225는 휴장 중(오래된 봉)인 시리즈입니다.
+            last = now if symbol == "ES=F" else now - 6 * 3600
+            payload[symbol] = {"timestamp": [last - 600, last - 300, last], "close": [1.0, None, 3.0]}
+        return payload
+
+    monkeypatch.setattr(data_fetcher, "_request_with_retry", _spark)
+
+    series = data_fetcher.get_sparklines(["ES=F", "^N225"])
+    assert series["ES=F"].tolist() == [1.0, 3.0]
+    assert str(series["ES=F"].index.tz) == "Asia/Seoul"
+    assert data_fetcher._sparkline_ttl(series["ES=F"], "5m") == 300
+    assert data_fetcher._sparkline_ttl(series["^N225"], "5m") == data_fetcher.SPARKLINE_IDLE_TTL
+
+    again = data_fetcher.get_sparklines(["^N225", "ES=F", "CL=F"])
+    assert requested == [["ES=F", "^N225"], ["CL=F"]]
+    assert list(again) == ["^N225", "ES=F", "CL=F"]
+
+
+def test_index_history_is_parallel_and_incremental(monkeypatch, tmp_path):
+    import importlib
+    import pandas as pd
+    from app.services import data_fetcher
+    from app.services.ohlcv_store import OhlcvStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_INDEX_STORE", OhlcvStore(tmp_path / "index_ohlcv"))
+    calls = []
+
+    def _index_ohlcv(fromdate, todate, ticker):
+        calls.append((ticker, fromdate))
+        index = pd.bdate_range(fromdate, todate, name="날짜")
+        return pd.DataFrame({"종가": [float(int(ticker))] * len(index)}, index=index)
+
+    monkeypatch.setattr(data_fetcher.stock, "get_index_ohlcv_by_date", _index_ohlcv)
+
+    indices = data_fetcher.get_market_indices.__wrapped__()
+    assert list(indices.columns) == ["KOSPI", "KOSDAQ", "KOSPI200"]
+    assert sorted(ticker for ticker, _start in calls) == ["1001", "1028", "2001"]
+
+    # 같은 구간을 다시 요청하면 저장소가 최신이므로 업스트림을 호출하지 않습니다.
+    calls.clear()
+    data_fetcher.get_market_indices.__wrapped__()
+    assert calls == []
+
+    # 더 긴 기간은 해당 지수만 한 번 전체를 받아 저장합니다.
+    history = data_fetcher.get_index_history(["kospi200"], lookback_days=365 * 5)
+    assert list(history.columns) == ["KOSPI200"]
+    assert [ticker for ticker, _start in calls] == ["1028"]
+    assert len(history) > 1200
+    calls.clear()
+    data_fetcher._index_history.cache_clear()
+    data_fetcher.get_index_history(["1028"], lookback_days=365 * 5)
+    assert calls == []
+
+
+def test_sector_table_uses_daily_catalog_and_stored_closes(monkeypatch, tmp_path):
+    import importlib
+    import pandas as pd
+    import pytest
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+    from app.services.trading_calendar import KRX_CALENDAR, last_market_close
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_INDEX_PANEL", MarketPanelStore(tmp_path / "index_panel"))
+    monkeypatch.setattr(data_fetcher.rate_limit, "KRX", data_fetcher.rate_limit.TokenBucket("krx", rate=1000, burst=1000))
+    sessions = KRX_CALENDAR.sessions(last_market_close() - pd.Timedelta(days=60), last_market_close().date())
+    day = sessions[-1].strftime("%Y%m%d")
+    monkeypatch.setattr(data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: day)
+
+    catalog = {
+        "KOSPI": {"1001": "코스피", "1013": "전기전자"},
+        "KOSDAQ": {"2001": "코스닥"},
+        "KRX": {"5356": "KRX 반도체"},
+        "테마": {"1155": "테마지수"},
+    }
+    names = {ticker: name for tickers in catalog.values() for ticker, name in tickers.items()}
+    listing_calls = []
+
+    def _ticker_list(date, market="KOSPI"):
+        listing_calls.append(market)
+        return list(catalog[market])
+
+    def _price_change(fromdate, todate, market):
+        position = sessions.get_loc(pd.Timestamp(fromdate))
+        rows = {name: float(100 + position) for name in catalog[market].values()}
+        return pd.DataFrame(
+            {"시가": list(rows.values()), "종가": list(rows.values()), "등락률": [1.5] * len(rows)},
+            index=pd.Index(list(rows), name="지수명"),
+        )
+
+    monkeypatch.setattr(data_fetcher.stock, "get_index_ticker_list", _ticker_list)
+    monkeypatch.setattr(data_fetcher.stock, "get_index_ticker_name", names.get)
+    monkeypatch.setattr(data_fetcher.stock, "get_index_price_change", _price_change)
+
+    table = data_fetcher.get_sector_table.__wrapped__()
+    assert sorted(table["티커"]) == ["1001", "1013", "2001", "5356"]
+    # 카탈로그는 시장별 목록을 한 번씩만 조회합니다.
+    assert sorted(listing_calls) == sorted(catalog)
+    assert data_fetcher._find_index_ticker("KRX 반도체", day) == "5356"
+
+    row = table.set_index("티커").loc["5356"]
+    latest = 100 + len(sessions) - 1
+    assert row["1D(%)"] == 1.5
+    assert row["1W(%)"] == pytest.approx((latest / (latest - 5) - 1) * 100)
+    assert row["1M(%)"] == pytest.approx((latest / (latest - 21) - 1) * 100)
+    assert row["시장"] == "KRX"
+
+    # 저장된 단면을 다시 쓰므로 업스트림 호출이 없습니다.
+    monkeypatch.setattr(
+        data_fetcher.stock, "get_index_price_change", lambda *_args: pytest.fail("unexpected upstream call")
+    )
+    assert len(data_fetcher.get_sector_table.__wrapped__()) == 4
+
+
+def test_sector_table_bases_use_calendar_sessions_when_panel_days_are_missing():
+    import pandas as pd
+    import pytest
+    from app.services import data_fetcher
+    from app.services.trading_calendar import KRX_CALENDAR, last_market_close
+
+    sessions = KRX_CALENDAR.sessions(last_market_close() - pd.Timedelta(days=60), last_market_close().date())
+    closes = pd.DataFrame({"5356": [float(100 + i) for i in range(len(sessions))]}, index=sessions)
+    # 1W 기준일과 오늘 사이의 거래일 하루, 1M 기준일 당일이 패널에 없습니다.
+    closes = closes.drop([sessions[-3], sessions[-22]])
+    today = pd.DataFrame({"종가": [closes.iloc[-1, 0]], "등락률": [1.0]}, index=["5356"])
+    catalog = pd.DataFrame({"지수명": ["KRX 반도체"], "시장": ["KRX"]}, index=["5356"])
+
+    row = data_fetcher._build_sector_table(today, closes, catalog).set_index("티커").loc["5356"]
+    latest = 100 + len(sessions) - 1
+    # 위치 기준이면 빠진 날만큼 더 과거가 잡히지만, 달력 기준은 정확한 기준일(없으면 직전 저장 종가)을 씁니다.
+    assert row["1W(%)"] == pytest.approx((latest / (latest - 5) - 1) * 100)
+    assert row["1M(%)"] == pytest.approx((latest / (latest - 22) - 1) * 100)
+
+
+def test_rank_stocks_pages_one_cached_market_frame(monkeypatch, tmp_path):
+    import importlib
+    import numpy as np
+    import pandas as pd
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+    from app.services.ticker_catalog import TickerCatalog
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", MarketPanelStore(tmp_path / "panel"))
+    monkeypatch.setattr(data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240614")
+
+    rng = np.random.default_rng(7)
+    tickers = [f"{number:06d}" for number in range(1, 1201)]
+    cap = pd.DataFrame(
+        {
+            "종가": rng.uniform(1_000, 100_000, len(tickers)),
+            "시가총액": rng.uniform(1e9, 1e13, len(tickers)),
+            "거래량": rng.integers(0, 10_000_000, len(tickers)),
+            "거래대금": rng.uniform(0, 1e11, len(tickers)),
+            "상장주식수": rng.integers(1_000_000, 10_000_000, len(tickers)),
+        },
+        index=pd.Index(tickers, name="티커"),
+    )
+    changes = pd.DataFrame(
+        {"시가": 1.0, "고가": 1.0, "저가": 1.0, "종가": 1.0, "등락률": rng.normal(0, 3, len(tickers))},
+        index=pd.Index(tickers, name="티커"),
+    )
+    cap_calls = []
+
+    def _market_cap(date, *_args, **_kwargs):
+        cap_calls.append(date)
+        return cap
+
+    monkeypatch.setattr(data_fetcher.stock, "get_market_cap_by_ticker", _market_cap)
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ohlcv_by_ticker", lambda *_args, **_kwargs: changes)
+    catalog = TickerCatalog(
+        "20240614",
+        names={ticker: f"종목{ticker}" for ticker in tickers},
+        markets={ticker: "KOSPI" if int(ticker) % 2 else "KOSDAQ" for ticker in tickers},
+    )
+    monkeypatch.setattr(data_fetcher, "get_ticker_catalog", lambda: catalog)
+
+    top = data_fetcher.get_top_100_market_cap_stocks.__wrapped__()
+    assert list(top.columns) == ["종목코드", "이름", "현재가", "등락률", "시가총액"]
+    assert list(top.index) == list(range(1, 101))
+    assert list(top["종목코드"]) == list(cap["시가총액"].sort_values(ascending=False).index[:100])
+
+    # 다른 시장·정렬 키·페이지도 같은 거래일 프레임을 재사용합니다.
+    page = data_fetcher.rank_stocks(market="KOSDAQ", sort_by="turnover", offset=100, limit=50, top_n=500)
+    kosdaq = cap[[int(ticker) % 2 == 0 for ticker in cap.index]]
+    expected = kosdaq["거래대금"].sort_values(ascending=False).index[100:150]
+    assert list(page["종목코드"]) == list(expected)
+    assert list(page.index) == list(range(101, 151))
+    assert set(page["시장"]) == {"KOSDAQ"}
+    assert data_fetcher.rank_stocks(offset=480, limit=50, top_n=500).index[-1] == 500
+    assert data_fetcher.rank_stocks(sort_by="change", ascending=True, limit=1)["등락률"].iloc[0] == changes["등락률"].min()
+    assert cap_calls == ["20240614"]
+
+
+def test_stock_indicators_are_cached_per_stock(monkeypatch):
+    import importlib
+    import numpy as np
+    import pandas as pd
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    index = pd.bdate_range("2024-01-02", periods=120, name="날짜")
+    close = 1_000 + np.arange(120.0)
+    history = pd.DataFrame(
+        {"시가": close, "고가": close + 5, "저가": close - 5, "종가": close, "거래량": 1_000.0}, index=index
+    )
+    calls = []
+
+    def _info(stock_name):
+        calls.append(stock_name)
+        return (history, "000001") if stock_name == "샘플" else (None, None)
+
+    monkeypatch.setattr(data_fetcher, "get_stock_info_by_name", _info)
+
+    enriched = data_fetcher.get_stock_indicators("샘플")
+    assert {"MA20", "RSI14", "MACD", "BB_upper", "ATR14", "OBV", "STOCH_K"}.issubset(enriched.columns)
+    summary = data_fetcher.get_technical_summary("샘플")
+    assert summary["rsi_14"] == 100.0
+    assert summary["ma_gap_20_pct"] > 0
+    assert calls == ["샘플"]
+
+    # 이력이 없는 종목은 빈 프레임을 돌려주고 캐시하지 않습니다.
+    assert data_fetcher.get_stock_indicators("없음").empty
+    assert data_fetcher.get_stock_indicators("없음").empty
+    assert calls == ["샘플", "없음", "없음"]
@@ -0,0 +1,144 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import indicators  # noqa: E402
+
+# Wilder RSI 예제 종가
+_WILDER_CLOSES = [
+    44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08,
+    45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64,
+]
+
+
+def _ohlcv(days: int = 120, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1.5, days))
+    spread = rng.uniform(0.1, 2.0, days)
+    return pd.DataFrame(
+        {
+            "시가": close + rng.normal(0, 0.5, days),
+            "고가": close + spread,
+            "저가": close - spread,
+            "종가": close,
+            "거래량": rng.integers(1_000, 100_000, days).astype(float),
+        },
+        index=pd.bdate_range("2024-01-02", periods=days),
+    )
+
+
+def _reference_wilder(values, period):
+    # 첫 period개 단순평균으로 시작해 (prev * (period - 1) + x) / period로 평활
+    out = [np.nan] * len(values)
+    out[period - 1] = sum(values[:period]) / period
+    for i in range(period, len(values)):
+        out[i] = (out[i - 1] * (period - 1) + values[i]) / period
+    return out
+
+
+def _reference_ema(values, span):
+    alpha = 2 / (span + 1)
+    out = [np.nan] * len(values)
+    out[span - 1] = sum(values[:span]) / span
+    for i in range(span, len(values)):
+        out[i] = alpha * values[i] + (1 - alpha) * out[i - 1]
+    return out
+
+
+def test_rsi_matches_wilder_reference():
+    close = pd.Series(_WILDER_CLOSES)
+    result = indicators.rsi(close, 14)
+    assert result.iloc[:14].isna().all()
+    assert result.iloc[14:].round(2).tolist() == [70.46, 66.25, 66.48, 69.35, 66.29, 57.92]
+
+    deltas = np.diff(_WILDER_CLOSES)
+    gains = _reference_wilder(list(np.clip(deltas, 0, None)), 14)
+    losses = _reference_wilder(list(np.clip(-deltas, 0, None)), 14)
+    expected = [100 - 100 / (1 + g / l) for g, l in zip(gains[13:], losses[13:])]
+    assert result.iloc[14:].tolist() == pytest.approx(expected)
+
+    assert indicators.rsi(pd.Series(np.arange(30.0)), 14).iloc[-1] == 100.0
+    assert indicators.rsi(pd.Series([5.0] * 30), 14).iloc[-1] == 50.0
+
+
+def test_ema_macd_and_bollinger_match_reference():
+    frame = _ohlcv()
+    close = frame["종가"]
+    values = close.tolist()
+    assert indicators.ema(close, 12).tolist() == pytest.approx(_reference_ema(values, 12), nan_ok=True)
+
+    line, signal, hist = indicators.macd(close)
+    expected_line = np.array(_reference_ema(values, 12)) - np.array(_reference_ema(values, 26))
+    assert line.tolist() == pytest.approx(list(expected_line), nan_ok=True)
+    expected_signal = [np.nan] * 25 + _reference_ema(list(expected_line[25:]), 9)
+    assert signal.tolist() == pytest.approx(expected_signal, nan_ok=True)
+    assert hist.dropna().tolist() == pytest.approx((line - signal).dropna().tolist())
+
+    upper, middle, lower, percent_b = indicators.bollinger_bands(close, 20, 2.0)
+    window = np.array(values[-20:])
+    assert middle.iloc[-1] == pytest.approx(window.mean())
+    assert upper.iloc[-1] == pytest.approx(window.mean() + 2 * window.std())
+    assert lower.iloc[-1] == pytest.approx(window.mean() - 2 * window.std())
+    assert percent_b.iloc[-1] == pytest.approx((values[-1] - lower.iloc[-1]) / (upper.iloc[-1] - lower.iloc[-1]))
+
+
+def test_atr_obv_and_stochastic_match_reference():
+    frame = _ohlcv(60)
+    high, low, close, volume = (frame[column].tolist() for column in ("고가", "저가", "종가", "거래량"))
+
+    true_ranges = [
+        max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])) for i in range(1, len(close))
+    ]
+    expected_atr = [np.nan] + _reference_wilder(true_ranges, 14)
+    result = indicators.atr(frame["고가"], frame["저가"], frame["종가"], 14)
+    assert result.tolist() == pytest.approx(expected_atr, nan_ok=True)
+
+    expected_obv = [0.0]
+    for i in range(1, len(close)):
+        step = volume[i] if close[i] > close[i - 1] else -volume[i] if close[i] < close[i - 1] else 0.0
+        expected_obv.append(expected_obv[-1] + step)
+    assert indicators.obv(frame["종가"], frame["거래량"]).tolist() == pytest.approx(expected_obv)
+
+    fast_k = [
+        100 * (close[i] - min(low[i - 13 : i + 1])) / (max(high[i - 13 : i + 1]) - min(low[i - 13 : i + 1]))
+        for i in range(13, len(close))
+    ]
+    slow_k = [np.mean(fast_k[i - 2 : i + 1]) for i in range(2, len(fast_k))]
+    percent_k, percent_d = indicators.stochastic(frame["고가"], frame["저가"], frame["종가"])
+    assert percent_k.dropna().tolist() == pytest.approx(slow_k)
+    assert percent_d.iloc[-1] == pytest.approx(np.mean(slow_k[-3:]))
+
+
+def test_panel_indicators_equal_per_series_results():
+    frames = {ticker: _ohlcv(80, seed=seed) for seed, ticker in enumerate(["000010", "000020", "000030"])}
+    panel = {column: pd.DataFrame({t: f[column] for t, f in frames.items()}) for column in ("고가", "저가", "종가", "거래량")}
+    # 늦게 상장한 종목: 앞쪽 결측이 있어도 그 종목의 첫 봉부터 계산합니다.
+    for column in panel:
+        panel[column].iloc[:20, 2] = np.nan
+
+    panels = indicators.compute_panel_indicators(panel["종가"], panel["고가"], panel["저가"], panel["거래량"])
+    for ticker in frames:
+        single = indicators.compute_indicators(pd.DataFrame({c: panel[c][ticker] for c in panel}).dropna())
+        for name, values in panels.items():
+            assert values[ticker].dropna().tolist() == pytest.approx(single[name].dropna().tolist()), (ticker, name)
+
+    summary = indicators.summarize_indicators(single)
+    assert summary["rsi_14"] == pytest.approx(single["RSI14"].iloc[-1])
+    assert summary["atr_pct"] == pytest.approx(single["ATR14"].iloc[-1] / single["종가"].iloc[-1] * 100)
+
+
+def test_wide_panel_recursion_matches_per_column_smoothing():
+    rng = np.random.default_rng(2)
+    panel = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, (60, 40)), axis=0))
+    panel.iloc[:15, 3] = np.nan
+    panel.iloc[30:33, 7] = np.nan  # 거래정지
+    wide = indicators.rsi(panel, 14)
+    for column in (0, 3, 7):
+        assert wide[column].tolist() == pytest.approx(indicators.rsi(panel[column], 14).tolist(), nan_ok=True)
@@ -0,0 +1,124 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+_TICKERS = ["005930", "000660", "035420"]
+
+
+def _make_cross_section(date: str) -> pd.DataFrame:
+    if date == "20240606":  # 현충일 휴장
+        return pd.DataFrame(
+            0, index=pd.Index(_TICKERS, name="티커"), columns=["시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"]
+        )
+    base = int(date[-2:])
+    return pd.DataFrame(
+        {
+            "시가": [base * 100 + i for i in range(len(_TICKERS))],
+            "고가": [base * 110 + i for i in range(len(_TICKERS))],
+            "저가": [base * 90 + i for i in range(len(_TICKERS))],
+            "종가": [base * 105 + i for i in range(len(_TICKERS))],
+            "거래량": [1000 + i for i in range(len(_TICKERS))],
+            "거래대금": [100000 + i for i in range(len(_TICKERS))],
+            "등락률": [0.5 * i for i in range(len(_TICKERS))],
+        },
+        index=pd.Index(_TICKERS, name="티커"),
+    )
+
+
+def test_backfill_calls_upstream_once_per_day(tmp_path):
+    from app.services.market_panel import MarketPanelStore
+
+    calls = []
+
+    def _fetch(date):
+        calls.append(date)
+        return _make_cross_section(date)
+
+    store = MarketPanelStore(tmp_path)
+    candidates = pd.bdate_range("2024-06-03", "2024-06-07")
+    summary = store.backfill(candidates, _fetch)
+
+    assert calls == ["20240603", "20240604", "20240605", "20240606", "20240607"]
+    assert summary == {"requested": 5, "ingested": 4, "holidays": 1, "failed": 0}
+    assert store.covers(candidates)
+
+    # 두 번째 실행은 저장된 날짜와 휴장일을 건너뜁니다.
+    store.backfill(candidates, _fetch)
+    assert len(calls) == 5
+
+    close_panel = store.load_panel("종가")
+    assert close_panel.shape == (4, len(_TICKERS))
+    assert list(close_panel.columns) == sorted(_TICKERS)
+
+    assert close_panel.loc["2024-06-07", "000660"] == 7 * 105 + 1
+
+
+def test_load_panel_reads_only_requested_and_new_days(tmp_path, monkeypatch):
+    from app.services import market_panel
+    from app.services.market_panel import MarketPanelStore
+
+    store = MarketPanelStore(tmp_path)
+    store.backfill(pd.bdate_range("2024-06-03", "2024-06-05"), _make_cross_section)
+
+    reads = []
+    read_table = market_panel.pq.read_table
+
+    def _spy(path, *args, **kwargs):
+        reads.append(Path(path).parent.name)
+        return read_table(path, *args, **kwargs)
+
+    monkeypatch.setattr(market_panel.pq, "read_table", _spy)
+
+    # 시작일 이전 파일은 읽지 않습니다.
+    panel = store.load_panel("종가", start="20240604")
+    assert list(panel.index) == [pd.Timestamp("2024-06-04"), pd.Timestamp("2024-06-05")]
+    assert reads == ["date=20240604", "date=20240605"]
+
+    # 같은 필드를 다시 읽으면 새로 저장된 날짜만 읽어 덧붙입니다.
+    store.ingest_day("20240607", _make_cross_section)
+    reads.clear()
+    panel = store.load_panel("종가")
+    assert reads == ["date=20240603", "date=20240607"]
+    assert list(panel.index) == [pd.Timestamp(day) for day in ("2024-06-03", "2024-06-04", "2024-06-05", "2024-06-07")]
+    assert panel.loc["2024-06-07", "000660"] == 7 * 105 + 1
+    reads.clear()
+    store.load_panel("종가", start="20240604")
+    assert reads == []
+
+
+def test_get_stock_info_by_name_serves_adjusted_history_regardless_of_panel(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+    from app.services.ohlcv_store import OhlcvStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    store = MarketPanelStore(tmp_path / "panel")
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", store)
+    monkeypatch.setattr(data_fetcher, "_OHLCV_STORE", OhlcvStore(tmp_path / "ohlcv", refresh_interval=3600))
+    monkeypatch.setattr(data_fetcher, "get_stock_name_ticker_map", lambda: {"샘플": "005930"})
+    lookback_days = (datetime.now() - datetime(2024, 6, 3)).days
+    monkeypatch.setattr(data_fetcher, "STOCK_HISTORY_LOOKBACK_DAYS", lookback_days)
+
+    # 패널에는 6/5 액면분할(1:2)로 수정 전 종가가 반 토막 난 단면이 저장되어 있습니다.
+    days = pd.bdate_range("2024-06-03", "2024-06-07")
+    for day, close in zip(days, [200.0, 202.0, 101.0, 102.0, 103.0]):
+        store.write_day(day, pd.DataFrame({"종가": [close], "거래량": [1.0]}, index=pd.Index(["005930"], name="티커")))
+    adjusted = pd.DataFrame(
+        {"시가": 100.0, "고가": 104.0, "저가": 99.0, "종가": [100.0, 101.0, 101.0, 102.0, 103.0], "거래량": 2.0},
+        index=pd.Index(days, name="날짜"),
+    )
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ohlcv_by_date", lambda *_args, **_kwargs: adjusted)
+
+    expected = adjusted.copy()
+    expected.index = expected.index.strftime("%Y-%m-%d")
+    df, ticker = data_fetcher.get_stock_info_by_name("샘플")
+    assert ticker == "005930"
+    pd.testing.assert_frame_equal(df, expected.loc[df.index])
+    assert df["종가"].pct_change().min() > -0.05
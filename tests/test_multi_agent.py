@@ -15,6 +15,7 @@ def test_multi_agent_returns_fallback_when_llm_unavailable(monkeypatch):
     )
     monkeypatch.setattr(data_fetcher, "get_financial_ratios", lambda ticker: {})
     monkeypatch.setattr(data_fetcher, "search_news", lambda _: [])
+    monkeypatch.setattr(data_fetcher, "get_technical_summary", lambda _: {})
 
     # invoke_prompt_safely가 fallback 메시지를 그대로 반환하도록 변경
     monkeypatch.setattr(
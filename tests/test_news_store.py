@@ -0,0 +1,80 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_url_normalization():
+    from app.services.news_store import normalize_url
+
+    assert normalize_url("http://WWW.News.com/a/b/?utm_source=x&id=3#top") == "https://news.com/a/b?id=3"
+    assert normalize_url("https://news.com/a/b?id=3") == "https://news.com/a/b?id=3"
+    assert normalize_url("") == ""
+
+
+def test_store_dedups_across_queries_and_expires(monkeypatch, tmp_path):
+    from app.services import news_store as news_store_module
+
+    clock = {"now": 1_000.0}
+    monkeypatch.setattr(news_store_module.time, "time", lambda: clock["now"])
+    store = news_store_module.NewsStore(tmp_path / "news.sqlite3", ttl=60)
+
+    first = store.put(
+        "삼성전자",
+        [
+            {"title": "HBM 공급", "snippet": "a", "link": "https://news.com/1?utm_medium=rss"},
+            {"title": "HBM 공급", "snippet": "a", "link": "https://www.news.com/1"},
+            {"title": "실적 발표", "snippet": "b", "link": "https://news.com/2"},
+        ],
+    )
+    assert [item["title"] for item in first] == ["HBM 공급", "실적 발표"]
+
+    clock["now"] += 30
+    store.put("삼성전자 주가", [{"title": "HBM 공급", "snippet": "a2", "link": "http://news.com/1"}])
+    assert store.first_seen("https://news.com/1") == 1_000.0
+    assert store.get("삼성전자")[0]["snippet"] == "a2"
+
+    # 다른 프로세스에 해당하는 새 인스턴스도 같은 파일을 읽습니다.
+    other = news_store_module.NewsStore(tmp_path / "news.sqlite3", ttl=60)
+    assert set(other.get_many(["삼성전자", "삼성전자 주가", "없음"])) == {"삼성전자", "삼성전자 주가"}
+
+    clock["now"] += 45
+    assert store.get("삼성전자") is None
+    assert len(store.get("삼성전자", max_age=float("inf"))) == 2
+    assert store.get("삼성전자 주가") is not None
+
+
+def test_search_news_reads_store_before_upstream(monkeypatch, tmp_path):
+    import importlib
+
+    from app.services import data_fetcher
+    from app.services.news_store import NewsStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    store = NewsStore(tmp_path / "news.sqlite3")
+    monkeypatch.setattr(data_fetcher, "_NEWS_STORE", store)
+    store.put("카카오", [{"title": "cached", "snippet": "", "link": "https://news.com/k"}])
+
+    upstream = []
+
+    def _raw(keyword):
+        upstream.append(keyword)
+        return [{"title": f"{keyword} live", "snippet": "", "link": f"https://news.com/{len(upstream)}"}]
+
+    monkeypatch.setattr(data_fetcher, "_search_news_raw", _raw)
+
+    batch = data_fetcher.search_news_batch(["카카오", "네이버"])
+    assert batch["카카오"][0]["title"] == "cached"
+    assert batch["네이버"][0]["title"] == "네이버 live"
+    assert upstream == ["네이버"]
+    assert store.get("네이버")[0]["title"] == "네이버 live"
+
+    def _fail(_keyword):
+        raise RuntimeError("ddg down")
+
+    monkeypatch.setattr(data_fetcher, "_search_news_raw", _fail)
+    monkeypatch.setattr(store, "ttl", -1)
+    # 저장 결과가 만료되어도 업스트림 실패 시에는 마지막 결과로 대체합니다.
+    assert data_fetcher.search_news("네이버")[0]["title"] == "네이버 live"
@@ -0,0 +1,124 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def _make_bars(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end, name="날짜")
+    # 같은 날짜는 어느 구간으로 받아도 같은 값을 갖도록 날짜에 고정합니다.
+    values = (index - pd.Timestamp("2024-01-01")).days
+    return pd.DataFrame(
+        {
+            "시가": [100 + v for v in values],
+            "고가": [110 + v for v in values],
+            "저가": [90 + v for v in values],
+            "종가": [105 + v for v in values],
+            "거래량": [1000 + v for v in values],
+        },
+        index=index,
+    )
+
+
+def test_sync_fetches_only_missing_bars(tmp_path):
+    from app.services.ohlcv_store import OhlcvStore
+
+    calls = []
+
+    def _fetch(fromdate, todate):
+        calls.append((fromdate, todate))
+        return _make_bars(fromdate, todate)
+
+    store = OhlcvStore(tmp_path)
+    first_now = datetime(2024, 6, 14, 18, 0)  # 금요일 장 마감 후
+    frame = store.sync("005930", _fetch, start=datetime(2024, 6, 3), end=first_now, now=first_now)
+    assert calls == [("20240603", "20240614")]
+    assert len(frame) == 10
+
+    # 주말에는 장 마감 이후 동기화분이 최신이므로 업스트림을 호출하지 않습니다.
+    weekend = datetime(2024, 6, 16, 12, 0)
+    cached = store.sync("005930", _fetch, start=datetime(2024, 6, 3), end=weekend, now=weekend)
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(cached, frame, check_freq=False)
+
+    # 다음 영업일 장 마감 이후에는 마지막 저장일부터만 다시 받습니다.
+    next_close = datetime(2024, 6, 17, 16, 0)
+    updated = store.sync("005930", _fetch, start=datetime(2024, 6, 3), end=next_close, now=next_close)
+    assert calls[-1] == ("20240614", "20240617")
+    assert updated.index.max() == pd.Timestamp("2024-06-17")
+    assert updated.index.is_unique
+
+
+def test_sync_refetches_when_window_extends_before_stored_history(tmp_path):
+    from app.services.ohlcv_store import OhlcvStore
+
+    calls = []
+
+    def _fetch(fromdate, todate):
+        calls.append((fromdate, todate))
+        return _make_bars(fromdate, todate)
+
+    store = OhlcvStore(tmp_path)
+    now = datetime(2024, 6, 14, 18, 0)
+    store.sync("000660", _fetch, start=datetime(2024, 6, 10), end=now, now=now)
+    frame = store.sync("000660", _fetch, start=datetime(2024, 6, 3), end=now, now=now)
+
+    assert calls[-1] == ("20240603", "20240614")
+    assert frame.index.min() == pd.Timestamp("2024-06-03")
+    assert store.read("000660", start=datetime(2024, 6, 12)).index.min() == pd.Timestamp("2024-06-12")
+
+
+def test_sync_refetches_full_window_when_history_is_readjusted(tmp_path):
+    from app.services.ohlcv_store import OhlcvStore
+
+    calls = []
+    split_day = pd.Timestamp("2024-06-17")
+
+    def _fetch(fromdate, todate):
+        calls.append((fromdate, todate))
+        bars = _make_bars(fromdate, todate).astype(float)
+        if pd.Timestamp(todate) >= split_day:
+            # 6/17 액면분할(1:2) 이후 업스트림은 과거 봉까지 절반으로 수정해 돌려줍니다.
+            bars.loc[bars.index < split_day, ["시가", "고가", "저가", "종가"]] /= 2
+        return bars
+
+    store = OhlcvStore(tmp_path)
+    first_now = datetime(2024, 6, 14, 18, 0)
+    store.sync("005930", _fetch, start=datetime(2024, 6, 3), end=first_now, now=first_now)
+
+    next_close = datetime(2024, 6, 17, 16, 0)
+    updated = store.sync("005930", _fetch, start=datetime(2024, 6, 3), end=next_close, now=next_close)
+    assert calls[-2:] == [("20240614", "20240617"), ("20240603", "20240617")]
+    pd.testing.assert_frame_equal(updated, _fetch("20240603", "20240617"), check_freq=False)
+
+
+def test_get_stock_info_by_name_reads_local_store(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.ohlcv_store import OhlcvStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_OHLCV_STORE", OhlcvStore(tmp_path, refresh_interval=3600))
+    monkeypatch.setattr(data_fetcher, "get_stock_name_ticker_map", lambda: {"샘플": "000000"})
+
+    calls = []
+
+    def _fetch(fromdate, todate, ticker):
+        calls.append(ticker)
+        return _make_bars(fromdate, todate)
+
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ohlcv_by_date", _fetch)
+
+    df, ticker = data_fetcher.get_stock_info_by_name("샘플")
+    assert ticker == "000000"
+    assert not df.empty
+    assert isinstance(df.index[0], str)
+
+    df_again, _ = data_fetcher.get_stock_info_by_name("샘플")
+    assert calls == ["000000"]
+    pd.testing.assert_frame_equal(df, df_again)
@@ -0,0 +1,113 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+class _Clock:
+    def __init__(self, start: float = 100.0):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def _patch_clock(monkeypatch):
+    from app.services import rate_limit
+
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_bucket_allows_burst_then_paces(monkeypatch):
+    from app.services.rate_limit import RateLimitExceeded, TokenBucket
+
+    clock = _patch_clock(monkeypatch)
+    bucket = TokenBucket("test", rate=2.0, burst=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [0.5]
+
+    # 마감 안에 슬롯이 없으면 예약하지 않고 바로 실패합니다.
+    try:
+        bucket.acquire(deadline=clock.now + 0.1)
+    except RateLimitExceeded:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError("expected RateLimitExceeded")
+    bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+    assert bucket.snapshot()["rejected"] == 1
+
+
+def test_bucket_slows_down_on_rejection_and_recovers(monkeypatch):
+    from app.services.rate_limit import TokenBucket
+
+    clock = _patch_clock(monkeypatch)
+    bucket = TokenBucket("test", rate=4.0, burst=1)
+
+    class _TooManyRequests(Exception):
+        status_code = 429
+
+    try:
+        with bucket.slot():
+            raise _TooManyRequests("Too Many Requests")
+    except _TooManyRequests:
+        pass
+    assert bucket.rate == 2.0
+    assert bucket.snapshot()["blocked_for"] == 0.5
+
+    clock.now += 1
+    for _ in range(5):
+        with bucket.slot():
+            pass
+    assert abs(bucket.rate - 4.0) < 1e-9
+
+
+def test_search_news_batch_runs_in_parallel_and_honours_timeout(monkeypatch, tmp_path):
+    import importlib
+    import time
+
+    from app.services import data_fetcher
+    from app.services.news_store import NewsStore
+    from app.services.rate_limit import TokenBucket
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(data_fetcher, "_NEWS_STORE", NewsStore(tmp_path / "news.sqlite3"))
+
+    class _FakeDDGS:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def news(self, keywords, **_kwargs):
+            time.sleep(0.2)
+            return [{"title": keywords, "body": "", "link": ""}]
+
+    monkeypatch.setattr(data_fetcher, "DDGS", _FakeDDGS)
+    monkeypatch.setattr(data_fetcher.rate_limit, "DDG", TokenBucket("ddg", rate=100.0, burst=6))
+
+    queries = [f"종목{i}" for i in range(6)]
+    started = time.perf_counter()
+    results = data_fetcher.search_news_batch(queries)
+    assert time.perf_counter() - started < 0.6
+    assert [results[query][0]["title"] for query in queries] == [f"{query} 주가" for query in queries]
+
+    monkeypatch.setattr(data_fetcher.rate_limit, "DDG", TokenBucket("ddg", rate=1.0, burst=1))
+    limited = data_fetcher.search_news_batch(["A", "B"], timeout=0.5)
+    assert sorted(len(items) for items in limited.values()) == [0, 1]
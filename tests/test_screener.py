@@ -0,0 +1,175 @@
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics.screener import FilterSyntaxError, compile_filter, screen, top_k_positions  # noqa: E402
+
+
+def _table(rows: int = 2_500) -> pd.DataFrame:
+    rng = np.random.default_rng(4)
+    table = pd.DataFrame(
+        {
+            "티커": [f"{number:06d}" for number in range(rows)],
+            "시장": np.where(np.arange(rows) % 3 == 0, "KOSDAQ", "KOSPI"),
+            "시가총액": rng.uniform(1e10, 1e14, rows),
+            "ma_gap_20_pct": rng.normal(0, 8, rows),
+            "volume_gap_pct": rng.normal(50, 80, rows),
+            "PER": rng.uniform(-5, 40, rows),
+            "PBR": rng.uniform(0.2, 5, rows),
+        }
+    )
+    table.loc[::50, "PER"] = np.nan
+    return table
+
+
+def test_filters_compile_to_the_same_rows_as_pandas():
+    table = _table()
+    cases = {
+        "ma_gap_20_pct > 5 and volume_gap_pct > 100 and PER < 10": (
+            (table["ma_gap_20_pct"] > 5) & (table["volume_gap_pct"] > 100) & (table["PER"] < 10)
+        ),
+        "0 < PER <= 12 or not PBR >= 1": ((table["PER"] > 0) & (table["PER"] <= 12)) | ~(table["PBR"] >= 1),
+        '(시장 == "KOSDAQ") & (PER * PBR < 15)': (table["시장"] == "KOSDAQ") & (table["PER"] * table["PBR"] < 15),
+        '시장 in ["KOSPI"] and -ma_gap_20_pct > 3': (table["시장"] == "KOSPI") & (-table["ma_gap_20_pct"] > 3),
+        "PER != PER": table["PER"].isna() & False,
+    }
+    for expression, expected in cases.items():
+        assert compile_filter(expression)(table).tolist() == expected.tolist(), expression
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "PER <",
+        "unknown_field > 1",
+        "__import__('os').system('true')",
+        "PER.__class__ > 1",
+        "PER[0] > 1",
+        "PER + 1",
+        "시장 > 5",
+        "PER if PBR else 1",
+    ],
+)
+def test_invalid_or_unsafe_filters_are_rejected(expression):
+    with pytest.raises(FilterSyntaxError):
+        compile_filter(expression)(_table(10))
+
+
+def test_constant_arithmetic_is_bounded_and_fails_fast():
+    table = _table(100)
+    started = time.perf_counter()
+    for expression in ("PER < 9 ** 9 ** 9 ** 2", "PER < 1 / 0", "PER < 10 ** 400", "PER > -(2 ** 2000) * 3"):
+        with pytest.raises(FilterSyntaxError):
+            screen(table, expression)
+    assert time.perf_counter() - started < 1
+
+    assert screen(table, "PER < 2 ** 3 + 1", limit=None).equals(table[table["PER"] < 9])
+    assert screen(table, "PER * 2 ** 10 > 0", limit=None).equals(table[table["PER"] > 0])
+
+
+def test_screen_returns_sorted_top_k_quickly():
+    table = _table()
+    started = time.perf_counter()
+    result = screen(table, "PER < 10 and volume_gap_pct > 0", sort_by="시가총액", limit=20, columns=["티커"])
+    elapsed = time.perf_counter() - started
+
+    expected = table.query("PER < 10 and volume_gap_pct > 0").nlargest(20, "시가총액")
+    assert result["티커"].tolist() == expected["티커"].tolist()
+    assert list(result.columns) == ["티커", "시가총액", "PER", "volume_gap_pct"]
+    assert elapsed < 0.1
+
+    values = np.array([3.0, np.nan, 1.0, 2.0])
+    assert top_k_positions(values, 2, ascending=True).tolist() == [2, 3]
+    assert top_k_positions(values, 4).tolist() == [0, 3, 2, 1]
+    assert screen(table, sort_by="시장", limit=1)["시장"].iloc[0] == "KOSPI"
+
+
+def test_screener_table_joins_snapshot_indicators_and_fundamentals(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    store = MarketPanelStore(tmp_path / "panel")
+    rng = np.random.default_rng(8)
+    for offset, day in enumerate(pd.bdate_range("2024-01-02", periods=40)):
+        close = 1_000 + np.array([offset * 10.0, -offset * 5.0]) + rng.normal(0, 1, 2)
+        store.write_day(
+            day,
+            pd.DataFrame(
+                {"시가": close, "고가": close + 3, "저가": close - 3, "종가": close, "거래량": [1_000.0, 2_000.0]},
+                index=["000001", "000002"],
+            ),
+        )
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", store)
+    monkeypatch.setattr(data_fetcher, "get_market_panel", lambda field, *_args: store.load_panel(field))
+    monkeypatch.setattr(data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240226")
+    monkeypatch.setattr(
+        data_fetcher,
+        "get_market_frame",
+        lambda: pd.DataFrame(
+            {
+                "종목코드": ["000001", "000002", "000003"],
+                "이름": ["상승", "하락", "신규"],
+                "시장": ["KOSPI", "KOSDAQ", "KOSPI"],
+                "현재가": [1.0, 1.0, 1.0],
+                "등락률": [1.0, -1.0, 0.0],
+                "거래량": [1.0, 1.0, 1.0],
+                "거래대금": [1.0, 1.0, 1.0],
+                "시가총액": [3e12, 2e12, 1e12],
+            }
+        ),
+    )
+    monkeypatch.setattr(
+        data_fetcher,
+        "get_market_fundamentals",
+        lambda: pd.DataFrame({"PER": [8.0, 30.0, 5.0], "PBR": [1.0, 2.0, 0.5]}, index=["000001", "000002", "000003"]),
+    )
+
+    table = data_fetcher.get_screener_table()
+    assert set(table["티커"]) == {"000001", "000002", "000003"}
+    assert {"ma_gap_20_pct", "rsi_14", "macd_hist", "atr_pct", "PER", "이름"}.issubset(table.columns)
+
+    results, total = data_fetcher.run_screener("rsi_14 > 70 and PER < 10", sort_by="시가총액")
+    assert total == 1 and results["이름"].tolist() == ["상승"]
+    results, total = data_fetcher.run_screener("PER < 10", sort_by="PER", ascending=True, limit=1)
+    assert total == 2 and results["티커"].tolist() == ["000003"]
+
+
+def test_screener_table_uses_split_adjusted_closes(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.market_panel import MarketPanelStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    store = MarketPanelStore(tmp_path / "panel")
+    days = pd.bdate_range("2024-01-02", periods=30)
+    for offset, day in enumerate(days):
+        # 마지막 5거래일 전에 1:2 액면분할, 그 밖에는 매일 +1%
+        close = 1_000 * 1.01**offset / (2 if offset >= len(days) - 5 else 1)
+        store.write_day(
+            day,
+            pd.DataFrame(
+                {"고가": [close], "저가": [close], "종가": [close], "거래량": [1_000.0], "등락률": [1.0]},
+                index=["000001"],
+            ),
+        )
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", store)
+    monkeypatch.setattr(data_fetcher, "get_market_panel", lambda field, *_args: store.load_panel(field))
+    monkeypatch.setattr(data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240212")
+    columns = ["종목코드", "이름", "시장", "등락률", "거래대금", "시가총액"]
+    monkeypatch.setattr(data_fetcher, "get_market_frame", lambda: pd.DataFrame(columns=columns))
+    monkeypatch.setattr(data_fetcher, "get_market_fundamentals", lambda: pd.DataFrame())
+
+    row = data_fetcher.get_screener_table().set_index("티커").loc["000001"]
+    assert row["return_20_pct"] == pytest.approx((1.01**20 - 1) * 100, rel=1e-3)
+    assert 0 < row["ma_gap_20_pct"] < 15
+    assert row["rsi_14"] == pytest.approx(100.0)
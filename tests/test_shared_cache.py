@@ -0,0 +1,168 @@
+from pathlib import Path
+import sys
+import threading
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_frames_round_trip_through_arrow_and_values_through_json(tmp_path):
+    from types import MappingProxyType
+
+    from app.services.shared_cache import SharedCache
+
+    store = SharedCache(tmp_path / "shared.sqlite3")
+    frame = pd.DataFrame(
+        {"이름": ["삼성전자", None], "현재가": [70000, 120000], "등락률": [1.5, -0.3]},
+        index=pd.Index(["005930", "000660"], name="종목코드"),
+    )
+    store.set("ns", "frame", frame, ttl=60)
+    store.set("ns", "series", frame["현재가"], ttl=60)
+    store.set("ns", "records", (MappingProxyType({"label": "USD/KRW", "price": 1380.5}),))
+
+    pd.testing.assert_frame_equal(store.get("ns", "frame").value, frame)
+    pd.testing.assert_series_equal(store.get("ns", "series").value, frame["현재가"])
+    assert store.get("ns", "records").value == ({"label": "USD/KRW", "price": 1380.5},)
+
+    # tuple(중첩 포함)과 tuple 안의 프레임도 원래 타입으로 복원됩니다.
+    store.set("ns", "pair", (frame, "005930"))
+    store.set("ns", "nested", {"ranges": [(1, 2)], "flags": ("a",)})
+    restored, ticker = store.get("ns", "pair").value
+    pd.testing.assert_frame_equal(restored, frame)
+    assert ticker == "005930"
+    assert store.get("ns", "nested").value == {"ranges": [(1, 2)], "flags": ("a",)}
+
+    # 직렬화할 수 없는 값은 공유하지 않습니다.
+    assert store.set("ns", "object", object()) is False
+    assert store.get("ns", "object") is None
+
+
+def test_cached_shares_results_across_process_caches(monkeypatch, isolated_shared_cache):
+    from app.services import cache as cache_module
+
+    calls = []
+
+    def _make(local_cache):
+        @cache_module.cached(ttl=60, cache=local_cache, shared=True)
+        def load(day: str) -> pd.DataFrame:
+            calls.append(day)
+            return pd.DataFrame({"종가": [1.0, 2.0]}, index=["A", "B"])
+
+        return load
+
+    # 두 프로세스를 흉내 내어 서로 다른 프로세스 캐시가 같은 공유 캐시를 봅니다.
+    first = _make(cache_module.TTLCache())
+    second_cache = cache_module.TTLCache()
+    second = _make(second_cache)
+
+    assert first("20240614")["종가"].sum() == 3.0
+    assert second("20240614")["종가"].sum() == 3.0
+    assert calls == ["20240614"]
+    stats = second_cache.stats()["namespaces"][first.cache_namespace]
+    assert stats["shared_hits"] == 1
+
+    # 공유 캐시의 남은 TTL이 프로세스 캐시로 이어집니다.
+    entry = isolated_shared_cache.get(first.cache_namespace, (("day", "20240614"),))
+    assert entry is not None and entry.expires_at is not None
+
+
+def test_lease_lets_one_process_load_while_others_wait(isolated_shared_cache):
+    from app.services import cache as cache_module
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _make(local_cache):
+        @cache_module.cached(ttl=60, cache=local_cache, shared=True)
+        def load() -> dict:
+            calls.append(threading.get_ident())
+            started.set()
+            release.wait(5)
+            return {"value": 42}
+
+        return load
+
+    leader = _make(cache_module.TTLCache())
+    follower = _make(cache_module.TTLCache())
+    results = []
+    thread = threading.Thread(target=lambda: results.append(leader()))
+    thread.start()
+    assert started.wait(5)
+
+    waiter = threading.Thread(target=lambda: results.append(follower()))
+    waiter.start()
+    release.set()
+    thread.join(5)
+    waiter.join(5)
+
+    assert len(calls) == 1
+    assert [dict(result) for result in results] == [{"value": 42}, {"value": 42}]
+
+
+def test_fallback_uses_result_shared_by_another_process(monkeypatch):
+    import importlib
+
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    frame = pd.DataFrame({"KOSPI": [2700.0]}, index=["2024-06-14"])
+    data_fetcher._remember_result("market_indices", frame)
+
+    # 다른 프로세스처럼 메모리 보관분이 없는 상태에서 대체값을 요청합니다.
+    monkeypatch.setattr(data_fetcher, "_LAST_SUCCESS_CACHE", {})
+    monkeypatch.setattr(data_fetcher, "_LAST_SUCCESS_AT", {})
+    fallback = data_fetcher._fallback_result("market_indices", pd.DataFrame())
+    pd.testing.assert_frame_equal(fallback, frame)
+    assert data_fetcher.get_data_age("market_indices") is not None
+    assert data_fetcher._fallback_result("market_indices", None, max_age=-1) is None
+
+
+def test_last_good_results_are_shared_only_when_rebuilt(monkeypatch, tmp_path):
+    import importlib
+
+    from app.services import data_fetcher
+    from app.services.ohlcv_store import OhlcvStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    writes = []
+
+    class _CountingShared:
+        def set(self, namespace, key, value, ttl=None):
+            writes.append(key)
+
+        def get(self, namespace, key):
+            return None
+
+    monkeypatch.setattr(data_fetcher, "get_shared_cache", lambda: _CountingShared())
+    monkeypatch.setattr(data_fetcher, "_latest_business_day", lambda: "20240614")
+    monkeypatch.setattr(
+        data_fetcher.stock,
+        "get_market_cap_by_ticker",
+        lambda *_args, **_kwargs: pd.DataFrame(
+            {"종가": [1.0], "거래량": [1.0], "거래대금": [1.0], "시가총액": [1.0]}, index=["005930"]
+        ),
+    )
+    monkeypatch.setattr(
+        data_fetcher, "ingest_market_day", lambda *_args: pd.DataFrame({"등락률": [0.5]}, index=["005930"])
+    )
+    monkeypatch.setattr(data_fetcher, "get_ticker_catalog", lambda: None)
+    data_fetcher._market_frame.cache_clear()
+    for _ in range(3):
+        assert data_fetcher.rank_stocks(limit=1).shape[0] == 1
+    assert writes.count("market_frame") == 1
+
+    bars = pd.DataFrame(
+        {"시가": [1.0, 2.0], "고가": 2.0, "저가": 1.0, "종가": [1.5, 2.5], "거래량": 10.0},
+        index=pd.DatetimeIndex([pd.Timestamp.now().normalize() - pd.Timedelta(days=1), pd.Timestamp.now().normalize()], name="날짜"),
+    )
+    monkeypatch.setattr(data_fetcher, "_OHLCV_STORE", OhlcvStore(tmp_path, refresh_interval=0))
+    monkeypatch.setattr(data_fetcher, "get_stock_name_ticker_map", lambda: {"샘플": "000000"})
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ohlcv_by_date", lambda *_args, **_kwargs: bars)
+    first, _ = data_fetcher.get_stock_info_by_name("샘플")
+    second, _ = data_fetcher.get_stock_info_by_name("샘플")
+    assert first is second
+    assert writes.count("stock_info::000000") == 1
@@ -0,0 +1,73 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+_ENTRIES = [
+    ("삼성전자", "005930"),
+    ("삼성전자우", "005935"),
+    ("삼성SDI", "006400"),
+    ("삼성바이오로직스", "207940"),
+    ("SK하이닉스", "000660"),
+    ("카카오", "035720"),
+    ("카카오뱅크", "323410"),
+    ("LG에너지솔루션", "373220"),
+]
+
+
+def _index():
+    from app.services.stock_search import StockSearchIndex
+
+    return StockSearchIndex(_ENTRIES)
+
+
+def test_choseong_conversion():
+    from app.services.stock_search import to_choseong
+
+    assert to_choseong("삼성전자") == "ㅅㅅㅈㅈ"
+    assert to_choseong("SK하이닉스") == "skㅎㅇㄴㅅ"
+
+
+def test_prefix_results_rank_before_substring():
+    names = [hit.name for hit in _index().search("삼성")]
+    assert names[:2] == ["삼성전자", "삼성SDI"]
+    assert set(names) == {"삼성전자", "삼성전자우", "삼성SDI", "삼성바이오로직스"}
+
+    hits = _index().search("전자")
+    assert [hit.name for hit in hits] == ["삼성전자", "삼성전자우"]
+    assert all(hit.match == "substring" for hit in hits)
+
+
+def test_exact_match_and_top_k_limit():
+    hits = _index().search("카카오", limit=1)
+    assert [hit.name for hit in hits] == ["카카오"]
+    assert hits[0].match == "prefix"
+
+
+def test_choseong_ticker_alias_and_fuzzy_queries():
+    index = _index()
+    assert [hit.name for hit in index.search("ㅅㅅㅈㅈ")] == ["삼성전자", "삼성전자우"]
+    assert index.search("ㅋㅋㅇ")[0].name == "카카오"
+    assert index.search("005930")[0].name == "삼성전자"
+    assert index.search("samsung electronics")[0].name == "삼성전자"
+    assert index.search("hynix")[0].name == "SK하이닉스"
+    assert index.search("삼성바이오로직")[0].name == "삼성바이오로직스"
+    fuzzy = index.search("카카오벵크")
+    assert fuzzy and fuzzy[0].name == "카카오뱅크"
+    assert fuzzy[0].match == "fuzzy"
+    assert index.search("") == []
+
+
+def test_search_stocks_by_keyword_uses_catalog_index(monkeypatch):
+    import importlib
+    from app.services import data_fetcher
+
+    data_fetcher = importlib.reload(data_fetcher)
+    name_map = {name: ticker for name, ticker in _ENTRIES}
+    monkeypatch.setattr(data_fetcher, "get_stock_name_ticker_map", lambda: name_map)
+
+    assert data_fetcher.search_stocks_by_keyword("삼성", limit=2) == ["삼성전자", "삼성SDI"]
+    first_index = data_fetcher._get_search_index()
+    assert data_fetcher._get_search_index() is first_index
@@ -0,0 +1,77 @@
+from pathlib import Path
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import IndicatorState, compute_indicator_snapshot, prepare_price_frame, update_universe  # noqa: E402
+from analytics.streaming import dump_states, load_states  # noqa: E402
+
+
+def _history(days: int, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2022-01-03", periods=days, name="날짜")
+    return pd.DataFrame(
+        {
+            "종가": 50_000 * np.exp(np.cumsum(rng.normal(0, 0.02, days))),
+            "거래량": rng.integers(0, 2_000_000, days).astype(float),
+        },
+        index=index,
+    )
+
+
+def _assert_matches(state: IndicatorState, history: pd.DataFrame) -> None:
+    expected = compute_indicator_snapshot(prepare_price_frame(history.tail(state.high_low_window)))
+    actual = state.snapshot()
+    assert actual.keys() == expected.keys()
+    for field, value in expected.items():
+        assert actual[field] == pytest.approx(value), field
+
+
+def test_incremental_state_matches_full_recompute():
+    history = _history(400)
+    state = IndicatorState()
+    for position, (date, row) in enumerate(history.iterrows(), start=1):
+        state.update(row["종가"], row["거래량"], date)
+        if position in (1, 4, 5, 19, 20, 61, 252, 253, 400):
+            _assert_matches(state, history.iloc[:position])
+
+    # 같은 날짜를 다시 보내면 무시합니다.
+    assert not state.update(1.0, 1.0, history.index[-1])
+    assert state.count == 400
+
+
+def test_state_round_trips_through_json_and_continues():
+    history = _history(300, seed=9)
+    state = IndicatorState.from_frame(history.iloc[:280])
+    restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+    assert restored.snapshot() == pytest.approx(state.snapshot())
+
+    for date, row in history.iloc[280:].iterrows():
+        restored.update(row["종가"], row["거래량"], date)
+    _assert_matches(restored, history)
+
+
+def test_update_universe_touches_each_ticker_once_per_day():
+    days = _history(30).index
+    rng = np.random.default_rng(1)
+    states = {}
+    for date in days:
+        cross_section = pd.DataFrame(
+            {"종가": rng.uniform(1_000, 2_000, 3), "거래량": [1.0, np.nan, 3.0]},
+            index=["000001", "000002", "000003"],
+        )
+        if date == days[-1]:
+            cross_section.loc["000003", "종가"] = np.nan
+        assert update_universe(states, cross_section, date) == (2 if date == days[-1] else 3)
+
+    assert update_universe(states, cross_section, days[-1]) == 0
+    restored = load_states(json.loads(json.dumps(dump_states(states))))
+    assert restored["000001"].count == 30 and restored["000003"].count == 29
+    assert restored["000002"].snapshot()["volume"] == 0.0
@@ -0,0 +1,94 @@
+from pathlib import Path
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_catalog_round_trip_and_lookups(tmp_path):
+    from app.services.ticker_catalog import TickerCatalog, TickerCatalogStore
+
+    builds = []
+
+    def _builder():
+        builds.append(1)
+        return TickerCatalog(
+            trading_date="20240614",
+            names={"005930": "삼성전자", "035720": "카카오"},
+            markets={"005930": "KOSPI", "035720": "KOSPI"},
+        )
+
+    path = tmp_path / "catalog.json"
+    store = TickerCatalogStore(path, _builder)
+    catalog = store.get()
+    assert builds == [1]
+    assert catalog.name_to_ticker["카카오"] == "035720"
+    assert path.exists()
+
+    # 새 프로세스에 해당하는 저장소는 디스크에서 읽기만 합니다.
+    reloaded = TickerCatalogStore(path, _builder).get()
+    assert builds == [1]
+    assert reloaded.trading_date == "20240614"
+    assert reloaded.ticker_to_name["005930"] == "삼성전자"
+    assert sorted(reloaded.tickers_in("KOSPI")) == ["005930", "035720"]
+
+
+def test_stale_catalog_is_served_while_refreshing(tmp_path):
+    from app.services.ticker_catalog import TickerCatalog, TickerCatalogStore
+
+    path = tmp_path / "catalog.json"
+    old = TickerCatalog("20240613", {"005930": "삼성전자"}, {"005930": "KOSPI"}, built_at=time.time() - 3 * 86400)
+    seed = TickerCatalogStore(path, lambda: old)
+    seed.save(old)
+
+    fresh = TickerCatalog("20240614", {"005930": "삼성전자", "000660": "SK하이닉스"}, {})
+    store = TickerCatalogStore(path, lambda: fresh)
+    served = store.get()
+    assert served.trading_date == "20240613"
+
+    deadline = time.time() + 5
+    while store.get().trading_date != "20240614" and time.time() < deadline:
+        time.sleep(0.01)
+    assert store.get().name_to_ticker["SK하이닉스"] == "000660"
+
+
+def test_name_ticker_map_uses_bulk_listing(monkeypatch, tmp_path):
+    import importlib
+    from app.services import data_fetcher
+    from app.services.ticker_catalog import TickerCatalogStore
+
+    data_fetcher = importlib.reload(data_fetcher)
+    monkeypatch.setattr(
+        data_fetcher.stock, "get_nearest_business_day_in_a_week", lambda: "20240614"
+    )
+
+    listings = {
+        "KOSPI": pd.Series({"005930": "삼성전자"}, name="종목명"),
+        "KOSDAQ": pd.Series({"247540": "에코프로비엠"}, name="종목명"),
+    }
+    calls = []
+
+    def _listing(date, market):
+        calls.append((date, market))
+        return listings[market]
+
+    def _per_ticker(_ticker):
+        raise AssertionError("per-ticker name lookups should not be used")
+
+    monkeypatch.setattr(data_fetcher.krx, "get_market_ticker_and_name", _listing)
+    monkeypatch.setattr(data_fetcher.stock, "get_market_ticker_name", _per_ticker)
+    monkeypatch.setattr(
+        data_fetcher,
+        "_TICKER_CATALOG",
+        TickerCatalogStore(tmp_path / "catalog.json", data_fetcher._build_ticker_catalog),
+    )
+
+    name_map = data_fetcher.get_stock_name_ticker_map()
+    assert dict(name_map) == {"삼성전자": "005930", "에코프로비엠": "247540"}
+    assert calls == [("20240614", "KOSPI"), ("20240614", "KOSDAQ")]
+    assert data_fetcher.get_market_tickers("KOSDAQ") == ["247540"]
+    assert data_fetcher.get_ticker_name("005930") == "삼성전자"
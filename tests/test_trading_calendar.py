@@ -0,0 +1,83 @@
+from datetime import datetime
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def _kst(*args):
+    from app.services.trading_calendar import KST
+
+    return datetime(*args, tzinfo=KST)
+
+
+def test_sessions_skip_weekends_and_holidays():
+    from app.services.trading_calendar import KRX_CALENDAR
+
+    # 2025-10-03 ~ 10-09 추석·개천절·한글날 연휴
+    sessions = KRX_CALENDAR.sessions("20251001", "20251013")
+    assert [day.strftime("%Y%m%d") for day in sessions] == ["20251001", "20251002", "20251010", "20251013"]
+    assert KRX_CALENDAR.next_session("20251003").isoformat() == "2025-10-10"
+    assert KRX_CALENDAR.previous_session("20251006").isoformat() == "2025-10-02"
+
+
+def test_holiday_table_covers_2027_and_warns_past_its_last_year(caplog):
+    import logging
+
+    from app.services.trading_calendar import KNOWN_HOLIDAYS_LAST_YEAR, KRX_CALENDAR, TradingCalendar
+
+    # 2027 설 연휴(2/6~2/8)와 대체공휴일(2/9)
+    sessions = KRX_CALENDAR.sessions("20270205", "20270212")
+    assert [day.strftime("%Y%m%d") for day in sessions] == ["20270205", "20270210", "20270211", "20270212"]
+    assert KNOWN_HOLIDAYS_LAST_YEAR >= 2027
+
+    calendar = TradingCalendar(["20270101"], holidays_known_through=2027)
+    with caplog.at_level(logging.WARNING, logger="app.services.trading_calendar"):
+        assert not calendar.is_session("20271225")
+        assert not caplog.records
+        calendar.sessions("20280101", "20280110")
+        calendar.is_session("20280301")
+    assert len(caplog.records) == 1
+    assert caplog.records[0].year == 2028
+
+
+def test_open_close_times_follow_calendar():
+    from app.services.trading_calendar import KRX_CALENDAR
+
+    # 금요일 장 마감 후 → 다음 개장은 월요일 09:00
+    assert KRX_CALENDAR.next_open(_kst(2024, 6, 14, 16, 0)) == _kst(2024, 6, 17, 9, 0)
+    # 연초 첫 거래일은 10시 개장
+    assert KRX_CALENDAR.next_open(_kst(2024, 12, 30, 18, 0)) == _kst(2025, 1, 2, 10, 0)
+    assert not KRX_CALENDAR.is_open(_kst(2025, 1, 2, 9, 30))
+    # 수능일은 10:00~16:30
+    assert KRX_CALENDAR.is_open(_kst(2025, 11, 13, 16, 0))
+    # 휴장일 다음 날 새벽의 직전 마감은 휴장일 이전 거래일
+    assert KRX_CALENDAR.last_close(_kst(2024, 6, 7, 8, 0)) == _kst(2024, 6, 5, 15, 30)
+
+
+def test_market_hours_ttl_policy():
+    from app.services.trading_calendar import MarketHoursTTL
+
+    policy = MarketHoursTTL(intraday=300, settle=1800)
+    # 장중: 짧은 주기, 단 마감 시각을 넘기지 않음
+    assert policy(_kst(2024, 6, 14, 10, 0)) == 300
+    assert policy(_kst(2024, 6, 14, 15, 28)) == 120
+    # 마감 직후 종가 확정 구간
+    assert policy(_kst(2024, 6, 14, 15, 50)) == 300
+    assert policy(_kst(2024, 6, 14, 15, 58)) == 120
+    # 그 이후에는 다음 개장(월요일 09:00)까지 유지
+    assert policy(_kst(2024, 6, 14, 20, 0)) == (2 * 24 + 13) * 3600
+    # 개장 직전 값은 개장 시각에 정확히 만료
+    assert policy(_kst(2024, 6, 17, 8, 45)) == 15 * 60
+
+
+def test_cache_accepts_ttl_policy(monkeypatch):
+    from app.services import cache as cache_module
+
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1_000.0)
+    store = cache_module.TTLCache()
+    store.set("ns", "key", "value", ttl=lambda: 30)
+    entry = store._entries[("ns", "key")]
+    assert entry.expires_at == 1_030.0
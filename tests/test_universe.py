@@ -0,0 +1,76 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from analytics import (  # noqa: E402
+    adjust_close_panel,
+    compute_indicator_snapshot,
+    compute_universe_snapshot,
+    prepare_price_frame,
+)
+
+
+def _panels(days: int = 250, tickers: int = 40):
+    rng = np.random.default_rng(3)
+    index = pd.bdate_range("2023-06-01", periods=days, name="날짜")
+    columns = [f"{number:06d}" for number in range(tickers)]
+    close = pd.DataFrame(
+        1_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0)), index=index, columns=columns
+    )
+    volume = pd.DataFrame(rng.integers(0, 1_000_000, (days, tickers)).astype(float), index=index, columns=columns)
+    # 최근 상장 종목(이력 짧음)과 마지막 날 거래정지 종목
+    close.iloc[:-30, 1] = np.nan
+    volume.iloc[:-30, 1] = np.nan
+    close.iloc[-1, 2] = np.nan
+    return close, volume
+
+
+def test_universe_snapshot_matches_per_ticker_snapshot():
+    close, volume = _panels()
+    snapshot = compute_universe_snapshot(close, volume)
+
+    assert "000002" not in snapshot.index
+    assert len(snapshot) == close.shape[1] - 1
+    for ticker in ("000000", "000001", "000017"):
+        history = pd.DataFrame({"종가": close[ticker], "거래량": volume[ticker]}).dropna()
+        expected = compute_indicator_snapshot(prepare_price_frame(history))
+        actual = snapshot.loc[ticker]
+        for field, value in expected.items():
+            assert actual[field] == pytest.approx(value), (ticker, field)
+
+
+def test_universe_snapshot_without_volume_and_empty_panel():
+    close, _volume = _panels(days=10, tickers=3)
+    snapshot = compute_universe_snapshot(close)
+    assert "volume_gap_pct" not in snapshot.columns
+    assert (snapshot["ma_20"] == 0.0).all()
+    assert (snapshot["return_20_pct"] == 0.0).all()
+    assert compute_universe_snapshot(pd.DataFrame()).empty
+
+
+def test_adjust_close_panel_removes_split_gap():
+    index = pd.bdate_range("2024-01-02", periods=6, name="날짜")
+    # 000001은 4번째 날 1:2 액면분할(등락률 +1%), 000002는 하루 거래정지
+    close = pd.DataFrame(
+        {"000001": [100.0, 101.0, 102.0, 51.51, 52.0, 53.0], "000002": [10.0, 11.0, np.nan, 12.0, 12.0, 13.0]},
+        index=index,
+    )
+    change_pct = pd.DataFrame({"000001": [np.nan, 1.0, 0.990099, 1.0, 0.950301, 1.923077]}, index=index)
+
+    adjusted = adjust_close_panel(close, change_pct)
+    assert adjusted["000001"].iloc[-1] == pytest.approx(53.0)
+    assert adjusted["000001"].iloc[:3].tolist() == pytest.approx([50.0, 50.5, 51.0], rel=1e-4)
+    # 등락률이 없는 종목은 종가를 그대로 두고, 거래정지 칸은 NaN
+    assert np.isnan(adjusted["000002"].iloc[2])
+    assert adjusted["000002"].drop(index[2]).tolist() == pytest.approx([10.0, 11.0, 12.0, 12.0, 13.0])
+
+    snapshot = compute_universe_snapshot(adjusted, return_windows=(5,), ma_windows=(5,))
+    assert snapshot.loc["000001", "return_5_pct"] == pytest.approx(6.0, rel=1e-3)
+    assert adjust_close_panel(close, pd.DataFrame()) is close
@@ -0,0 +1,168 @@
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_warmer_runs_jobs_in_parallel_within_source_limits():
+    import threading
+    import time
+
+    from app.services.warmer import MarketDataWarmer, WarmJob
+
+    active = {"krx": 0, "yahoo": 0}
+    peak = {"krx": 0, "yahoo": 0}
+    lock = threading.Lock()
+
+    def _job(source):
+        def _run():
+            with lock:
+                active[source] += 1
+                peak[source] = max(peak[source], active[source])
+            time.sleep(0.1)
+            with lock:
+                active[source] -= 1
+
+        return _run
+
+    def _fail():
+        raise RuntimeError("KRX 응답 없음")
+
+    jobs = [WarmJob(f"krx-{i}", "krx", _job("krx"), interval=300) for i in range(4)]
+    jobs += [WarmJob("yahoo", "yahoo", _job("yahoo"), interval=lambda: 600), WarmJob("broken", "yahoo", _fail, 600)]
+    warmer = MarketDataWarmer(jobs, source_limits={"krx": 2, "yahoo": 1}, max_workers=6)
+
+    started = time.time()
+    status = warmer.run_once(timeout=5)
+    warmer.stop()
+
+    assert peak == {"krx": 2, "yahoo": 1}
+    assert status["healthy"] is False
+    krx = status["jobs"]["krx-0"]
+    assert krx["runs"] == 1 and krx["last_error"] is None
+    assert 300 - 30 - 1 <= krx["next_run"] - started <= 300 - 30 + 2
+    broken = status["jobs"]["broken"]
+    assert broken["failures"] == 1
+    assert broken["last_error"] == "KRX 응답 없음"
+    # 실패한 작업은 짧은 간격으로 재시도합니다.
+    assert broken["next_run"] - broken["last_finished"] == 30
+
+
+def test_cached_refresh_replaces_fresh_value():
+    from app.services import cache as cache_module
+
+    store = cache_module.TTLCache()
+    calls = []
+
+    @cache_module.cached(ttl=600, cache=store)
+    def _load():
+        calls.append(1)
+        return len(calls)
+
+    assert _load() == 1
+    assert _load() == 1
+    assert _load.refresh() == 2
+    assert _load() == 2
+
+
+def test_top_100_job_rebuilds_the_market_frame_first(monkeypatch):
+    import pandas as pd
+
+    from app.services import data_fetcher, warmer
+
+    caps = iter([3.0, 5.0])
+    monkeypatch.setattr(data_fetcher, "_latest_business_day", lambda: "20240614")
+    monkeypatch.setattr(
+        data_fetcher.stock,
+        "get_market_cap_by_ticker",
+        lambda *_args, **_kwargs: pd.DataFrame(
+            {"종가": [1.0], "거래량": [1.0], "거래대금": [1.0], "시가총액": [next(caps)]}, index=["005930"]
+        ),
+    )
+    monkeypatch.setattr(
+        data_fetcher, "ingest_market_day", lambda *_args: pd.DataFrame({"등락률": [0.5]}, index=["005930"])
+    )
+    monkeypatch.setattr(data_fetcher, "get_ticker_catalog", lambda: None)
+    data_fetcher._market_frame.cache_clear()
+    assert data_fetcher.get_top_100_market_cap_stocks.refresh()["시가총액"].tolist() == [3.0]
+
+    job = next(job for job in warmer.default_jobs() if job.name == "top_100")
+    assert job.run()["시가총액"].tolist() == [5.0]
+    data_fetcher._market_frame.cache_clear()
+    data_fetcher.get_top_100_market_cap_stocks.cache_clear()
+
+
+
+def test_screener_table_job_rebuilds_and_reports_failures(monkeypatch):
+    import pandas as pd
+    import pytest
+
+    from app.services import data_fetcher, warmer
+    from app.services.cache import TTLCache, cached
+
+    builds = []
+
+    @cached(ttl=600, cache=TTLCache())
+    def _table(business_day):
+        builds.append(business_day)
+        if len(builds) > 2:
+            raise RuntimeError("panel unavailable")
+        return pd.DataFrame({"빌드": [len(builds)]})
+
+    monkeypatch.setattr(data_fetcher, "_latest_business_day", lambda: "20240614")
+    monkeypatch.setattr(data_fetcher, "_screener_table", _table)
+    assert data_fetcher.get_screener_table()["빌드"].tolist() == [1]
+
+    # 캐시가 신선해도 워머 작업은 표를 다시 만듭니다.
+    job = next(job for job in warmer.default_jobs() if job.name == "screener_table")
+    assert job.run()["빌드"].tolist() == [2]
+    assert data_fetcher.get_screener_table()["빌드"].tolist() == [2]
+
+    with pytest.raises(RuntimeError):
+        job.run()
+    assert data_fetcher.get_last_data_error("screener_table") == "panel unavailable"
+
+
+
+def test_market_panel_job_backfills_history_and_reports_failures(monkeypatch, tmp_path):
+    import pandas as pd
+    import pytest
+
+    from app.services import data_fetcher, warmer
+    from app.services.market_panel import MarketPanelStore
+
+    store = MarketPanelStore(tmp_path / "panel")
+    monkeypatch.setattr(data_fetcher, "_MARKET_PANEL", store)
+    sessions = pd.bdate_range("2024-06-03", "2024-06-07")
+    monkeypatch.setattr(data_fetcher, "_closed_sessions_since", lambda _start: sessions)
+    down = {"20240605"}
+
+    def _cross_section(date):
+        if date in down:
+            raise RuntimeError("KRX 응답 없음")
+        return pd.DataFrame({"종가": [100.0], "등락률": [0.0]}, index=pd.Index(["005930"], name="티커"))
+
+    monkeypatch.setattr(data_fetcher, "_fetch_market_cross_section", _cross_section)
+    job = next(job for job in warmer.default_jobs() if job.name == "market_panel")
+
+    with pytest.raises(RuntimeError, match="1 of 5 sessions"):
+        job.run()
+    assert len(store.stored_dates()) == 4
+
+    # 다음 실행은 빠진 날짜만 채우고 오류를 지웁니다.
+    down.clear()
+    assert job.run() == {"requested": 1, "ingested": 1, "holidays": 0, "failed": 0}
+    assert data_fetcher.get_last_data_error("market_panel") is None
+
+
+def test_index_store_resyncs_within_each_warm_cycle():
+    from datetime import datetime
+
+    from app.services import data_fetcher, warmer
+
+    job = next(job for job in warmer.default_jobs() if job.name == "market_indices")
+    intraday = datetime(2024, 6, 14, 10, 0)  # 금요일 장중
+    cadence = job.interval(intraday) - job.lead
+    assert data_fetcher._INDEX_STORE.refresh_interval < cadence
@@ -0,0 +1,37 @@
+from pathlib import Path
+import json
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def test_load_watchlist_from_file_and_fallback(tmp_path):
+    from app.services.watchlist import DEFAULT_WATCHLIST, chunked, load_watchlist
+
+    path = tmp_path / "watchlist.json"
+    path.write_text(
+        json.dumps(
+            {
+                "symbols": [
+                    {"label": "USD/KRW", "symbol": "KRW=X", "group": "fx"},
+                    {"symbol": "KRW=X"},
+                    {"symbol": "^TNX", "group": "rates"},
+                    {"label": "missing symbol"},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    watchlist = load_watchlist(path)
+    assert [(item.label, item.symbol, item.group) for item in watchlist] == [
+        ("USD/KRW", "KRW=X", "fx"),
+        ("^TNX", "^TNX", "rates"),
+    ]
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    assert load_watchlist(broken) == DEFAULT_WATCHLIST
+    assert len({item.symbol for item in DEFAULT_WATCHLIST}) == len(DEFAULT_WATCHLIST)
+    assert [len(chunk) for chunk in chunked(list(range(45)), 20)] == [20, 20, 5]
@@ -5,6 +5,19 @@ import streamlit as st
 
 from app.services import data_fetcher
 
+
+def _format_data_age(key: str) -> str:
+    age = data_fetcher.get_data_age(key)
+    if age is None:
+        return ""
+    minutes = int(age // 60)
+    if minutes < 1:
+        return "방금 수집"
+    if minutes < 60:
+        return f"{minutes}분 전 수집"
+    return f"{minutes // 60}시간 {minutes % 60}분 전 수집"
+
+
 # 메뉴 순서 지정을 위한 CSS 코드
 st.markdown(
     """
@@ -55,7 +68,8 @@ indices_error = data_fetcher.get_last_data_error("market_indices")
 
 if not market_indices_df.empty:
     latest_date = market_indices_df.index[-1]
-    st.caption(f"업데이트: {latest_date}")
+    indices_age = _format_data_age("market_indices")
+    st.caption(f"업데이트: {latest_date}" + (f" · {indices_age}" if indices_age else ""))
 
     latest_row = market_indices_df.iloc[-1]
     previous_row = market_indices_df.iloc[-2] if len(market_indices_df) > 1 else latest_row
@@ -110,6 +124,9 @@ if not sector_df.empty:
         hide_index=True,
         use_container_width=True,
     )
+    sector_age = _format_data_age("sector_performance::5")
+    if sector_age:
+        st.caption(sector_age)
     if sector_error:
         brief_error = sector_error.split(" (Caused", 1)[0]
         st.caption(f"⚠️ 섹터 데이터 조회 오류: {brief_error}")
@@ -118,6 +135,38 @@ else:
     if sector_error:
         st.caption(f"⚠️ 섹터 데이터 조회 오류: {sector_error}")
 
+with st.expander("전체 섹터 지수 순환 (1D · 1W · 1M)"):
+    # 펼침 여부와 관계없이 본문이 매번 실행되므로, 콜드 캐시에서 지수 패널 백필이 대시보드를 막지 않도록 요청 시에만 불러옵니다.
+    if st.session_state.get("show_sector_table") or st.button("섹터 지수 표 불러오기"):
+        st.session_state["show_sector_table"] = True
+        sector_table = data_fetcher.get_sector_table()
+    else:
+        sector_table = None
+    if sector_table is None:
+        st.caption("버튼을 누르면 전체 지수의 1D/1W/1M 수익률 표를 불러옵니다.")
+    elif not sector_table.empty:
+        market_filter = st.multiselect(
+            "시장", list(data_fetcher.SECTOR_INDEX_MARKETS), default=list(data_fetcher.SECTOR_INDEX_MARKETS)
+        )
+        sort_column = st.radio("정렬 기준", ["1D(%)", "1W(%)", "1M(%)"], horizontal=True)
+        view = sector_table[sector_table["시장"].isin(market_filter)].sort_values(sort_column, ascending=False)
+        st.dataframe(
+            view.style.format(
+                {"현재가": "{:,.2f}", "1D(%)": "{:+,.2f}", "1W(%)": "{:+,.2f}", "1M(%)": "{:+,.2f}"},
+                na_rep="-",
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+        table_age = _format_data_age("sector_table")
+        if table_age:
+            st.caption(table_age)
+    else:
+        st.info("섹터 지수 표를 불러오지 못했습니다.")
+        table_error = data_fetcher.get_last_data_error("sector_table")
+        if table_error:
+            st.caption(f"⚠️ 섹터 지수 조회 오류: {table_error}")
+
 # 3. 글로벌 선물 및 환율
 st.write("---")
 st.subheader("글로벌 선물 · 환율 스냅샷")
@@ -142,8 +191,53 @@ if global_snapshot:
                 else "변화 데이터 없음"
             )
             col.metric(label=item["label"], value=f"{price:,.2f}", delta=delta_text)
+    snapshot_age = _format_data_age("global_market_snapshot")
+    if snapshot_age:
+        st.caption(snapshot_age)
     if snapshot_error:
         brief_error = snapshot_error.split(" (Caused", 1)[0]
         st.caption(f"⚠️ 글로벌 데이터 조회 오류: {brief_error}")
 else:
     st.info("글로벌 선물 또는 환율 정보를 불러오지 못했습니다.")
+
+# 4. 글로벌 관심 종목 패널
+st.write("---")
+st.subheader("글로벌 마켓 패널")
+_GROUP_LABELS = {
+    "indices": "지수",
+    "futures": "선물",
+    "fx": "환율",
+    "rates": "금리",
+    "commodities": "원자재",
+    "crypto": "가상자산",
+}
+global_quotes = data_fetcher.get_global_quotes()
+quotes_error = data_fetcher.get_last_data_error("global_quotes")
+
+if not global_quotes.empty:
+    sparklines = data_fetcher.get_sparklines(global_quotes.index)
+    panel = global_quotes[["label", "group", "price", "change", "change_pct"]].copy()
+    panel["trend"] = [sparklines[symbol].tolist() if symbol in sparklines else [] for symbol in panel.index]
+    groups = [group for group in _GROUP_LABELS if group in set(panel["group"])]
+    groups += sorted(set(panel["group"]) - set(groups))
+    for tab, group in zip(st.tabs([_GROUP_LABELS.get(group, group) for group in groups]), groups):
+        with tab:
+            st.dataframe(
+                panel[panel["group"] == group].drop(columns="group"),
+                column_config={
+                    "label": "종목",
+                    "price": st.column_config.NumberColumn("현재가", format="%.2f"),
+                    "change": st.column_config.NumberColumn("변동", format="%+.2f"),
+                    "change_pct": st.column_config.NumberColumn("등락률(%)", format="%+.2f"),
+                    "trend": st.column_config.LineChartColumn("장중 추이"),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
+    quotes_age = _format_data_age("global_quotes")
+    if quotes_age:
+        st.caption(quotes_age)
+    if quotes_error:
+        st.caption(f"⚠️ 글로벌 시세 일부 조회 오류: {quotes_error.split(' (Caused', 1)[0]}")
+else:
+    st.info("글로벌 관심 종목 시세를 불러오지 못했습니다.")